@@ -7,17 +7,21 @@ from fastapi import FastAPI, File, UploadFile, Form, HTTPException, Depends, Que
 from fastapi.responses import JSONResponse, HTMLResponse
 from fastapi.middleware.cors import CORSMiddleware
 from fastapi.staticfiles import StaticFiles
-import tempfile
+import asyncio
+import json
 import os
+from concurrent.futures import ThreadPoolExecutor
 from typing import Optional, List
 import uvicorn
 import logging
 from pathlib import Path
-from pydantic import BaseModel
+from pydantic import BaseModel, Field
 
 # Import from our package
-from ats_resume_scorer.main import ATSResumeScorer
+from ats_resume_scorer.main import ATSResumeScorer, AsyncATSResumeScorer
+from ats_resume_scorer.parsers.extractors import registered_extensions, resolve_extractor
 from ats_resume_scorer.scoring.scoring_engine import ScoringWeights
+from ats_resume_scorer.utils.cache import LRUCache
 from ats_resume_scorer.utils.report_generator import LLMConfig, RecommendationLevel
 
 # Set up logging
@@ -44,6 +48,16 @@ app.add_middleware(
 # Global scorer instance
 scorer = None
 
+# Bounded pool for parsing and scoring, shared by all requests so CPU work
+# never runs on the event loop
+cpu_executor = ThreadPoolExecutor(
+    max_workers=int(os.getenv("ATS_API_WORKERS", "4")), thread_name_prefix="ats-score"
+)
+
+# Long-lived scorers per configuration, so requests reuse the parsed job
+# descriptions and TF-IDF vectors each scorer caches
+configured_scorers = LRUCache(maxsize=int(os.getenv("ATS_API_SCORER_CACHE", "8")))
+
 # Pydantic models for request/response
 class LLMConfigModel(BaseModel):
     enabled: bool = False
@@ -63,7 +77,8 @@ class BatchScoringRequest(BaseModel):
     recommendation_level: RecommendationLevel = "concise"
     llm_config: Optional[LLMConfigModel] = None
     custom_weights: Optional[dict] = None
-    max_workers: int = 4
+    # Resumes of this batch scored at once, within the shared CPU pool
+    max_workers: int = Field(4, ge=1)
 
 def get_scorer():
     """Dependency to get scorer instance"""
@@ -109,6 +124,26 @@ def create_scorer_with_config(
         llm_config=parsed_llm_config
     )
 
+def get_configured_scorer(
+    llm_config: Optional[LLMConfigModel] = None,
+    custom_weights: Optional[dict] = None
+) -> AsyncATSResumeScorer:
+    """Get the shared async scorer for a configuration, creating it on first use"""
+    key = (
+        llm_config.model_dump_json() if llm_config and llm_config.enabled else None,
+        json.dumps(custom_weights, sort_keys=True) if custom_weights else None,
+    )
+
+    def create() -> AsyncATSResumeScorer:
+        if key == (None, None):
+            configured = get_scorer()
+        else:
+            configured = create_scorer_with_config(llm_config, custom_weights)
+        # Not closed per request: other requests may be using its LLM clients
+        return AsyncATSResumeScorer(configured, executor=cpu_executor)
+
+    return configured_scorers.get_or_compute(key, create)
+
 @app.on_event("startup")
 async def startup_event():
     """Initialize scorer on startup"""
@@ -120,9 +155,20 @@ async def startup_event():
         logger.error(f"Failed to initialize scorer: {e}")
         raise
 
+@app.on_event("shutdown")
+async def shutdown_event():
+    """Close the configured scorers' LLM clients"""
+    for async_scorer in configured_scorers.values():
+        await async_scorer.aclose()
+    configured_scorers.clear()
+
 @app.get("/", response_class=HTMLResponse)
 async def root():
     """Enhanced web interface with LLM integration"""
+    # The file picker offers whatever formats the extractor registry handles
+    extensions = registered_extensions()
+    accept = ",".join(extensions)
+    supported_formats = ", ".join(ext.lstrip(".").upper() for ext in extensions)
     html_content = """
     <!DOCTYPE html>
     <html>
@@ -245,8 +291,8 @@ async def root():
             <form id="scoreForm" enctype="multipart/form-data">
                 <div class="form-group">
                     <label>📄 Resume File:</label>
-                    <input type="file" id="resume" name="resume" accept=".pdf,.docx,.txt" required>
-                    <small style="color: #666;">Supported formats: PDF, DOCX, TXT (max 10MB)</small>
+                    <input type="file" id="resume" name="resume" accept='""" + accept + """' required>
+                    <small style="color: #666;">Supported formats: """ + supported_formats + """ (max 10MB)</small>
                 </div>
                 
                 <div class="form-group">
@@ -501,16 +547,6 @@ async def score_resume(
             detail=f"Weights must sum to 1.0, got {total_weight:.3f}"
         )
     
-    # Validate file type
-    allowed_extensions = {'.pdf', '.docx', '.txt'}
-    file_extension = os.path.splitext(resume_file.filename)[1].lower()
-    
-    if file_extension not in allowed_extensions:
-        raise HTTPException(
-            status_code=400,
-            detail=f"Unsupported file type: {file_extension}. Allowed: {', '.join(allowed_extensions)}"
-        )
-    
     # Validate file size (10MB limit)
     if resume_file.size and resume_file.size > 10 * 1024 * 1024:
         raise HTTPException(
@@ -518,14 +554,20 @@ async def score_resume(
             detail="File size too large. Maximum size is 10MB."
         )
     
-    # Save uploaded file temporarily
-    with tempfile.NamedTemporaryFile(delete=False, suffix=file_extension) as tmp_file:
-        try:
-            content = await resume_file.read()
-            tmp_file.write(content)
-            tmp_file_path = tmp_file.name
-        except Exception as e:
-            raise HTTPException(status_code=400, detail=f"Error reading file: {str(e)}")
+    # Read the upload into memory; it is parsed without touching disk
+    try:
+        content = await resume_file.read()
+    except Exception as e:
+        raise HTTPException(status_code=400, detail=f"Error reading file: {str(e)}")
+    
+    # Validate file type from the content, falling back to the file name
+    try:
+        resolve_extractor(content, resume_file.filename)
+    except ValueError:
+        raise HTTPException(
+            status_code=400,
+            detail=f"Unsupported file type: {resume_file.filename}. Allowed: {', '.join(registered_extensions())}"
+        )
     
     try:
         # Create custom weights if different from defaults
@@ -566,8 +608,8 @@ async def score_resume(
             else:
                 logger.warning("LLM requested but no API key configured")
         
-        # Create scorer with configuration
-        scorer = create_scorer_with_config(
+        # Shared scorer for this configuration
+        async_scorer = get_configured_scorer(
             llm_config=LLMConfigModel(
                 enabled=llm_config.enabled if llm_config else False,
                 provider=llm_config.provider if llm_config else "openai",
@@ -586,8 +628,10 @@ async def score_resume(
             } if weights else None
         )
         
-        # Score resume
-        result = scorer.score_resume(tmp_file_path, job_description, recommendation_level)
+        # Score resume off the event loop
+        result = await async_scorer.ascore_resume_bytes(
+            content, resume_file.filename, job_description, recommendation_level
+        )
         
         return JSONResponse(content={
             "status": "success",
@@ -601,14 +645,6 @@ async def score_resume(
     except Exception as e:
         logger.error(f"Error processing resume {resume_file.filename}: {str(e)}")
         raise HTTPException(status_code=500, detail=f"Error processing resume: {str(e)}")
-    
-    finally:
-        # Clean up temporary file
-        if os.path.exists(tmp_file_path):
-            try:
-                os.unlink(tmp_file_path)
-            except:
-                pass  # Ignore cleanup errors
 
 @app.post("/batch-score/")
 async def batch_score_resumes(
@@ -625,74 +661,76 @@ async def batch_score_resumes(
         )
     
     # Validate all files first
-    temp_files = []
+    uploads = []
     try:
         for resume_file in resume_files:
-            # Validate file type
-            allowed_extensions = {'.pdf', '.docx', '.txt'}
-            file_extension = os.path.splitext(resume_file.filename)[1].lower()
-            
-            if file_extension not in allowed_extensions:
+            # Validate file size
+            if resume_file.size and resume_file.size > 10 * 1024 * 1024:
                 raise HTTPException(
                     status_code=400,
-                    detail=f"Unsupported file type in {resume_file.filename}: {file_extension}"
+                    detail=f"File size too large: {resume_file.filename}. Maximum size is 10MB."
                 )
             
-            # Validate file size
-            if resume_file.size and resume_file.size > 10 * 1024 * 1024:
+            # Keep the contents in memory; they are parsed without touching disk
+            content = await resume_file.read()
+            
+            # Validate file type from the content, falling back to the file name
+            try:
+                resolve_extractor(content, resume_file.filename)
+            except ValueError:
                 raise HTTPException(
                     status_code=400,
-                    detail=f"File size too large: {resume_file.filename}. Maximum size is 10MB."
+                    detail=f"Unsupported file type in {resume_file.filename}"
                 )
             
-            # Save temporarily
-            with tempfile.NamedTemporaryFile(delete=False, suffix=file_extension) as tmp_file:
-                content = await resume_file.read()
-                tmp_file.write(content)
-                temp_files.append({
-                    'path': tmp_file.name,
-                    'original_name': resume_file.filename,
-                    'size': resume_file.size
-                })
+            uploads.append({
+                'content': content,
+                'original_name': resume_file.filename,
+                'size': resume_file.size
+            })
         
-        # Create scorer with configuration
-        scorer = create_scorer_with_config(
+        # Shared scorer for this configuration
+        async_scorer = get_configured_scorer(
             llm_config=request.llm_config,
             custom_weights=request.custom_weights
         )
         
-        # Process files
-        file_paths = [f['path'] for f in temp_files]
-        results = scorer.batch_score_resumes(
-            file_paths,
-            request.job_description,
-            request.recommendation_level,
-            request.max_workers
-        )
+        # Process files off the event loop, at most max_workers at a time; the
+        # job description is parsed once and reused from the scorer's cache
+        slots = asyncio.Semaphore(request.max_workers)
         
-        # Format results with original filenames
-        formatted_results = []
-        for i, result in enumerate(results):
-            original_file = temp_files[i]
-            if result['success']:
-                formatted_results.append({
-                    "filename": original_file['original_name'],
-                    "file_size": original_file['size'],
-                    "success": True,
-                    "score": result['result']['overall_score'],
-                    "grade": result['result']['grade'],
-                    "ats_status": result['result']['ats_compatibility']['status'],
-                    "llm_enhanced": result['result'].get('llm_enhanced', False),
-                    "top_recommendations": result['result']['recommendations'][:3],
-                    "result": result['result']
-                })
-            else:
-                formatted_results.append({
-                    "filename": original_file['original_name'],
-                    "file_size": original_file['size'],
+        async def score_upload(upload):
+            try:
+                async with slots:
+                    result = await async_scorer.ascore_resume_bytes(
+                        upload['content'],
+                        upload['original_name'],
+                        request.job_description,
+                        request.recommendation_level
+                    )
+            except Exception as e:
+                logger.error(f"Error processing {upload['original_name']}: {e}")
+                return {
+                    "filename": upload['original_name'],
+                    "file_size": upload['size'],
                     "success": False,
-                    "error": result['error']
-                })
+                    "error": str(e)
+                }
+            return {
+                "filename": upload['original_name'],
+                "file_size": upload['size'],
+                "success": True,
+                "score": result['overall_score'],
+                "grade": result['grade'],
+                "ats_status": result['ats_compatibility']['status'],
+                "llm_enhanced": result.get('llm_enhanced', False),
+                "top_recommendations": result['recommendations'][:3],
+                "result": result
+            }
+        
+        formatted_results = await asyncio.gather(
+            *(score_upload(upload) for upload in uploads)
+        )
         
         # Sort by score (highest first)
         successful_results = [r for r in formatted_results if r['success']]
@@ -709,18 +747,11 @@ async def batch_score_resumes(
             "results": successful_results + failed_results
         })
         
+    except HTTPException:
+        raise
     except Exception as e:
         logger.error(f"Error in batch processing: {str(e)}")
         raise HTTPException(status_code=500, detail=f"Error in batch processing: {str(e)}")
-    
-    finally:
-        # Clean up temporary files
-        for temp_file in temp_files:
-            try:
-                if os.path.exists(temp_file['path']):
-                    os.unlink(temp_file['path'])
-            except:
-                pass
 
 @app.get("/health")
 async def health_check():
@@ -746,7 +777,7 @@ async def health_check():
                 "recommendation_levels": ["concise", "normal", "detailed"],
                 "batch_processing": True,
                 "custom_weights": True,
-                "supported_formats": [".pdf", ".docx", ".txt"]
+                "supported_formats": registered_extensions()
             }
         }
     except Exception as e:
@@ -777,7 +808,7 @@ async def api_info():
             "/docs": "GET - API documentation (Swagger)",
             "/redoc": "GET - API documentation (ReDoc)"
         },
-        "supported_formats": [".pdf", ".docx", ".txt"],
+        "supported_formats": registered_extensions(),
         "max_file_size": "10MB",
         "batch_limit": 20,
         "scoring_categories": [
@@ -11,7 +11,7 @@ __author__ = "Kumar Abhishek"
 __email__ = "developer@kabhishek18.com"
 
 # Core imports
-from .main import ATSResumeScorer, ScoringWeights
+from .main import ATSResumeScorer, AsyncATSResumeScorer, ScoringWeights
 from .parsers.resume_parser import (
     ResumeParser,
     ResumeData,
@@ -26,6 +26,7 @@ from .utils.report_generator import ReportGenerator
 # Make main classes available at package level
 __all__ = [
     "ATSResumeScorer",
+    "AsyncATSResumeScorer",
     "ScoringWeights",
     "ResumeParser",
     "ResumeData",
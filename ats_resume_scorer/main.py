@@ -4,17 +4,46 @@ Enhanced Main ATS Resume Scorer Module with LLM Integration and Multiple Recomme
 """
 
 import argparse
+import asyncio
+import functools
+import heapq
 import json
 import sys
 import logging
 import os
+from concurrent.futures import (
+    FIRST_COMPLETED,
+    Executor,
+    ProcessPoolExecutor,
+    ThreadPoolExecutor,
+    wait,
+)
 from pathlib import Path
-from typing import Dict, Any, Optional, Literal, List
+from typing import (
+    Any,
+    Callable,
+    Dict,
+    Iterable,
+    Iterator,
+    List,
+    Literal,
+    Optional,
+    Tuple,
+    TypeVar,
+    Union,
+)
 
-from .parsers.resume_parser import ResumeParser, ResumeData
+from .parsers.extractors import PARALLEL_PAGE_THRESHOLD, ExtractionLimits
+from .parsers.resume_parser import PARSER_VERSION, ResumeParser, ResumeData
 from .parsers.jd_parser import JobDescriptionParser, JobDescription
+from .parsers.skill_index import SkillIndex
 from .scoring.scoring_engine import ATSScoringEngine, ScoringWeights
+from .scoring.parsed_job import JobLike, ParsedJob, job_description_of
 from .utils.report_generator import ReportGenerator, LLMConfig, RecommendationLevel
+from .utils.cache import LRUCache, ResumeCache, content_hash
+from .utils.job_index import IngestStats, JobIndex
+
+T = TypeVar("T")
 
 # Set up logging
 logging.basicConfig(
@@ -31,6 +60,12 @@ class ATSResumeScorer:
         weights: Optional[ScoringWeights] = None,
         skills_db_path: Optional[str] = None,
         llm_config: Optional[LLMConfig] = None,
+        jd_cache_size: int = 128,
+        resume_cache_size: int = 256,
+        resume_cache_dir: Optional[str] = None,
+        tfidf_mode: str = "pair",
+        vectorizer_path: Optional[str] = None,
+        extraction_limits: Optional[ExtractionLimits] = None,
     ):
         """
         Initialize the ATS Resume Scorer
@@ -39,16 +74,53 @@ class ATSResumeScorer:
             weights: Custom scoring weights (optional)
             skills_db_path: Path to custom skills database (optional)
             llm_config: Configuration for LLM integration (optional)
+            jd_cache_size: Number of parsed job descriptions kept in memory
+            resume_cache_size: Number of parsed resumes kept in memory
+            resume_cache_dir: Directory for the persistent parsed-resume cache (optional)
+            tfidf_mode: TF-IDF fitting strategy: "pair", "jd" or "corpus"
+            vectorizer_path: Saved corpus vectorizer to load (optional)
+            extraction_limits: Page, character and time budgets per resume (optional)
         """
         self.weights = weights or ScoringWeights()
-        self.resume_parser = ResumeParser(skills_db_path)
+        self.skills_db_path = skills_db_path
+        self.resume_parser = ResumeParser(skills_db_path, limits=extraction_limits)
         self.jd_parser = JobDescriptionParser()
-        self.scoring_engine = ATSScoringEngine(self.weights)
+        parser_skill_index = SkillIndex(self.resume_parser.skills_db)
+        self.scoring_engine = ATSScoringEngine(
+            self.weights,
+            tfidf_mode=tfidf_mode,
+            vectorizer_path=vectorizer_path,
+            # A custom skills database also defines the canonical skills
+            skill_index=parser_skill_index if skills_db_path else None,
+        )
+        self.jd_cache = LRUCache(maxsize=jd_cache_size)
+        self.resume_cache = ResumeCache(
+            maxsize=resume_cache_size,
+            cache_dir=resume_cache_dir,
+            # Layout extraction yields different text, so it must not share entries
+            parser_version=PARSER_VERSION
+            + ("-layout" if self.resume_parser.limits.layout else ""),
+            # Extracted skills depend on the database, so scorers must not share them
+            skills_fingerprint=parser_skill_index.fingerprint,
+        )
         
         # Initialize report generator with LLM config
         self.llm_config = llm_config or self._load_llm_config_from_env()
         self.report_generator = ReportGenerator(self.llm_config)
 
+        # Everything a worker process needs to build an equivalent scorer
+        self._worker_config = {
+            "weights": self.weights,
+            "skills_db_path": skills_db_path,
+            "llm_config": self.llm_config,
+            "jd_cache_size": jd_cache_size,
+            "resume_cache_size": resume_cache_size,
+            "resume_cache_dir": resume_cache_dir,
+            "tfidf_mode": tfidf_mode,
+            "vectorizer_path": vectorizer_path,
+            "extraction_limits": extraction_limits,
+        }
+
         logger.info("ATS Resume Scorer initialized successfully")
         if self.llm_config.enabled:
             logger.info(f"LLM integration enabled with provider: {self.llm_config.provider}")
@@ -73,10 +145,114 @@ class ATSResumeScorer:
             temperature=float(os.getenv("ATS_LLM_TEMPERATURE", "0.7")),
         )
 
+    def parse_resume(self, resume_path: str) -> ResumeData:
+        """
+        Parse a resume file, reusing cached results for identical file contents
+
+        Args:
+            resume_path: Path to the resume file
+
+        Returns:
+            Parsed resume data
+        """
+        path = Path(resume_path)
+        if not path.exists():
+            raise FileNotFoundError(f"Resume file not found: {path}")
+
+        # The bytes read for the cache key are parsed directly; no second read
+        return self.parse_resume_bytes(path.read_bytes(), path.name)
+
+    def parse_resume_bytes(
+        self, data: Union[bytes, memoryview], filename_or_mime: str
+    ) -> ResumeData:
+        """
+        Parse an in-memory resume, reusing cached results for identical contents
+
+        Args:
+            data: Raw resume file contents
+            filename_or_mime: Original file name or MIME type of the contents
+
+        Returns:
+            Parsed resume data
+        """
+        key = self.resume_cache.key_for(data)
+        resume_data = self.resume_cache.get(key)
+        if resume_data is None:
+            resume_data = self.resume_parser.parse_resume_bytes(data, filename_or_mime)
+            # Time-budget truncation depends on load, so never cache partial results
+            if not resume_data.truncated:
+                self.resume_cache.put(key, resume_data)
+        return resume_data
+
+    def cache_stats(self) -> Dict[str, Any]:
+        """Return hit-rate statistics for the job description and resume caches"""
+        return {
+            "job_descriptions": self.jd_cache.stats(),
+            "resumes": self.resume_cache.stats(),
+        }
+
+    def parse_job_description(self, job_description_text: str) -> JobDescription:
+        """
+        Parse a job description, reusing a cached result for identical text
+
+        Args:
+            job_description_text: Job description text
+
+        Returns:
+            Parsed job description
+        """
+        key = content_hash(job_description_text)
+        job_description = self.jd_cache.get(key)
+        if job_description is None:
+            logger.info("Parsing job description")
+            job_description = self.jd_parser.parse_job_description(job_description_text)
+            self.jd_cache.put(key, job_description)
+        return job_description
+
+    def compile_job(self, job_description_text: str) -> ParsedJob:
+        """
+        Parse a job description and precompute its scoring features
+
+        Args:
+            job_description_text: Job description text
+
+        Returns:
+            Parsed job, ready to store with ParsedJob.save and to score against
+        """
+        job_description = self.parse_job_description(job_description_text)
+        return self.scoring_engine.compile_job(job_description)
+
+    def ingest_jobs(
+        self,
+        source: str,
+        index_dir: str,
+        max_workers: Optional[int] = None,
+        **reader_options: Any,
+    ) -> IngestStats:
+        """
+        Compile a corpus of job postings into a job index, incrementally
+
+        Args:
+            source: Directory of postings, or a .jsonl or .csv file of them
+            index_dir: Job index directory, created if missing
+            max_workers: Worker processes for large batches (default: CPU count)
+            **reader_options: text_field, title_field and id_field for JSONL/CSV records
+
+        Returns:
+            Counts of files read and postings compiled or reused
+        """
+        compiler_config = {
+            # A custom skills database also defines the canonical skills
+            "skills_db": self.resume_parser.skills_db if self.skills_db_path else None,
+            "tfidf_mode": self._worker_config["tfidf_mode"],
+            "vectorizer_path": self._worker_config["vectorizer_path"],
+        }
+        return JobIndex(index_dir).ingest(source, compiler_config, max_workers, **reader_options)
+
     def score_resume(
         self, 
         resume_path: str, 
-        job_description_text: str,
+        job_description_text: Union[str, ParsedJob],
         recommendation_level: RecommendationLevel = "normal"
     ) -> Dict[str, Any]:
         """
@@ -84,7 +260,7 @@ class ATSResumeScorer:
 
         Args:
             resume_path: Path to the resume file
-            job_description_text: Job description text
+            job_description_text: Job description text, or a parsed job (see compile_job)
             recommendation_level: Level of detail for recommendations ("concise", "normal", "detailed")
 
         Returns:
@@ -93,33 +269,56 @@ class ATSResumeScorer:
         try:
             # Step 1: Parse resume
             logger.info(f"Parsing resume: {resume_path}")
-            resume_data = self.resume_parser.parse_resume(resume_path)
-
-            # Step 2: Parse job description
-            logger.info("Parsing job description")
-            job_description = self.jd_parser.parse_job_description(job_description_text)
-
-            # Step 3: Calculate scores
-            logger.info("Calculating ATS scores")
-            scoring_results = self.scoring_engine.calculate_overall_score(
-                resume_data, job_description
-            )
+            resume_data = self.parse_resume(resume_path)
 
-            # Step 4: Generate comprehensive report with specified recommendation level
-            logger.info(f"Generating comprehensive report (level: {recommendation_level})")
-            report = self.report_generator.generate_comprehensive_report(
-                resume_data, job_description, scoring_results, recommendation_level
-            )
+            # Step 2: Parse job description (cached by content hash) unless precompiled
+            if isinstance(job_description_text, ParsedJob):
+                job_description = job_description_text
+            else:
+                job_description = self.parse_job_description(job_description_text)
 
-            logger.info(
-                f"Scoring completed. Overall score: {report['overall_score']}/100"
+            return self.score_resume_against(
+                resume_data, job_description, recommendation_level
             )
-            return report
 
         except Exception as e:
             logger.error(f"Error during scoring process: {str(e)}")
             raise
 
+    def score_resume_against(
+        self,
+        resume_data: ResumeData,
+        parsed_jd: JobLike,
+        recommendation_level: RecommendationLevel = "normal"
+    ) -> Dict[str, Any]:
+        """
+        Score already parsed resume data against an already parsed job description
+
+        Args:
+            resume_data: Parsed resume
+            parsed_jd: Parsed job description or parsed job (see compile_job)
+            recommendation_level: Level of detail for recommendations
+
+        Returns:
+            Comprehensive scoring report dictionary
+        """
+        # Step 3: Calculate scores
+        logger.info("Calculating ATS scores")
+        scoring_results = self.scoring_engine.calculate_overall_score(
+            resume_data, parsed_jd
+        )
+
+        # Step 4: Generate comprehensive report with specified recommendation level
+        logger.info(f"Generating comprehensive report (level: {recommendation_level})")
+        report = self.report_generator.generate_comprehensive_report(
+            resume_data, job_description_of(parsed_jd), scoring_results, recommendation_level
+        )
+
+        logger.info(
+            f"Scoring completed. Overall score: {report['overall_score']}/100"
+        )
+        return report
+
     def score_resume_from_files(
         self, 
         resume_path: str, 
@@ -212,60 +411,475 @@ class ATSResumeScorer:
         resume_paths: List[str],
         job_description_text: str,
         recommendation_level: RecommendationLevel = "concise",
-        max_workers: int = 4
+        max_workers: int = 4,
+        executor: Literal["thread", "process"] = "thread",
+        compact: bool = True,
     ) -> List[Dict[str, Any]]:
         """
         Score multiple resumes in batch
 
+        With ``executor="process"`` each worker process builds one scorer and
+        parses the job description once in its initializer; tasks carry only
+        the resume path and the JD hash. Workers skip report generation and
+        send back a compact result (overall score, grade and breakdown,
+        flagged ``"compact": True``) unless ``compact`` is False; expand the
+        ones you need with expand_result. Use it for CPU-bound batches, where
+        threads are serialized by the GIL.
+
         Args:
             resume_paths: List of resume file paths
             job_description_text: Job description text
             recommendation_level: Level of recommendations (usually "concise" for batch)
             max_workers: Maximum number of parallel workers
+            executor: "thread" (default) or "process"
+            compact: Return compact results from process workers (default True)
 
         Returns:
             List of scoring results
         """
-        from concurrent.futures import ThreadPoolExecutor, as_completed
-        
-        results = []
-        
-        def score_single_resume(resume_path):
+        results = self.iter_score_resumes(
+            resume_paths,
+            job_description_text,
+            recommendation_level,
+            max_workers=max_workers,
+            executor=executor,
+            compact=compact,
+        )
+        return _rank_batch_results(results)
+
+    def iter_score_resumes(
+        self,
+        resume_paths: Iterable[str],
+        job_description_text: str,
+        recommendation_level: RecommendationLevel = "concise",
+        max_workers: int = 4,
+        executor: Literal["thread", "process"] = "thread",
+        max_in_flight: Optional[int] = None,
+        compact: bool = True,
+    ) -> Iterator[Dict[str, Any]]:
+        """
+        Score resumes and yield each result as soon as it completes
+
+        At most ``max_in_flight`` resumes are queued or running at once, and
+        new work is only submitted when the caller asks for the next result,
+        so a slow consumer throttles the pool and memory stays bounded no
+        matter how many paths (which may be a lazy iterator) are supplied.
+
+        Args:
+            resume_paths: Resume file paths, consumed lazily
+            job_description_text: Job description text
+            recommendation_level: Level of recommendations (usually "concise" for batch)
+            max_workers: Maximum number of parallel workers
+            executor: "thread" (default) or "process"
+            max_in_flight: Maximum submitted but unconsumed resumes (default 2 x workers)
+            compact: Return compact results from process workers (default True)
+
+        Yields:
+            Result entries in completion order, shaped as in batch_score_resumes
+        """
+        max_in_flight = max_in_flight or max_workers * 2
+        pool, task, task_args = self._batch_pool(
+            job_description_text, recommendation_level, max_workers, executor, compact
+        )
+        paths = iter(resume_paths)
+
+        with pool:
+            pending = {}
+
+            def submit_next() -> bool:
+                path = next(paths, None)
+                if path is None:
+                    return False
+                pending[pool.submit(task, path, *task_args)] = path
+                return True
+
+            while len(pending) < max_in_flight and submit_next():
+                pass
+
+            while pending:
+                done, _ = wait(pending, return_when=FIRST_COMPLETED)
+                for future in done:
+                    resume_path = pending.pop(future)
+                    try:
+                        result = {
+                            "file_path": resume_path,
+                            "file_name": Path(resume_path).name,
+                            "success": True,
+                            "result": future.result()
+                        }
+                        logger.info(f"✅ Scored {result['file_name']}: {result['result']['overall_score']:.1f}/100")
+                    except Exception as e:
+                        result = {
+                            "file_path": resume_path,
+                            "file_name": Path(resume_path).name,
+                            "success": False,
+                            "error": str(e)
+                        }
+                        logger.error(f"❌ Failed {result['file_name']}: {result['error']}")
+
+                    yield result
+                    submit_next()
+
+    def top_k_score_resumes(
+        self,
+        resume_paths: Iterable[str],
+        job_description_text: str,
+        k: int = 10,
+        recommendation_level: RecommendationLevel = "concise",
+        max_workers: int = 4,
+        executor: Literal["thread", "process"] = "thread",
+        max_in_flight: Optional[int] = None,
+    ) -> List[Dict[str, Any]]:
+        """
+        Score resumes and keep only the K best reports in memory
+
+        Process workers return compact results; only the K winners are
+        expanded into full reports, here in the calling process.
+
+        Args:
+            resume_paths: Resume file paths, consumed lazily
+            job_description_text: Job description text
+            k: Number of top results to keep
+            recommendation_level: Level of recommendations (usually "concise" for batch)
+            max_workers: Maximum number of parallel workers
+            executor: "thread" (default) or "process"
+            max_in_flight: Maximum submitted but unconsumed resumes (default 2 x workers)
+
+        Returns:
+            The K highest-scoring successful results, best first
+        """
+        # Min-heap of (score, sequence, result); the sequence breaks score ties
+        heap: List[Tuple[float, int, Dict[str, Any]]] = []
+        failures = 0
+
+        for sequence, result in enumerate(
+            self.iter_score_resumes(
+                resume_paths,
+                job_description_text,
+                recommendation_level,
+                max_workers=max_workers,
+                executor=executor,
+                max_in_flight=max_in_flight,
+            )
+        ):
+            if not result["success"]:
+                failures += 1
+                continue
+            item = (result["result"]["overall_score"], -sequence, result)
+            if len(heap) < k:
+                heapq.heappush(heap, item)
+            elif item[:2] > heap[0][:2]:
+                heapq.heapreplace(heap, item)
+
+        if failures:
+            logger.warning(f"{failures} resumes failed to score")
+        return [
+            self.expand_result(result, job_description_text, recommendation_level)
+            for _, _, result in sorted(heap, key=lambda x: x[:2], reverse=True)
+        ]
+
+    def expand_result(
+        self,
+        entry: Dict[str, Any],
+        job_description_text: Union[str, ParsedJob],
+        recommendation_level: RecommendationLevel = "concise",
+    ) -> Dict[str, Any]:
+        """
+        Replace a compact batch result with the full report
+
+        The resume is parsed again (a cache hit when the resume cache is
+        enabled) and scored in this process; full and failed entries are
+        returned unchanged.
+
+        Args:
+            entry: Batch result entry from batch_score_resumes or iter_score_resumes
+            job_description_text: The batch's job description text, or its parsed job
+            recommendation_level: Level of detail for recommendations
+
+        Returns:
+            The entry with its full report
+        """
+        if not entry["success"] or not entry["result"].get("compact"):
+            return entry
+        job = (
+            job_description_text
+            if isinstance(job_description_text, ParsedJob)
+            else self.compile_job(job_description_text)
+        )
+        resume_data = self.parse_resume(entry["file_path"])
+        return dict(
+            entry, result=self.score_resume_against(resume_data, job, recommendation_level)
+        )
+
+    def _batch_pool(
+        self,
+        job_description_text: str,
+        recommendation_level: RecommendationLevel,
+        max_workers: int,
+        executor: str,
+        compact: bool = True,
+    ) -> Tuple[Any, Callable[..., Dict[str, Any]], Tuple[Any, ...]]:
+        """Create the executor and task function for a batch run"""
+        if executor == "thread":
+            # Parse the job description and its scoring features once for the whole batch
+            job_description = self.compile_job(job_description_text)
+
+            def score_single_resume(resume_path):
+                resume_data = self.parse_resume(resume_path)
+                return self.score_resume_against(
+                    resume_data, job_description, recommendation_level
+                )
+
+            return ThreadPoolExecutor(max_workers=max_workers), score_single_resume, ()
+
+        if executor == "process":
+            pool = ProcessPoolExecutor(
+                max_workers=max_workers,
+                initializer=_init_batch_worker,
+                initargs=(
+                    self._worker_config, job_description_text, recommendation_level, compact
+                ),
+            )
+            return pool, _score_in_batch_worker, (content_hash(job_description_text),)
+
+        raise ValueError(f"Unknown executor: {executor}")
+
+
+class AsyncATSResumeScorer:
+    """Asyncio front end for ATSResumeScorer
+
+    Parsing and scoring run on a bounded executor so the event loop stays
+    free for other requests; LLM enhancement uses the providers' async
+    clients. Pass a shared ``executor`` to bound CPU work across scorers.
+    """
+
+    def __init__(
+        self,
+        scorer: Optional[ATSResumeScorer] = None,
+        executor: Optional[Executor] = None,
+        max_workers: int = 4,
+    ):
+        """
+        Initialize the async scorer
+
+        Args:
+            scorer: Scorer to wrap (a default ATSResumeScorer if omitted)
+            executor: Executor for CPU-bound work (optional, shared across scorers)
+            max_workers: Size of the executor created when none is given
+        """
+        self.scorer = scorer or ATSResumeScorer()
+        self._owns_executor = executor is None
+        self.executor = executor or ThreadPoolExecutor(
+            max_workers=max_workers, thread_name_prefix="ats-score"
+        )
+
+    async def __aenter__(self) -> "AsyncATSResumeScorer":
+        return self
+
+    async def __aexit__(self, *exc_info) -> None:
+        await self.aclose()
+
+    async def aclose(self) -> None:
+        """Close async LLM clients and the executor, if this scorer created it"""
+        llm_engine = self.scorer.report_generator.llm_engine
+        if llm_engine is not None:
+            await llm_engine.aclose()
+        if self._owns_executor:
+            self.executor.shutdown(wait=False)
+
+    async def _run(self, func: Callable[..., T], *args: Any) -> T:
+        """Run a blocking call on the executor"""
+        loop = asyncio.get_running_loop()
+        return await loop.run_in_executor(self.executor, functools.partial(func, *args))
+
+    async def ascore_resume(
+        self,
+        resume_path: str,
+        job_description_text: str,
+        recommendation_level: RecommendationLevel = "normal",
+    ) -> Dict[str, Any]:
+        """
+        Score a resume against a job description without blocking the event loop
+
+        Args:
+            resume_path: Path to the resume file
+            job_description_text: Job description text
+            recommendation_level: Level of detail for recommendations
+
+        Returns:
+            Comprehensive scoring report dictionary
+        """
+        job_description = await self._run(
+            self.scorer.parse_job_description, job_description_text
+        )
+        return await self._ascore_against(
+            functools.partial(self.scorer.parse_resume, resume_path),
+            job_description,
+            recommendation_level,
+        )
+
+    async def ascore_resume_bytes(
+        self,
+        data: Union[bytes, memoryview],
+        filename_or_mime: str,
+        job_description_text: str,
+        recommendation_level: RecommendationLevel = "normal",
+    ) -> Dict[str, Any]:
+        """
+        Score an in-memory resume (e.g. an upload) without blocking the event loop
+
+        Args:
+            data: Raw resume file contents
+            filename_or_mime: Original file name or MIME type of the contents
+            job_description_text: Job description text
+            recommendation_level: Level of detail for recommendations
+
+        Returns:
+            Comprehensive scoring report dictionary
+        """
+        job_description = await self._run(
+            self.scorer.parse_job_description, job_description_text
+        )
+        return await self._ascore_against(
+            functools.partial(self.scorer.parse_resume_bytes, data, filename_or_mime),
+            job_description,
+            recommendation_level,
+        )
+
+    async def abatch_score_resumes(
+        self,
+        resume_paths: List[str],
+        job_description_text: str,
+        recommendation_level: RecommendationLevel = "concise",
+    ) -> List[Dict[str, Any]]:
+        """
+        Score multiple resumes concurrently, bounded by the executor
+
+        Args:
+            resume_paths: List of resume file paths
+            job_description_text: Job description text
+            recommendation_level: Level of recommendations (usually "concise" for batch)
+
+        Returns:
+            List of scoring results, shaped and sorted as in batch_score_resumes
+        """
+        job_description = await self._run(self.scorer.compile_job, job_description_text)
+
+        async def score_single_resume(resume_path: str) -> Dict[str, Any]:
             try:
-                result = self.score_resume(resume_path, job_description_text, recommendation_level)
                 return {
                     "file_path": resume_path,
                     "file_name": Path(resume_path).name,
                     "success": True,
-                    "result": result
+                    "result": await self._ascore_against(
+                        functools.partial(self.scorer.parse_resume, resume_path),
+                        job_description,
+                        recommendation_level,
+                    )
                 }
             except Exception as e:
+                logger.error(f"❌ Failed {Path(resume_path).name}: {e}")
                 return {
                     "file_path": resume_path,
                     "file_name": Path(resume_path).name,
                     "success": False,
                     "error": str(e)
                 }
-        
-        with ThreadPoolExecutor(max_workers=max_workers) as executor:
-            future_to_path = {executor.submit(score_single_resume, path): path for path in resume_paths}
-            
-            for future in as_completed(future_to_path):
-                result = future.result()
-                results.append(result)
-                
-                if result["success"]:
-                    logger.info(f"✅ Scored {result['file_name']}: {result['result']['overall_score']:.1f}/100")
-                else:
-                    logger.error(f"❌ Failed {result['file_name']}: {result['error']}")
-        
-        # Sort by score (highest first)
-        successful_results = [r for r in results if r["success"]]
-        failed_results = [r for r in results if not r["success"]]
-        
-        successful_results.sort(key=lambda x: x["result"]["overall_score"], reverse=True)
-        
-        return successful_results + failed_results
+
+        results = await asyncio.gather(
+            *(score_single_resume(path) for path in resume_paths)
+        )
+        return _rank_batch_results(results)
+
+    async def _ascore_against(
+        self,
+        load_resume: Callable[[], ResumeData],
+        job_description: JobLike,
+        recommendation_level: RecommendationLevel,
+    ) -> Dict[str, Any]:
+        """Parse and score one resume on the executor, then build its report"""
+        scorer = self.scorer
+        if not scorer.llm_config.enabled:
+            # No network work: one executor hop covers everything
+            return await self._run(
+                _load_and_score, scorer, load_resume, job_description, recommendation_level
+            )
+
+        resume_data = await self._run(load_resume)
+        scoring_results = await self._run(
+            scorer.scoring_engine.calculate_overall_score, resume_data, job_description
+        )
+        return await scorer.report_generator.agenerate_comprehensive_report(
+            resume_data, job_description_of(job_description), scoring_results, recommendation_level
+        )
+
+
+def _load_and_score(
+    scorer: ATSResumeScorer,
+    load_resume: Callable[[], ResumeData],
+    job_description: JobLike,
+    recommendation_level: RecommendationLevel,
+) -> Dict[str, Any]:
+    """Parse a resume and score it against a parsed job description"""
+    resume_data = load_resume()
+    return scorer.score_resume_against(resume_data, job_description, recommendation_level)
+
+
+def _rank_batch_results(results: Iterable[Dict[str, Any]]) -> List[Dict[str, Any]]:
+    """Order batch results by score (highest first), failures last"""
+    successful_results = []
+    failed_results = []
+    for result in results:
+        (successful_results if result["success"] else failed_results).append(result)
+
+    successful_results.sort(key=lambda x: x["result"]["overall_score"], reverse=True)
+    return successful_results + failed_results
+
+
+# Per-process state for batch_score_resumes(executor="process")
+_worker_scorer: Optional[ATSResumeScorer] = None
+_worker_jobs: Dict[str, ParsedJob] = {}
+_worker_level: RecommendationLevel = "concise"
+_worker_compact = True
+
+
+def _init_batch_worker(
+    scorer_config: Dict[str, Any],
+    job_description_text: str,
+    recommendation_level: RecommendationLevel,
+    compact: bool = True,
+) -> None:
+    """Build this process's scorer and compile the batch's job description once"""
+    global _worker_scorer, _worker_level, _worker_compact
+    _worker_scorer = ATSResumeScorer(**scorer_config)
+    _worker_level = recommendation_level
+    _worker_compact = compact
+    _worker_jobs[content_hash(job_description_text)] = (
+        _worker_scorer.compile_job(job_description_text)
+    )
+
+
+def _score_in_batch_worker(resume_path: str, jd_hash: str) -> Dict[str, Any]:
+    """Score one resume in a worker process against a pre-parsed job description
+
+    Compact results skip report generation and keep the pickled reply small.
+    """
+    resume_data = _worker_scorer.parse_resume(resume_path)
+    if not _worker_compact:
+        return _worker_scorer.score_resume_against(
+            resume_data, _worker_jobs[jd_hash], _worker_level
+        )
+    scoring_results = _worker_scorer.scoring_engine.calculate_overall_score(
+        resume_data, _worker_jobs[jd_hash]
+    )
+    return {
+        "overall_score": scoring_results["total_score"],
+        "grade": _worker_scorer.report_generator.calculate_grade(
+            scoring_results["total_score"]
+        ),
+        "detailed_breakdown": scoring_results["detailed_scores"],
+        "compact": True,
+    }
 
 
 def load_custom_weights(weights_path: str) -> ScoringWeights:
@@ -324,15 +938,37 @@ Examples:
   
   # Create sample LLM config
   ats-score --create-llm-config
+
+  # Compile a corpus of postings (directory, .jsonl or .csv), then score against one
+  ats-score --ingest-jobs postings.jsonl --job-index job_index
+  ats-score --resume resume.pdf --job-index job_index --job-id 1042
         """,
     )
 
     parser.add_argument(
-        "--resume", "-r", help="Path to resume file (.pdf, .docx, .txt)"
+        "--resume", "-r", help="Path to resume file (.pdf, .docx, .odt, .rtf, .html, .txt)"
     )
     parser.add_argument(
         "--jd", "-j", help="Path to job description file"
     )
+    parser.add_argument(
+        "--job-id", help="Score against this posting from --job-index instead of --jd"
+    )
+    parser.add_argument(
+        "--ingest-jobs",
+        metavar="SOURCE",
+        help="Compile a directory, JSONL or CSV file of job postings into --job-index"
+    )
+    parser.add_argument(
+        "--job-index",
+        default=os.getenv("ATS_JOB_INDEX", "job_index"),
+        help="Directory of compiled job postings (default: job_index, or set ATS_JOB_INDEX)"
+    )
+    parser.add_argument(
+        "--workers",
+        type=int,
+        help="Worker processes for --ingest-jobs (default: CPU count)"
+    )
     parser.add_argument("--output", "-o", help="Output file path (optional)")
     parser.add_argument(
         "--format",
@@ -343,6 +979,33 @@ Examples:
     )
     parser.add_argument("--weights", "-w", help="Path to custom weights JSON file")
     parser.add_argument("--skills-db", help="Path to custom skills database JSON file")
+    parser.add_argument(
+        "--cache-dir",
+        default=os.getenv("ATS_CACHE_DIR"),
+        help="Directory for the persistent parsed-resume cache (or set ATS_CACHE_DIR)"
+    )
+    parser.add_argument(
+        "--tfidf-mode",
+        choices=["pair", "jd", "corpus"],
+        default="pair",
+        help="Fit TF-IDF per resume/JD pair, once per JD, or from a saved corpus vectorizer"
+    )
+    parser.add_argument(
+        "--vectorizer", help="Saved TF-IDF vectorizer for --tfidf-mode corpus"
+    )
+    parser.add_argument(
+        "--parallel-pages",
+        type=int,
+        nargs="?",
+        const=PARALLEL_PAGE_THRESHOLD,
+        help=f"Split PDFs with at least this many pages across processes "
+        f"(default when given: {PARALLEL_PAGE_THRESHOLD})"
+    )
+    parser.add_argument(
+        "--layout",
+        action="store_true",
+        help="Find PDF section headings from font size and weight"
+    )
     parser.add_argument(
         "--level", 
         "-l",
@@ -387,23 +1050,24 @@ Examples:
         return
 
     # Validate required arguments
-    if not args.resume or not args.jd:
+    if not args.ingest_jobs and (not args.resume or not (args.jd or args.job_id)):
         parser.print_help()
-        print("\nError: Both --resume and --jd arguments are required")
+        print("\nError: --resume and one of --jd or --job-id are required")
         sys.exit(1)
 
     try:
         # Validate input files
-        resume_path = Path(args.resume)
-        jd_path = Path(args.jd)
+        if not args.ingest_jobs:
+            resume_path = Path(args.resume)
+            jd_path = Path(args.jd) if args.jd else None
 
-        if not resume_path.exists():
-            print(f"Error: Resume file not found: {resume_path}")
-            sys.exit(1)
+            if not resume_path.exists():
+                print(f"Error: Resume file not found: {resume_path}")
+                sys.exit(1)
 
-        if not jd_path.exists():
-            print(f"Error: Job description file not found: {jd_path}")
-            sys.exit(1)
+            if jd_path and not jd_path.exists():
+                print(f"Error: Job description file not found: {jd_path}")
+                sys.exit(1)
 
         # Load custom weights if provided
         weights = None
@@ -447,20 +1111,51 @@ Examples:
         scorer = ATSResumeScorer(
             weights=weights, 
             skills_db_path=args.skills_db,
-            llm_config=llm_config
+            llm_config=llm_config,
+            resume_cache_dir=args.cache_dir,
+            tfidf_mode=args.tfidf_mode,
+            vectorizer_path=args.vectorizer,
+            extraction_limits=ExtractionLimits(
+                parallel_pages=args.parallel_pages, layout=args.layout
+            )
         )
 
+        if args.ingest_jobs:
+            print(f"📥 Ingesting job postings: {args.ingest_jobs}")
+            stats = scorer.ingest_jobs(args.ingest_jobs, args.job_index, args.workers)
+            print(
+                f"✅ {stats.postings} postings ({stats.unique} unique) indexed in "
+                f"{args.job_index}: {stats.files_read}/{stats.files} files read, "
+                f"{stats.compiled} compiled, {stats.reused} reused, {stats.removed} removed "
+                f"in {stats.seconds:.2f}s"
+            )
+            if stats.failures:
+                print(f"⚠️  {len(stats.failures)} postings could not be indexed:")
+                for posting, reason in stats.failures.items():
+                    print(f"   {posting}: {reason}")
+            return
+
         # Score resume
         print(f"📄 Analyzing resume: {resume_path}")
-        print(f"📋 Against job description: {jd_path}")
+        if args.job_id:
+            print(f"📋 Against job posting: {args.job_id} ({args.job_index})")
+        else:
+            print(f"📋 Against job description: {jd_path}")
         print(f"🎯 Recommendation level: {args.level}")
         print("-" * 60)
 
-        result = scorer.score_resume_from_files(
-            str(resume_path), 
-            str(jd_path),
-            args.level
-        )
+        if args.job_id:
+            job_index = JobIndex(args.job_index)
+            if args.job_id not in job_index:
+                print(f"Error: Job posting {args.job_id!r} not found in {args.job_index}")
+                sys.exit(1)
+            result = scorer.score_resume(str(resume_path), job_index.get(args.job_id), args.level)
+        else:
+            result = scorer.score_resume_from_files(
+                str(resume_path), 
+                str(jd_path),
+                args.level
+            )
 
         # Display results
         print(
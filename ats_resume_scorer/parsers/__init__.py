@@ -5,6 +5,8 @@ Resume and Job Description Parsers Package
 
 from .resume_parser import ResumeParser, ResumeData, ContactInfo, Experience, Education
 from .jd_parser import JobDescriptionParser, JobDescription
+from .compact import CompactResume, SkillVocabulary
+from .skill_index import SkillIndex
 
 __all__ = [
     "ResumeParser",
@@ -14,4 +16,7 @@ __all__ = [
     "Education",
     "JobDescriptionParser",
     "JobDescription",
+    "CompactResume",
+    "SkillVocabulary",
+    "SkillIndex",
 ]
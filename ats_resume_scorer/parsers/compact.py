@@ -0,0 +1,306 @@
+# ats_resume_scorer/parsers/compact.py
+"""
+Compact Resumes - Slotted, immutable ResumeData for holding many in memory
+
+Ranking a large candidate pool keeps every parsed resume resident, and the
+plain dataclasses spend most of that on per-instance dicts, duplicate copies
+of the same skill, title and company strings, and the raw text.
+``CompactResume`` stores the same fields in ``__slots__`` instances and
+tuples, keeps skills as integer IDs into a shared ``SkillVocabulary``, and
+can move the raw text to an external store keyed by content hash. Scoring
+reads the raw text (keyword TF-IDF, format, verbs, readability), so only
+drop it from records that are already scored and kept for reporting.
+"""
+
+import hashlib
+import sys
+import threading
+from dataclasses import dataclass, fields
+from typing import Dict, Iterable, List, MutableMapping, Optional, Tuple
+
+from .resume_parser import ContactInfo, Education, Experience, ResumeData
+
+# What CompactResume.from_resume does with raw_text
+RAW_TEXT_MODES = ("keep", "drop", "external")
+
+
+def _intern(value: Optional[str]) -> Optional[str]:
+    return sys.intern(value) if value else value
+
+
+class SkillVocabulary:
+    """Two-way mapping between skill names and small integer IDs
+
+    Skills from the skills database get IDs in sorted order, so every
+    process built from the same database agrees on them. Skills seen only in
+    resumes (free-text items from a skills section) are appended as they
+    arrive. Names are interned and each ID is a single shared int object,
+    so a million resumes listing "python" hold one string and one int.
+    """
+
+    def __init__(self, skills: Iterable[str] = ()):
+        self._names: List[str] = []
+        self._ids: Dict[str, int] = {}
+        self._lock = threading.Lock()
+        for skill in sorted({s.strip().lower() for s in skills if s.strip()}):
+            self._add(skill)
+
+    @classmethod
+    def from_skills_db(cls, skills_db: Dict[str, List[str]]) -> "SkillVocabulary":
+        """Vocabulary of every skill in a {category: [skills]} mapping"""
+        return cls(skill for skills in skills_db.values() for skill in skills)
+
+    def __len__(self) -> int:
+        return len(self._names)
+
+    def __contains__(self, skill: str) -> bool:
+        return skill in self._ids
+
+    def _add(self, skill: str) -> int:
+        # The name lands in _names before its ID is published, so a reader
+        # that finds the ID without the lock can always resolve it
+        name = sys.intern(skill)
+        self._names.append(name)
+        skill_id = self._ids[name] = len(self._names) - 1
+        return skill_id
+
+    def intern(self, skill: str) -> int:
+        """ID of a skill, assigning the next free one if it is new"""
+        skill_id = self._ids.get(skill)
+        if skill_id is None:
+            with self._lock:
+                skill_id = self._ids.get(skill)
+                if skill_id is None:
+                    skill_id = self._add(skill)
+        return skill_id
+
+    def ids(self, skills: Iterable[str]) -> Tuple[int, ...]:
+        """IDs for skill names, in order"""
+        return tuple(self.intern(skill) for skill in skills)
+
+    def names(self, skill_ids: Iterable[int]) -> List[str]:
+        """Skill names for IDs, in order"""
+        return [self._names[skill_id] for skill_id in skill_ids]
+
+
+class _FrozenSlots:
+    """Pickle support for frozen dataclasses that declare ``__slots__``
+
+    Without a ``__dict__`` the default unpickling restores slots through
+    ``setattr``, which frozen dataclasses refuse.
+    """
+
+    __slots__ = ()
+
+    def __getstate__(self):
+        return tuple(getattr(self, f.name) for f in fields(self))
+
+    def __setstate__(self, state):
+        for f, value in zip(fields(self), state):
+            object.__setattr__(self, f.name, value)
+
+
+@dataclass(frozen=True)
+class CompactContactInfo(_FrozenSlots):
+    """Immutable ContactInfo"""
+
+    __slots__ = ("emails", "phones", "linkedin", "github", "website", "address")
+
+    emails: Tuple[str, ...]
+    phones: Tuple[str, ...]
+    linkedin: Optional[str]
+    github: Optional[str]
+    website: Optional[str]
+    address: Optional[str]
+
+
+@dataclass(frozen=True)
+class CompactExperience(_FrozenSlots):
+    """Immutable Experience with interned title and company"""
+
+    __slots__ = ("title", "company", "duration", "description", "location")
+
+    title: str
+    company: str
+    duration: str
+    description: Tuple[str, ...]
+    location: Optional[str]
+
+
+@dataclass(frozen=True)
+class CompactEducation(_FrozenSlots):
+    """Immutable Education with interned degree and institution"""
+
+    __slots__ = ("degree", "institution", "graduation_year", "gpa", "location")
+
+    degree: str
+    institution: str
+    graduation_year: Optional[str]
+    gpa: Optional[str]
+    location: Optional[str]
+
+
+@dataclass(frozen=True)
+class CompactResume(_FrozenSlots):
+    """Immutable ResumeData with skills as vocabulary IDs
+
+    ``raw_text`` is None when it was dropped or externalized; in the latter
+    case ``raw_text_key`` names it in the store passed to ``from_resume``.
+    """
+
+    __slots__ = (
+        "contact_info", "summary", "skill_ids", "education", "experience",
+        "certifications", "raw_text", "raw_text_key", "truncated", "sections",
+        "encoding",
+    )
+
+    contact_info: CompactContactInfo
+    summary: Optional[str]
+    skill_ids: Tuple[int, ...]
+    education: Tuple[CompactEducation, ...]
+    experience: Tuple[CompactExperience, ...]
+    certifications: Tuple[str, ...]
+    raw_text: Optional[str]
+    raw_text_key: Optional[str]
+    truncated: bool
+    sections: Tuple[Tuple[str, int, int], ...]  # (name, start, end) into raw_text
+    encoding: Optional[str]
+
+    @classmethod
+    def from_resume(
+        cls,
+        resume: ResumeData,
+        vocabulary: SkillVocabulary,
+        raw_text: str = "keep",
+        raw_text_store: Optional[MutableMapping[str, str]] = None,
+    ) -> "CompactResume":
+        """Compact a parsed resume
+
+        Args:
+            resume: Parsed resume
+            vocabulary: Shared vocabulary that skills are mapped into
+            raw_text: "keep" it inline, "drop" it (the record can no
+                longer be scored), or move it to ``raw_text_store`` ("external")
+            raw_text_store: Mapping that receives externalized text, keyed
+                by its SHA-1 so identical resumes share one entry
+        """
+        if raw_text not in RAW_TEXT_MODES:
+            raise ValueError(f"raw_text must be one of {RAW_TEXT_MODES}, got {raw_text!r}")
+        if raw_text == "external" and raw_text_store is None:
+            raise ValueError("raw_text='external' needs a raw_text_store")
+
+        text: Optional[str] = resume.raw_text if raw_text == "keep" else None
+        key = None
+        if raw_text == "external":
+            key = hashlib.sha1(resume.raw_text.encode("utf-8")).hexdigest()
+            raw_text_store.setdefault(key, resume.raw_text)
+
+        contact = resume.contact_info
+        return cls(
+            contact_info=CompactContactInfo(
+                emails=tuple(contact.emails),
+                phones=tuple(contact.phones),
+                linkedin=contact.linkedin,
+                github=contact.github,
+                website=contact.website,
+                address=contact.address,
+            ),
+            summary=resume.summary,
+            skill_ids=vocabulary.ids(resume.skills),
+            education=tuple(
+                CompactEducation(
+                    degree=_intern(edu.degree),
+                    institution=_intern(edu.institution),
+                    graduation_year=_intern(edu.graduation_year),
+                    gpa=edu.gpa,
+                    location=_intern(edu.location),
+                )
+                for edu in resume.education
+            ),
+            experience=tuple(
+                CompactExperience(
+                    title=_intern(exp.title),
+                    company=_intern(exp.company),
+                    duration=exp.duration,
+                    description=tuple(exp.description),
+                    location=_intern(exp.location),
+                )
+                for exp in resume.experience
+            ),
+            certifications=tuple(_intern(cert) for cert in resume.certifications),
+            raw_text=text,
+            raw_text_key=key,
+            truncated=resume.truncated,
+            sections=tuple(
+                (sys.intern(name), start, end)
+                for name, (start, end) in resume.sections.items()
+            ),
+            encoding=_intern(resume.encoding),
+        )
+
+    def skills(self, vocabulary: SkillVocabulary) -> List[str]:
+        """Skill names, in the order they were parsed"""
+        return vocabulary.names(self.skill_ids)
+
+    def to_resume(
+        self,
+        vocabulary: SkillVocabulary,
+        raw_text_store: Optional[MutableMapping[str, str]] = None,
+        allow_missing_text: bool = False,
+    ) -> ResumeData:
+        """Expand back into a ResumeData for scoring or reporting
+
+        Raises ValueError when the raw text was dropped, or externalized and
+        missing from the store, since scores computed without it are wrong.
+        With ``allow_missing_text`` it comes back as an empty string instead,
+        for reporting the structured fields only.
+        """
+        text = self.raw_text
+        if text is None and self.raw_text_key is not None and raw_text_store is not None:
+            text = raw_text_store.get(self.raw_text_key)
+        if text is None:
+            if not allow_missing_text:
+                raise ValueError(
+                    "Raw text was dropped or is missing from the store; pass "
+                    "allow_missing_text=True to expand the record without it"
+                )
+            text = ""
+
+        contact = self.contact_info
+        return ResumeData(
+            contact_info=ContactInfo(
+                emails=list(contact.emails),
+                phones=list(contact.phones),
+                linkedin=contact.linkedin,
+                github=contact.github,
+                website=contact.website,
+                address=contact.address,
+            ),
+            summary=self.summary,
+            skills=self.skills(vocabulary),
+            education=[
+                Education(
+                    degree=edu.degree,
+                    institution=edu.institution,
+                    graduation_year=edu.graduation_year,
+                    gpa=edu.gpa,
+                    location=edu.location,
+                )
+                for edu in self.education
+            ],
+            experience=[
+                Experience(
+                    title=exp.title,
+                    company=exp.company,
+                    duration=exp.duration,
+                    description=list(exp.description),
+                    location=exp.location,
+                )
+                for exp in self.experience
+            ],
+            certifications=list(self.certifications),
+            raw_text=text,
+            truncated=self.truncated,
+            sections={name: (start, end) for name, start, end in self.sections},
+            encoding=self.encoding,
+        )
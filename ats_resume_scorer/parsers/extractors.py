@@ -0,0 +1,907 @@
+# ats_resume_scorer/parsers/extractors.py
+"""
+Text Extractors - Registry of resume file formats keyed by sniffed content type
+
+Each format registers an ``Extractor`` that turns raw file bytes into text.
+Formats are identified from the content first (PDF header, ZIP/OOXML and ODF
+signatures, RTF and HTML markers) and only then from the declared file name
+or MIME type, so misnamed uploads still parse. Every extractor declares a
+cost class that schedulers can use to route expensive formats separately.
+"""
+
+import codecs
+import logging
+import os
+import threading
+import time
+import zipfile
+from concurrent.futures import ProcessPoolExecutor, TimeoutError as FutureTimeout
+from dataclasses import dataclass, field
+from html.parser import HTMLParser
+from io import BytesIO
+from pathlib import Path
+from typing import Callable, Dict, Iterator, List, Optional, Tuple, Union
+from xml.etree import ElementTree
+
+from . import patterns
+from .sections import SectionMap, classify_heading
+
+# File parsing imports
+try:
+    import fitz  # PyMuPDF
+except ImportError:
+    fitz = None
+
+logger = logging.getLogger(__name__)
+
+BytesLike = Union[bytes, bytearray, memoryview]
+
+# Relative extraction cost, cheapest first
+COST_CLASSES = ("cheap", "moderate", "expensive")
+
+# Bytes inspected when sniffing header signatures
+SNIFF_BYTES = 2048
+
+# Bytes inspected when guessing the encoding of text without a BOM
+ENCODING_SAMPLE_BYTES = 64 * 1024
+
+# Page count from which splitting a PDF across processes beats reading it
+# serially with four workers; measured by benchmarks/bench_pdf_pages.py
+PARALLEL_PAGE_THRESHOLD = 32
+
+
+@dataclass(frozen=True)
+class ExtractionLimits:
+    """Budgets that bound the work spent extracting one document
+
+    ``None`` disables a limit. Page and time budgets are checked between
+    pages of paged formats; the character budget applies to every format.
+    PDFs with at least ``parallel_pages`` pages are split across
+    ``page_workers`` processes; the default keeps every document serial.
+    ``layout`` reads PDFs as styled blocks to find section headings from
+    font size and weight; it always runs serially.
+    """
+
+    max_pages: Optional[int] = 50
+    max_chars: Optional[int] = 200_000
+    time_budget: Optional[float] = 10.0  # Seconds per document
+    parallel_pages: Optional[int] = None
+    page_workers: Optional[int] = None  # Defaults to the CPU count
+    layout: bool = False
+
+
+UNLIMITED = ExtractionLimits(max_pages=None, max_chars=None, time_budget=None)
+
+
+@dataclass
+class ExtractedText:
+    """Extracted document text and whether a budget cut it short"""
+
+    text: str
+    truncated: bool = False
+    pages: Optional[int] = None  # Pages read, for paged formats
+    sections: Optional[SectionMap] = None  # When the format exposes headings
+    encoding: Optional[str] = None  # Detected encoding, for text formats
+
+
+@dataclass(frozen=True)
+class Extractor:
+    """A file format and the function that extracts its text
+
+    Plain extractors take the file bytes and return text, or
+    ``ExtractedText`` when they have more to report. ``paged`` extractors
+    also take the ``ExtractionLimits`` and return ``ExtractedText``, so
+    they can stop early instead of being cut after.
+    """
+
+    name: str
+    extract: Callable[..., Union[str, ExtractedText]]
+    cost: str = "cheap"
+    extensions: Tuple[str, ...] = ()
+    mime_types: Tuple[str, ...] = ()
+    sniff: Optional[Callable[[bytes], bool]] = field(default=None, compare=False)
+    paged: bool = False
+
+    def __post_init__(self):
+        """Validate the cost class"""
+        if self.cost not in COST_CLASSES:
+            raise ValueError(
+                f"Unknown cost class {self.cost!r}, expected one of {COST_CLASSES}"
+            )
+
+    def run(self, data: bytes, limits: Optional[ExtractionLimits] = None) -> ExtractedText:
+        """Extract text within the given limits"""
+        limits = limits or ExtractionLimits()
+        result = self.extract(data, limits) if self.paged else self.extract(data)
+        if not isinstance(result, ExtractedText):
+            result = ExtractedText(result)
+
+        if limits.max_chars is not None and len(result.text) > limits.max_chars:
+            result.text = result.text[: limits.max_chars]
+            result.truncated = True
+            if result.sections is not None:
+                result.sections = result.sections.clip(limits.max_chars)
+        return result
+
+
+_registry: Dict[str, Extractor] = {}
+
+
+def register_extractor(extractor: Extractor) -> Extractor:
+    """Add an extractor, replacing any registered under the same name"""
+    _registry[extractor.name] = extractor
+    return extractor
+
+
+def get_extractor(name: str) -> Extractor:
+    """Return the extractor registered under a format name"""
+    try:
+        return _registry[name]
+    except KeyError:
+        raise ValueError(f"Unsupported file format: {name}") from None
+
+
+def registered_extensions() -> List[str]:
+    """File extensions of all registered formats"""
+    return [ext for extractor in _registry.values() for ext in extractor.extensions]
+
+
+def declared_format(filename_or_mime: str) -> Optional[str]:
+    """Format name implied by a file name's extension or by a MIME type"""
+    mime = filename_or_mime.split(";", 1)[0].strip().lower()
+    suffix = Path(filename_or_mime).suffix.lower()
+    for extractor in _registry.values():
+        if mime in extractor.mime_types or (suffix and suffix in extractor.extensions):
+            return extractor.name
+    return None
+
+
+def sniff_format(data: BytesLike) -> Optional[str]:
+    """Format name identified from the content itself, if any"""
+    data = bytes(data)
+    for extractor in _registry.values():
+        if extractor.sniff is not None and extractor.sniff(data):
+            return extractor.name
+    return None
+
+
+def resolve_extractor(data: BytesLike, filename_or_mime: str) -> Extractor:
+    """Pick the extractor for some content, trusting the content over the name
+
+    Raises:
+        ValueError: If neither the content nor the name identifies a format
+    """
+    declared = declared_format(filename_or_mime)
+    sniffed = sniff_format(data)
+
+    # Plain text is worth parsing under no extension, an unknown one, a binary
+    # format the content doesn't match or application/octet-stream; only
+    # formats known by name alone (no sniffer) keep their declared extractor
+    if sniffed is None and (declared is None or _registry[declared].sniff):
+        if _looks_like_text(bytes(data[:SNIFF_BYTES])) and "text" in _registry:
+            sniffed = "text"
+
+    if sniffed is not None:
+        if declared is not None and declared != sniffed:
+            logger.info(f"{filename_or_mime} looks like {sniffed}, not {declared}")
+        return _registry[sniffed]
+    if declared is not None:
+        return _registry[declared]
+
+    suffix = Path(filename_or_mime).suffix.lower()
+    raise ValueError(f"Unsupported file format: {suffix or filename_or_mime}")
+
+
+# Byte order marks, longest first: the UTF-32 LE mark starts with the UTF-16 LE one
+_BOMS = (
+    (codecs.BOM_UTF32_LE, "utf-32"),
+    (codecs.BOM_UTF32_BE, "utf-32"),
+    (codecs.BOM_UTF8, "utf-8-sig"),
+    (codecs.BOM_UTF16_LE, "utf-16"),
+    (codecs.BOM_UTF16_BE, "utf-16"),
+)
+
+
+def detect_encoding(data: bytes) -> str:
+    """Guess the encoding of text bytes from a BOM or a bounded sample
+
+    Without a BOM, only the first ``ENCODING_SAMPLE_BYTES`` are examined:
+    UTF-16 shows up as NULs in every other byte, valid UTF-8 is taken as
+    UTF-8, and anything else is cp1252 if it uses the printable characters
+    cp1252 puts in the C1 range, else latin-1.
+    """
+    for bom, encoding in _BOMS:
+        if data.startswith(bom):
+            return encoding
+
+    sample = data[:ENCODING_SAMPLE_BYTES]
+    half = len(sample) // 2
+    if half and b"\x00" in sample:
+        even_nuls = sample[0::2].count(0)
+        odd_nuls = sample[1::2].count(0)
+        if odd_nuls > half * 0.3 and even_nuls < half * 0.05:
+            return "utf-16-le"
+        if even_nuls > half * 0.3 and odd_nuls < half * 0.05:
+            return "utf-16-be"
+
+    try:
+        # Incremental so a character cut at the sample's end isn't an error
+        codecs.getincrementaldecoder("utf-8")().decode(
+            sample, final=len(sample) == len(data)
+        )
+        return "utf-8"
+    except UnicodeDecodeError:
+        pass
+
+    if patterns.C1_BYTES.search(sample) and not patterns.CP1252_UNDEFINED.search(sample):
+        return "cp1252"
+    return "latin-1"
+
+
+def decode_text_with_encoding(data: bytes, source: str = "<bytes>") -> Tuple[str, str]:
+    """Decode text file contents in one pass, returning the text and its encoding"""
+    encoding = detect_encoding(data)
+    try:
+        text = data.decode(encoding)
+    except UnicodeDecodeError as e:
+        # The sample looked fine but a later byte didn't
+        logger.warning(f"{source} is not entirely {encoding}, replacing bad bytes: {e}")
+        text = data.decode(encoding, errors="replace")
+    # Same universal-newline handling as reading the file in text mode
+    return text.replace("\r\n", "\n").replace("\r", "\n"), encoding
+
+
+def decode_text(data: bytes, source: str = "<bytes>") -> str:
+    """Decode text file contents, detecting the encoding once"""
+    return decode_text_with_encoding(data, source)[0]
+
+
+def _looks_like_text(head: bytes) -> bool:
+    """Heuristic: text files contain no NUL bytes, unless they are UTF-16/32"""
+    if not head:
+        return False
+    return b"\x00" not in head or detect_encoding(head).startswith("utf-")
+
+
+def join_pages(
+    page_texts: Iterator[str], page_count: int, limits: ExtractionLimits
+) -> ExtractedText:
+    """Join page texts lazily, stopping once a page, character or time budget is spent
+
+    ``page_texts`` must be a lazy iterator so unread pages are never extracted.
+    """
+    deadline = (
+        time.monotonic() + limits.time_budget if limits.time_budget is not None else None
+    )
+    parts: List[str] = []
+    chars = 0
+    pages = 0
+
+    # Budgets are checked before each page is pulled, as pulling extracts it
+    while pages < page_count:
+        if limits.max_pages is not None and pages >= limits.max_pages:
+            break
+        if limits.max_chars is not None and chars >= limits.max_chars:
+            break
+        if deadline is not None and time.monotonic() >= deadline:
+            logger.warning(f"Extraction time budget spent after {pages} pages")
+            break
+        page_text = next(page_texts, None)
+        if page_text is None:
+            break
+        parts.append(page_text)
+        chars += len(page_text)
+        pages += 1
+
+    text = "".join(parts)
+    truncated = pages < page_count
+    if limits.max_chars is not None and len(text) > limits.max_chars:
+        text = text[: limits.max_chars]
+        truncated = True
+    return ExtractedText(text, truncated=truncated, pages=pages)
+
+
+def _zip_names(data: bytes) -> List[str]:
+    """Member names of a ZIP archive, or an empty list if it isn't one"""
+    if not data.startswith(b"PK\x03\x04"):
+        return []
+    try:
+        with zipfile.ZipFile(BytesIO(data)) as archive:
+            return archive.namelist()
+    except zipfile.BadZipFile:
+        return []
+
+
+# PDF
+
+
+def _sniff_pdf(data: bytes) -> bool:
+    # The header may be preceded by junk, which readers tolerate
+    return b"%PDF-" in data[:1024]
+
+
+# PyMuPDF span flag for bold text
+_BOLD_FLAG = 1 << 4
+# Font size, relative to the page's body text, from which a line reads as a heading
+HEADING_SIZE_RATIO = 1.15
+
+
+@dataclass(frozen=True)
+class TextBlock:
+    """A block of PDF text with the typography used to spot headings"""
+
+    text: str
+    size: float  # Largest font size in the block
+    bold: bool  # Every span is bold
+    page: int
+    heading: Optional[str] = None  # Canonical section name if it is one
+
+
+def _line_style(line: Dict) -> Tuple[str, float, bool, int]:
+    """Text, largest font size, boldness and character count of a PyMuPDF line"""
+    spans = [span for span in line["spans"] if span["text"].strip()]
+    text = "".join(span["text"] for span in line["spans"]).strip()
+    if not spans:
+        return text, 0.0, False, 0
+    size = max(span["size"] for span in spans)
+    bold = all(span["flags"] & _BOLD_FLAG for span in spans)
+    return text, size, bold, sum(len(span["text"]) for span in spans)
+
+
+def _page_blocks(page, number: int) -> List[TextBlock]:
+    """Styled text blocks of one page in reading order
+
+    Blocks are read column by column: blocks entirely right of the page
+    middle come after the rest, so two-column layouts aren't interleaved.
+    """
+    middle = page.rect.width / 2
+    raw_blocks = [b for b in page.get_text("dict")["blocks"] if b["type"] == 0]
+    raw_blocks.sort(key=lambda b: (b["bbox"][0] >= middle, b["bbox"][1], b["bbox"][0]))
+
+    styled = [[_line_style(line) for line in b["lines"]] for b in raw_blocks]
+    weights: Dict[float, int] = {}
+    for lines in styled:
+        for _, size, _, chars in lines:
+            weights[round(size, 1)] = weights.get(round(size, 1), 0) + chars
+    body_size = max(weights, key=weights.get) if weights else 0.0
+
+    blocks: List[TextBlock] = []
+
+    def flush(body: List[Tuple[str, float, bool, int]]) -> None:
+        if body:
+            blocks.append(
+                TextBlock(
+                    "\n".join(line[0] for line in body),
+                    max(line[1] for line in body),
+                    all(line[2] for line in body),
+                    number,
+                )
+            )
+
+    for lines in styled:
+        body = []
+        for line in lines:
+            text, size, bold, _ = line
+            if not text:
+                continue
+            name = classify_heading(text)
+            if name and (bold or size >= body_size * HEADING_SIZE_RATIO or text.isupper()):
+                # Headings get their own block even when PyMuPDF merged them
+                # into the surrounding paragraph
+                flush(body)
+                body = []
+                blocks.append(TextBlock(text, size, bold, number, heading=name))
+            else:
+                body.append(line)
+        flush(body)
+    return blocks
+
+
+def extract_pdf_blocks(data: bytes, limits: ExtractionLimits = UNLIMITED) -> List[TextBlock]:
+    """Styled text blocks of a PDF in reading order, up to ``limits.max_pages``"""
+    if not fitz:
+        raise ImportError("PyMuPDF not installed. Install with: pip install PyMuPDF")
+    with fitz.open(stream=data, filetype="pdf") as doc:
+        page_count = doc.page_count
+        if limits.max_pages is not None:
+            page_count = min(page_count, limits.max_pages)
+        return [
+            block
+            for number in range(page_count)
+            for block in _page_blocks(doc[number], number)
+        ]
+
+
+def _layout_page_texts(doc, headings: List[Tuple[str, int, int]]) -> Iterator[str]:
+    """Yield page texts built from styled blocks, recording heading offsets"""
+    offset = 0
+    for number, page in enumerate(doc):
+        parts = []
+        for block in _page_blocks(page, number):
+            piece = block.text + "\n"
+            if block.heading:
+                headings.append((block.heading, offset, offset + len(piece)))
+            parts.append(piece)
+            offset += len(piece)
+        yield "".join(parts)
+
+
+_page_pools: Dict[int, ProcessPoolExecutor] = {}
+_page_pools_lock = threading.Lock()
+
+
+def _page_pool(workers: int) -> ProcessPoolExecutor:
+    """Return the shared page-extraction pool with the given worker count"""
+    with _page_pools_lock:
+        pool = _page_pools.get(workers)
+        if pool is None:
+            pool = _page_pools[workers] = ProcessPoolExecutor(max_workers=workers)
+        return pool
+
+
+def shutdown_page_pools() -> None:
+    """Stop the worker processes used for parallel PDF extraction"""
+    with _page_pools_lock:
+        pools = list(_page_pools.values())
+        _page_pools.clear()
+    for pool in pools:
+        pool.shutdown()
+
+
+def _extract_page_range(data: bytes, start: int, stop: int) -> List[str]:
+    """Open a PDF independently and extract the text of pages [start, stop)"""
+    with fitz.open(stream=data, filetype="pdf") as doc:
+        return [doc[number].get_text() for number in range(start, stop)]
+
+
+def _parallel_page_texts(
+    data: bytes, page_count: int, limits: ExtractionLimits
+) -> Iterator[str]:
+    """Yield page texts in order while contiguous page ranges extract in parallel"""
+    workers = limits.page_workers or os.cpu_count() or 1
+    if limits.max_pages is not None:
+        page_count = min(page_count, limits.max_pages)
+    if page_count <= 0:
+        return
+    # No more ranges than pages; the pool itself stays keyed by worker count
+    step = -(-page_count // min(workers, page_count))
+    data = bytes(data)  # Memoryviews don't pickle
+    pool = _page_pool(workers)
+    futures = [
+        pool.submit(_extract_page_range, data, start, min(start + step, page_count))
+        for start in range(0, page_count, step)
+    ]
+    deadline = (
+        time.monotonic() + limits.time_budget if limits.time_budget is not None else None
+    )
+    try:
+        for future in futures:
+            timeout = None if deadline is None else max(0.0, deadline - time.monotonic())
+            try:
+                yield from future.result(timeout=timeout)
+            except FutureTimeout:
+                logger.warning("Extraction time budget spent waiting for PDF pages")
+                return
+    finally:
+        for future in futures:
+            future.cancel()
+
+
+def extract_pdf(data: bytes, limits: ExtractionLimits = UNLIMITED) -> ExtractedText:
+    """Extract text from PDF bytes page by page, within the given limits
+
+    Documents with at least ``limits.parallel_pages`` pages are split into
+    contiguous page ranges that worker processes extract concurrently. With
+    ``limits.layout`` the text is rebuilt from styled blocks and comes with
+    a section map of the headings found.
+    """
+    if fitz:  # PyMuPDF
+        try:
+            with fitz.open(stream=data, filetype="pdf") as doc:
+                page_count = doc.page_count
+                if limits.layout:
+                    headings: List[Tuple[str, int, int]] = []
+                    result = join_pages(
+                        _layout_page_texts(doc, headings), page_count, limits
+                    )
+                    result.sections = SectionMap.from_headings(
+                        headings, len(result.text)
+                    )
+                    return result
+                if limits.parallel_pages is None or page_count < limits.parallel_pages:
+                    return join_pages(
+                        (page.get_text() for page in doc), page_count, limits
+                    )
+            return join_pages(
+                _parallel_page_texts(data, page_count, limits), page_count, limits
+            )
+        except Exception as e:
+            logger.error(f"Error parsing PDF with PyMuPDF: {e}")
+            raise
+    else:  # PyPDF2 fallback
+        try:
+            import PyPDF2
+
+            pdf_reader = PyPDF2.PdfReader(BytesIO(data))
+            pages = pdf_reader.pages
+            return join_pages(
+                (page.extract_text() for page in pages), len(pages), limits
+            )
+        except Exception as e:
+            logger.error(f"Error parsing PDF with PyPDF2: {e}")
+            raise
+
+
+# DOCX (Office Open XML)
+
+
+def _sniff_docx(data: bytes) -> bool:
+    return "word/document.xml" in _zip_names(data)
+
+
+_W_NS = "{http://schemas.openxmlformats.org/wordprocessingml/2006/main}"
+_MC_FALLBACK = "{http://schemas.openxmlformats.org/markup-compatibility/2006}Fallback"
+_W_PARAGRAPH = _W_NS + "p"
+_W_TEXT = _W_NS + "t"
+_W_CELL = _W_NS + "tc"
+_W_ROW = _W_NS + "tr"
+_W_TEXT_BOX = _W_NS + "txbxContent"
+_W_CHARACTERS = {_W_NS + "tab": "\t", _W_NS + "br": "\n", _W_NS + "cr": "\n"}
+_DOCX_CONTAINERS = {_W_PARAGRAPH, _W_CELL, _W_ROW, _W_TEXT_BOX}
+
+
+def _docx_part_lines(part) -> Iterator[str]:
+    """Stream the lines of one WordprocessingML part in document order
+
+    Paragraphs become lines. A table row becomes one line with its cells
+    separated by tabs. Text box content is emitted before the paragraph
+    that anchors it. The VML fallback copy of each text box is skipped.
+    """
+    # Open paragraphs, cells, rows and text boxes, each collecting its pieces
+    stack: List[Tuple[str, List[str]]] = []
+    fallback_depth = 0
+
+    def emit(text: str) -> Iterator[str]:
+        # Text goes to the innermost open container that collects lines
+        for tag, pieces in reversed(stack):
+            if tag in (_W_CELL, _W_TEXT_BOX):
+                pieces.append(text)
+                return
+        yield text
+
+    for event, element in ElementTree.iterparse(part, events=("start", "end")):
+        tag = element.tag
+        if tag == _MC_FALLBACK:
+            fallback_depth += 1 if event == "start" else -1
+            continue
+        if fallback_depth:
+            if event == "end":
+                element.clear()
+            continue
+
+        if event == "start":
+            if tag in _DOCX_CONTAINERS:
+                stack.append((tag, []))
+            continue
+
+        if tag == _W_TEXT or tag in _W_CHARACTERS:
+            text = (element.text or "") if tag == _W_TEXT else _W_CHARACTERS[tag]
+            for open_tag, pieces in reversed(stack):
+                if open_tag == _W_PARAGRAPH:
+                    pieces.append(text)
+                    break
+        elif tag == _W_PARAGRAPH:
+            yield from emit("".join(stack.pop()[1]))
+            element.clear()
+        elif tag == _W_CELL:
+            cell = " ".join(text for text in stack.pop()[1] if text.strip())
+            if stack and stack[-1][0] == _W_ROW:
+                stack[-1][1].append(cell)
+        elif tag == _W_ROW:
+            row = "\t".join(stack.pop()[1])
+            if row.strip():
+                yield from emit(row)
+            element.clear()
+        elif tag == _W_TEXT_BOX:
+            for line in stack.pop()[1]:
+                yield from emit(line)
+
+
+def extract_docx(data: bytes) -> str:
+    """Extract text from DOCX bytes by streaming the OOXML parts
+
+    Covers body paragraphs, table cells and text boxes, plus the page
+    headers and footers, without building a python-docx object model.
+    """
+    lines: List[str] = []
+    try:
+        with zipfile.ZipFile(BytesIO(data)) as archive:
+            names = archive.namelist()
+            headers = sorted(n for n in names if patterns.DOCX_HEADER_PART.match(n))
+            footers = sorted(n for n in names if patterns.DOCX_FOOTER_PART.match(n))
+            seen = set()
+            for name in headers + ["word/document.xml"] + footers:
+                with archive.open(name) as part:
+                    for line in _docx_part_lines(part):
+                        if name == "word/document.xml":
+                            lines.append(line)
+                        elif line.strip() and line not in seen:
+                            # First-page and default headers often repeat
+                            seen.add(line)
+                            lines.append(line)
+    except (zipfile.BadZipFile, KeyError, ElementTree.ParseError) as e:
+        logger.error(f"Error parsing DOCX: {e}")
+        raise ValueError(f"Invalid DOCX document: {e}") from e
+    return "\n".join(lines)
+
+
+# ODT (OpenDocument Text)
+
+ODT_MIME = "application/vnd.oasis.opendocument.text"
+_ODF_TEXT_NS = "{urn:oasis:names:tc:opendocument:xmlns:text:1.0}"
+
+
+def _sniff_odt(data: bytes) -> bool:
+    # ODF stores its MIME type uncompressed as the first archive member
+    return "content.xml" in _zip_names(data) and ODT_MIME.encode() in data[:SNIFF_BYTES]
+
+
+def extract_odt(data: bytes) -> str:
+    """Extract paragraph and heading text from ODT bytes"""
+    blocks = {_ODF_TEXT_NS + "p", _ODF_TEXT_NS + "h"}
+    lines = []
+    try:
+        with zipfile.ZipFile(BytesIO(data)) as archive:
+            with archive.open("content.xml") as content:
+                for _, element in ElementTree.iterparse(content):
+                    if element.tag in blocks:
+                        lines.append("".join(element.itertext()))
+                        element.clear()
+    except (zipfile.BadZipFile, KeyError, ElementTree.ParseError) as e:
+        logger.error(f"Error parsing ODT: {e}")
+        raise ValueError(f"Invalid ODT document: {e}") from e
+    return "\n".join(lines)
+
+
+# RTF
+
+# Groups whose content is metadata, not document text
+_RTF_DESTINATIONS = frozenset(
+    "aftncn aftnsep aftnsepc annotation atnauthor atndate atnicn atnid atnparent "
+    "atnref atntime atrfend atrfstart author background bkmkend bkmkstart blipuid "
+    "buptim category colorschememapping colortbl comment company creatim datafield "
+    "datastore defchp defpap do doccomm docvar dptxbxtext ebcend ebcstart factoidname "
+    "falt fchars ffdeftext ffentrymcr ffexitmcr ffformat ffhelptext ffl ffname "
+    "ffstattext field file filetbl fldinst fldtype fname fontemb fontfile fonttbl "
+    "footer footerf footerl footerr footnote formfield ftncn ftnsep ftnsepc g "
+    "generator gridtbl header headerf headerl headerr hl hlfr hlinkbase hlloc hlsrc "
+    "hsv htmltag info keycode keywords latentstyles lchars levelnumbers leveltext "
+    "lfolevel linkval list listlevel listname listoverride listoverridetable "
+    "listpicture liststylename listtable listtext lsdlockedexcept macc maccPr mailmerge "
+    "maln malnScr manager margPr mbar mbarPr mbaseJc mbegChr mborderBox mborderBoxPr "
+    "mbox mboxPr mchr mcount mctrlPr md mdeg mdegHide mden mdiff mdPr me mendChr "
+    "meqArr meqArrPr mf mfName mfPr mfunc mfuncPr mgroupChr mgroupChrPr mgrow "
+    "mhideBot mhideLeft mhideRight mhideTop mhtmltag mlim mlimloc mlimlow mlimlowPr "
+    "mlimupp mlimuppPr mm mmaddfieldname mmath mmathPict mmathPr mmaxdist mmc mmcJc "
+    "mmconnectstr mmconnectstrdata mmcPr mmcs mmdatasource mmheadersource "
+    "mmmailsubject mmodso mmodsofilter mmodsofldmpdata mmodsomappedname mmodsoname "
+    "mmodsorecipdata mmodsosort mmodsosrc mmodsotable mmodsoudl mmodsoudldata "
+    "mmodsouniquetag mmPr mmquery mmr mnary mnaryPr mnoBreak mnum mobjDist moMath "
+    "moMathPara moMathParaPr mopEmu mphant mphantPr mplcHide mpos mr mrad mradPr mrPr "
+    "msepChr mshow mshp msPre msPrePr msSub msSubPr msSubSup msSubSupPr msSup msSupPr "
+    "mstrikeBLTR mstrikeH mstrikeTLBR mstrikeV msub msubHide msup msupHide mtransp "
+    "mtype mvertJc mvfmf mvfml mvtof mvtol mzeroAsc mzeroDesc mzeroWid nesttableprops "
+    "nextfile nonesttables objalias objclass objdata object objname objsect objtime "
+    "oldcprops oldpprops oldsprops oldtprops oleclsid operator panose password "
+    "passwordhash pgp pgptbl picprop pict pn pnseclvl pntext pntxta pntxtb printim "
+    "private propname protend protstart protusertbl pxe result revtbl revtim rsidtbl "
+    "rxe shp shpgrp shpinst shppict shprslt shptxt sn sp staticval stylesheet subject "
+    "sv svb tc template themedata title txe ud upr userprops wgrffmtfilter "
+    "windowcaption writereservation writereservhash xe xform xmlattrname xmlattrvalue "
+    "xmlclose xmlname xmlnstbl xmlopen".split()
+)
+_RTF_SPECIAL = {
+    "par": "\n",
+    "sect": "\n\n",
+    "page": "\n\n",
+    "line": "\n",
+    "tab": "\t",
+    "emdash": "—",
+    "endash": "–",
+    "emspace": " ",
+    "enspace": " ",
+    "qmspace": " ",
+    "bullet": "•",
+    "lquote": "‘",
+    "rquote": "’",
+    "ldblquote": "“",
+    "rdblquote": "”",
+}
+
+
+def _sniff_rtf(data: bytes) -> bool:
+    return data.lstrip()[:5] == b"{\\rtf"
+
+
+def extract_rtf(data: bytes) -> str:
+    """Extract text from RTF bytes, skipping metadata groups"""
+    # RTF is 7-bit; anything else arrives as escapes handled below
+    rtf = data.decode("latin-1")
+    stack = []
+    ignorable = False
+    unicode_skip = 1  # Fallback characters that follow a \u escape
+    pending_skip = 0
+    out = []
+
+    for match in patterns.RTF_TOKEN.finditer(rtf):
+        word, arg, hex_code, symbol, brace, char = match.groups()
+        if brace:
+            pending_skip = 0
+            if brace == "{":
+                stack.append((unicode_skip, ignorable))
+            elif stack:
+                unicode_skip, ignorable = stack.pop()
+        elif symbol:
+            pending_skip = 0
+            if symbol == "*":
+                ignorable = True
+            elif not ignorable:
+                if symbol == "~":
+                    out.append("\xa0")
+                elif symbol in "{}\\":
+                    out.append(symbol)
+                elif symbol in "\r\n":
+                    out.append("\n")
+        elif word:
+            pending_skip = 0
+            if word in _RTF_DESTINATIONS:
+                ignorable = True
+            elif ignorable:
+                continue
+            elif word in _RTF_SPECIAL:
+                out.append(_RTF_SPECIAL[word])
+            elif word == "uc":
+                unicode_skip = int(arg or 1)
+            elif word == "u" and arg:
+                code = int(arg)
+                out.append(chr(code + 0x10000 if code < 0 else code))
+                pending_skip = unicode_skip
+        elif hex_code:
+            if pending_skip > 0:
+                pending_skip -= 1
+            elif not ignorable:
+                out.append(bytes([int(hex_code, 16)]).decode("cp1252", errors="replace"))
+        elif char:
+            if pending_skip > 0:
+                pending_skip -= 1
+            elif not ignorable:
+                out.append(char)
+
+    return "".join(out)
+
+
+# HTML
+
+
+class _HTMLTextParser(HTMLParser):
+    """Collects visible text, breaking lines at block-level elements"""
+
+    BLOCK_TAGS = frozenset(
+        "address article aside blockquote br dd div dl dt footer h1 h2 h3 h4 h5 h6 "
+        "header hr li main nav ol p pre section table td th tr ul".split()
+    )
+    HIDDEN_TAGS = frozenset({"script", "style", "head", "template", "noscript"})
+
+    def __init__(self):
+        super().__init__(convert_charrefs=True)
+        self.parts: List[str] = []
+        self._hidden_depth = 0
+
+    def handle_starttag(self, tag, attrs):
+        if tag in self.HIDDEN_TAGS:
+            self._hidden_depth += 1
+        elif tag in self.BLOCK_TAGS:
+            self.parts.append("\n")
+        if tag == "li" and not self._hidden_depth:
+            self.parts.append("• ")
+
+    def handle_endtag(self, tag):
+        if tag in self.HIDDEN_TAGS:
+            self._hidden_depth = max(0, self._hidden_depth - 1)
+        elif tag in self.BLOCK_TAGS:
+            self.parts.append("\n")
+
+    def handle_data(self, data):
+        if not self._hidden_depth:
+            self.parts.append(data)
+
+
+def _sniff_html(data: bytes) -> bool:
+    head = data[:SNIFF_BYTES]
+    if head.startswith(b"\xef\xbb\xbf"):
+        head = head[3:]
+    return patterns.HTML_DOCUMENT.match(head) is not None
+
+
+def extract_html(data: bytes) -> str:
+    """Extract visible text from HTML bytes"""
+    parser = _HTMLTextParser()
+    parser.feed(decode_text(data))
+    parser.close()
+    lines = (line.strip() for line in "".join(parser.parts).split("\n"))
+    return patterns.BLANK_LINES.sub("\n\n", "\n".join(lines)).strip()
+
+
+# Plain text
+
+
+def extract_text(data: bytes) -> ExtractedText:
+    """Decode plain text bytes, reporting the detected encoding"""
+    text, encoding = decode_text_with_encoding(data)
+    return ExtractedText(text, encoding=encoding)
+
+
+# Built-in formats. Sniffing follows registration order, so the ZIP-based
+# formats are checked by member names and HTML before any text fallback.
+register_extractor(
+    Extractor(
+        name="pdf",
+        extract=extract_pdf,
+        cost="expensive",
+        paged=True,
+        extensions=(".pdf",),
+        mime_types=("application/pdf",),
+        sniff=_sniff_pdf,
+    )
+)
+register_extractor(
+    Extractor(
+        name="docx",
+        extract=extract_docx,
+        cost="moderate",
+        extensions=(".docx",),
+        mime_types=(
+            "application/vnd.openxmlformats-officedocument.wordprocessingml.document",
+        ),
+        sniff=_sniff_docx,
+    )
+)
+register_extractor(
+    Extractor(
+        name="odt",
+        extract=extract_odt,
+        cost="moderate",
+        extensions=(".odt",),
+        mime_types=(ODT_MIME,),
+        sniff=_sniff_odt,
+    )
+)
+register_extractor(
+    Extractor(
+        name="rtf",
+        extract=extract_rtf,
+        cost="cheap",
+        extensions=(".rtf",),
+        mime_types=("application/rtf", "text/rtf"),
+        sniff=_sniff_rtf,
+    )
+)
+register_extractor(
+    Extractor(
+        name="html",
+        extract=extract_html,
+        cost="cheap",
+        extensions=(".html", ".htm"),
+        mime_types=("text/html", "application/xhtml+xml"),
+        sniff=_sniff_html,
+    )
+)
+register_extractor(
+    Extractor(
+        name="text",
+        extract=extract_text,
+        cost="cheap",
+        extensions=(".txt",),
+        mime_types=("text/plain",),
+    )
+)
@@ -3,14 +3,80 @@
 Job Description Parser Module - Extracts structured requirements from job descriptions
 """
 
-import re
-import spacy
-from typing import List, Dict, Optional
-from dataclasses import dataclass
+import json
+from typing import Any, Iterable, List, Dict, NamedTuple, Optional, Tuple, Union
+from pathlib import Path
+from dataclasses import dataclass, asdict, field
 import logging
 
+from . import patterns
+from .nlp import get_nlp
+from .sections import SectionMap, segment_job_description
+
 logger = logging.getLogger(__name__)
 
+# Bump whenever extraction output changes so stored parsed jobs are recompiled
+JD_PARSER_VERSION = "1"
+
+EXPERIENCE_NOT_SPECIFIED = "Experience level not specified"
+
+# Phrases that introduce a skill in running text, as in "knowledge of SQL"
+DEFAULT_SKILL_INDICATORS = (
+    "experience with",
+    "knowledge of",
+    "proficiency in",
+    "familiarity with",
+    "expertise in",
+    "skilled in",
+    "background in",
+    "understanding of",
+)
+
+
+class YearsMention(NamedTuple):
+    """One "N years" phrase in a job description"""
+
+    years: int
+    start: int
+    end: int
+    qualifier: Optional[str]  # "experience", "minimum of" or "at least"
+    skill: Optional[str]  # What the years are of, as in "5+ years of Python"
+
+
+def find_years(text: str) -> List[YearsMention]:
+    """Every "N years" phrase in the text, from a single scan"""
+    mentions = []
+    skill_end = 0
+    for match in patterns.JD_YEARS.finditer(text):
+        qualifier = match.group(1)
+        start, end = match.start(), match.end()
+        tail = patterns.JD_YEARS_EXPERIENCE_TAIL.match(text, end)
+        if tail:
+            # "5 years of experience" outranks the prefix, as it always has
+            qualifier, start, end = "experience", match.start(2), tail.end()
+        elif qualifier:
+            qualifier = " ".join(qualifier.lower().split())
+
+        skill = None
+        if match.start(2) >= skill_end:  # Not inside the previous skill phrase
+            skill_tail = patterns.JD_YEARS_SKILL_TAIL.match(text, match.end())
+            if skill_tail:
+                skill, skill_end = skill_tail.group(1), skill_tail.end()
+        mentions.append(YearsMention(int(match.group(2)), start, end, qualifier, skill))
+    return mentions
+
+
+def years_from_requirement(text: str) -> int:
+    """Years in a free-form requirement like '3+ years' or 'at least 4 years'"""
+    if not text:
+        return 0
+    text = text.lower()
+    for pattern in patterns.REQUIRED_YEARS:
+        match = pattern.search(text)
+        if match:
+            return int(match.group(1))
+    return 0
+
 
 @dataclass
 class JobDescription:
@@ -26,26 +92,40 @@ class JobDescription:
     company: Optional[str] = None
     location: Optional[str] = None
     salary_range: Optional[str] = None
+    # Years of experience required, 0 if none; derived from
+    # experience_requirements when not given
+    required_years: Optional[int] = None
+    # Section type -> (start, end) spans into raw_text, in text order
+    sections: Dict[str, List[Tuple[int, int]]] = field(default_factory=dict)
+
+    def __post_init__(self):
+        if self.required_years is None:
+            self.required_years = years_from_requirement(self.experience_requirements)
+
+    def to_dict(self) -> Dict[str, Any]:
+        """Convert to a JSON-serializable dictionary"""
+        return asdict(self)
+
+    @classmethod
+    def from_dict(cls, data: Dict[str, Any]) -> "JobDescription":
+        """Rebuild a job description from the output of to_dict"""
+        data = dict(data)
+        data["sections"] = {
+            name: [tuple(span) for span in spans]
+            for name, spans in data.get("sections", {}).items()
+        }
+        return cls(**data)
 
 
 class JobDescriptionParser:
     """Parser for job descriptions"""
 
-    def __init__(self):
-        """Initialize parser with NLP model"""
-        self.nlp = self._load_spacy_model()
-
-        # Common skill keywords
-        self.skill_indicators = [
-            "experience with",
-            "knowledge of",
-            "proficiency in",
-            "familiarity with",
-            "expertise in",
-            "skilled in",
-            "background in",
-            "understanding of",
-        ]
+    def __init__(self, skill_indicators: Optional[Iterable[str]] = None):
+        """Initialize parser with extraction keywords"""
+        # Common skill keywords, matched by one compiled alternation
+        self.skill_indicators = (
+            DEFAULT_SKILL_INDICATORS if skill_indicators is None else skill_indicators
+        )
 
         # Education keywords
         self.education_keywords = [
@@ -73,16 +153,42 @@ class JobDescriptionParser:
             "history",
         ]
 
-    def _load_spacy_model(self):
-        """Load spaCy NLP model"""
-        try:
-            return spacy.load("en_core_web_sm")
-        except OSError:
-            logger.warning("spaCy model not found. Some features may be limited.")
-            return None
+    @property
+    def skill_indicators(self) -> Tuple[str, ...]:
+        """Phrases that introduce a skill in running text"""
+        return self._skill_indicators[0]
+
+    @skill_indicators.setter
+    def skill_indicators(self, indicators: Iterable[str]) -> None:
+        """Replace the indicators and recompile their matcher"""
+        indicators = tuple(i.strip() for i in indicators if i.strip())
+        # Swapped as one pair so concurrent parses never see a mismatch
+        self._skill_indicators = (
+            indicators,
+            patterns.compile_indicator_alternation(indicators),
+        )
+
+    def load_skill_indicators(self, path: Union[str, Path]) -> Tuple[str, ...]:
+        """Reload the indicators from a JSON list of phrases"""
+        with open(path, "r") as f:
+            indicators = json.load(f)
+        if not isinstance(indicators, list) or not all(
+            isinstance(i, str) for i in indicators
+        ):
+            raise ValueError(f"{path} does not contain a list of indicator phrases")
+        self.skill_indicators = indicators
+        return self.skill_indicators
+
+    @property
+    def nlp(self):
+        """Shared spaCy model, loaded on first use"""
+        return get_nlp()
 
     def parse_job_description(self, jd_text: str) -> JobDescription:
         """Main method to parse job description"""
+        # Segment the text and find its "N years" phrases once for all extractors
+        sections = segment_job_description(jd_text)
+        years = find_years(jd_text)
 
         # Extract basic information
         title = self.extract_job_title(jd_text)
@@ -91,42 +197,40 @@ class JobDescriptionParser:
         salary_range = self.extract_salary_range(jd_text)
 
         # Extract requirements
-        required_skills = self.extract_required_skills(jd_text)
-        preferred_skills = self.extract_preferred_skills(jd_text)
+        required_skills = self.extract_required_skills(jd_text, sections, years)
+        preferred_skills = self.extract_preferred_skills(jd_text, sections)
         education_requirements = self.extract_education_requirements(jd_text)
-        experience_requirements = self.extract_experience_requirements(jd_text)
-        responsibilities = self.extract_responsibilities(jd_text)
+        experience = self._experience_requirement(jd_text, years)
+        responsibilities = self.extract_responsibilities(jd_text, sections)
 
         return JobDescription(
             title=title,
             required_skills=required_skills,
             preferred_skills=preferred_skills,
             education_requirements=education_requirements,
-            experience_requirements=experience_requirements,
+            experience_requirements=(
+                jd_text[experience.start : experience.end].strip()
+                if experience
+                else EXPERIENCE_NOT_SPECIFIED
+            ),
             responsibilities=responsibilities,
             raw_text=jd_text,
             company=company,
             location=location,
             salary_range=salary_range,
+            required_years=experience.years if experience else 0,
+            sections=_section_spans(sections),
         )
 
     def extract_job_title(self, text: str) -> str:
         """Extract job title from job description"""
         # Look for common title patterns
-        title_patterns = [
-            r"^([^\n]+)(?:\n|$)",  # First line
-            r"(?i)(?:position|role|title):\s*([^\n]+)",
-            r"(?i)job\s+title:\s*([^\n]+)",
-            r"(?i)we\s+are\s+looking\s+for\s+a\s+([^\n,.]+)",
-            r"(?i)seeking\s+(?:a|an)\s+([^\n,.]+)",
-        ]
-
-        for pattern in title_patterns:
-            match = re.search(pattern, text)
+        for pattern in patterns.JD_TITLES:
+            match = pattern.search(text)
             if match:
                 title = match.group(1).strip()
                 # Clean up title
-                title = re.sub(r"[^\w\s-]", "", title)
+                title = patterns.JD_TITLE_CLEANUP.sub("", title)
                 if len(title) > 5 and len(title) < 100:
                     return title
 
@@ -134,14 +238,8 @@ class JobDescriptionParser:
 
     def extract_company_name(self, text: str) -> Optional[str]:
         """Extract company name"""
-        company_patterns = [
-            r"(?i)company:\s*([^\n]+)",
-            r"(?i)at\s+([A-Z][a-zA-Z\s&]+)(?:\s+we|\s+is|\s+has)",
-            r"(?i)([A-Z][a-zA-Z\s&]+)\s+is\s+(?:seeking|looking)",
-        ]
-
-        for pattern in company_patterns:
-            match = re.search(pattern, text)
+        for pattern in patterns.JD_COMPANIES:
+            match = pattern.search(text)
             if match:
                 company = match.group(1).strip()
                 if len(company) > 2 and len(company) < 50:
@@ -151,15 +249,8 @@ class JobDescriptionParser:
 
     def extract_location(self, text: str) -> Optional[str]:
         """Extract job location"""
-        location_patterns = [
-            r"(?i)location:\s*([^\n]+)",
-            r"(?i)based\s+in\s+([^\n,.]+)",
-            r"(?i)([A-Z][a-z]+,\s*[A-Z]{2})",  # City, State
-            r"(?i)(remote|hybrid|on-site)",
-        ]
-
-        for pattern in location_patterns:
-            match = re.search(pattern, text)
+        for pattern in patterns.JD_LOCATIONS:
+            match = pattern.search(text)
             if match:
                 return match.group(1).strip()
 
@@ -167,67 +258,44 @@ class JobDescriptionParser:
 
     def extract_salary_range(self, text: str) -> Optional[str]:
         """Extract salary information"""
-        salary_patterns = [
-            r"(?i)\$[\d,]+\s*-\s*\$[\d,]+",
-            r"(?i)\$[\d,]+k?\s*(?:per\s+year|annually|yearly)?",
-            r"(?i)salary:\s*([^\n]+)",
-            r"(?i)compensation:\s*([^\n]+)",
-        ]
-
-        for pattern in salary_patterns:
-            match = re.search(pattern, text)
+        for pattern in patterns.JD_SALARIES:
+            match = pattern.search(text)
             if match:
                 return match.group().strip()
 
         return None
 
-    def extract_required_skills(self, text: str) -> List[str]:
+    def extract_required_skills(
+        self,
+        text: str,
+        sections: Optional[SectionMap] = None,
+        years: Optional[List[YearsMention]] = None,
+    ) -> List[str]:
         """Extract required skills and qualifications"""
         required_skills = []
 
-        # Look for required skills section
-        required_patterns = [
-            r"(?i)(?:required|must\s+have|essential).*?(?=(?:preferred|nice|bonus)|(?:\n\s*\n)|$)",
-            r"(?i)requirements.*?(?=(?:preferred|responsibilities)|(?:\n\s*\n)|$)",
-            r"(?i)qualifications.*?(?=(?:preferred|responsibilities)|(?:\n\s*\n)|$)",
-        ]
-
-        for pattern in required_patterns:
-            match = re.search(pattern, text, re.DOTALL)
-            if match:
-                section_text = match.group()
-                skills = self._extract_skills_from_section(section_text)
-                required_skills.extend(skills)
+        # Skills listed in the requirements sections
+        for section_text in _section_bodies(text, sections, "requirements"):
+            required_skills.extend(self._extract_skills_from_section(section_text))
 
         # Also look for "X+ years" requirements
-        experience_skills = re.findall(
-            r"(\d+)\+?\s*years?\s+(?:of\s+)?(?:experience\s+(?:with|in)\s+)?([^\n,.]+)",
-            text,
-            re.IGNORECASE,
-        )
-        for years, skill in experience_skills:
-            skill = skill.strip().lower()
+        if years is None:
+            years = find_years(text)
+        for mention in years:
+            skill = (mention.skill or "").strip().lower()
             if skill and len(skill) > 2:
                 required_skills.append(skill)
 
         return list(set([skill.lower() for skill in required_skills if skill]))
 
-    def extract_preferred_skills(self, text: str) -> List[str]:
+    def extract_preferred_skills(
+        self, text: str, sections: Optional[SectionMap] = None
+    ) -> List[str]:
         """Extract preferred/nice-to-have skills"""
         preferred_skills = []
 
-        # Look for preferred skills section
-        preferred_patterns = [
-            r"(?i)(?:preferred|nice\s+to\s+have|bonus|plus|additional).*?(?=(?:\n\s*\n)|$)",
-            r"(?i)(?:would\s+be\s+)?(?:great|nice|good)\s+(?:if|to\s+have).*?(?=(?:\n\s*\n)|$)",
-        ]
-
-        for pattern in preferred_patterns:
-            match = re.search(pattern, text, re.DOTALL)
-            if match:
-                section_text = match.group()
-                skills = self._extract_skills_from_section(section_text)
-                preferred_skills.extend(skills)
+        for section_text in _section_bodies(text, sections, "preferred"):
+            preferred_skills.extend(self._extract_skills_from_section(section_text))
 
         return list(set([skill.lower() for skill in preferred_skills if skill]))
 
@@ -236,32 +304,30 @@ class JobDescriptionParser:
         skills = []
 
         # Extract bullet points
-        bullet_pattern = r"[-•*]\s*([^\n]+)"
-        bullets = re.findall(bullet_pattern, section_text)
+        bullets = patterns.BULLET_ITEM.findall(section_text)
         for bullet in bullets:
             # Clean and split skills
-            bullet = re.sub(
-                r"(?i)(?:experience\s+(?:with|in)|knowledge\s+of|proficiency\s+in)",
-                "",
-                bullet,
-            )
+            bullet = patterns.JD_SKILL_PREFIX.sub("", bullet)
             bullet = bullet.strip()
             if bullet:
                 # Split on common delimiters
-                sub_skills = re.split(r"[,;&/]", bullet)
+                sub_skills = patterns.JD_SKILL_DELIMITERS.split(bullet)
                 for skill in sub_skills:
                     skill = skill.strip()
                     if len(skill) > 2 and len(skill) < 50:
                         skills.append(skill)
 
-        # Extract from natural language
-        for indicator in self.skill_indicators:
-            pattern = rf"{indicator}\s+([^,.;\n]+)"
-            matches = re.findall(pattern, section_text, re.IGNORECASE)
-            for match in matches:
-                skill = match.strip()
-                if len(skill) > 2 and len(skill) < 50:
-                    skills.append(skill)
+        # Extract from natural language in one scan for all indicators
+        indicators, pattern = self._skill_indicators
+        ends = [0] * len(indicators)
+        for match in pattern.finditer(section_text):
+            indicator = int(match.lastgroup[1:])
+            if match.start() < ends[indicator]:
+                continue  # Inside this indicator's previous phrase
+            ends[indicator] = match.end(match.lastindex)
+            skill = match.group(match.lastindex + 1).strip()
+            if len(skill) > 2 and len(skill) < 50:
+                skills.append(skill)
 
         return skills
 
@@ -270,19 +336,8 @@ class JobDescriptionParser:
         education_requirements = []
 
         # Look for education mentions
-        edu_patterns = [
-            r"(?i)(bachelor\'?s?\s+degree)",
-            r"(?i)(master\'?s?\s+degree)",
-            r"(?i)(phd|doctorate)",
-            r"(?i)(associate\'?s?\s+degree)",
-            r"(?i)(b\.?[as]\.?)",
-            r"(?i)(m\.?[as]\.?)",
-            r"(?i)degree\s+in\s+([^\n,.]+)",
-            r"(?i)(certification\s+in\s+[^\n,.]+)",
-        ]
-
-        for pattern in edu_patterns:
-            matches = re.findall(pattern, text)
+        for pattern in patterns.JD_EDUCATION:
+            matches = pattern.findall(text)
             for match in matches:
                 if isinstance(match, tuple):
                     match = match[0]
@@ -290,41 +345,55 @@ class JobDescriptionParser:
 
         return list(set(education_requirements))
 
-    def extract_experience_requirements(self, text: str) -> str:
+    def extract_experience_requirements(
+        self, text: str, years: Optional[List[YearsMention]] = None
+    ) -> str:
         """Extract experience requirements"""
-        exp_patterns = [
-            r"(\d+)\+?\s*years?\s+(?:of\s+)?experience",
-            r"minimum\s+of\s+(\d+)\s+years?",
-            r"at\s+least\s+(\d+)\s+years?",
-            r"(\d+)-(\d+)\s+years?\s+(?:of\s+)?experience",
-        ]
-
-        for pattern in exp_patterns:
-            match = re.search(pattern, text, re.IGNORECASE)
-            if match:
-                return match.group().strip()
-
-        return "Experience level not specified"
+        mention = self._experience_requirement(text, years)
+        if mention is None:
+            return EXPERIENCE_NOT_SPECIFIED
+        return text[mention.start : mention.end].strip()
+
+    @staticmethod
+    def _experience_requirement(
+        text: str, years: Optional[List[YearsMention]] = None
+    ) -> Optional[YearsMention]:
+        """The "N years" phrase that states the experience requirement"""
+        if years is None:
+            years = find_years(text)
+        for qualifier in ("experience", "minimum of", "at least"):
+            for mention in years:
+                if mention.qualifier == qualifier:
+                    return mention
+        return None
 
-    def extract_responsibilities(self, text: str) -> List[str]:
+    def extract_responsibilities(
+        self, text: str, sections: Optional[SectionMap] = None
+    ) -> List[str]:
         """Extract job responsibilities"""
         responsibilities = []
 
-        # Look for responsibilities section
-        resp_patterns = [
-            r"(?i)(?:responsibilities|duties|role).*?(?=(?:requirements|qualifications)|(?:\n\s*\n)|$)",
-            r"(?i)(?:you\s+will|what\s+you\'ll\s+do).*?(?=(?:requirements|qualifications)|(?:\n\s*\n)|$)",
-        ]
+        for section_text in _section_bodies(text, sections, "responsibilities"):
+            # Extract bullet points
+            bullets = patterns.BULLET_ITEM.findall(section_text)
+            responsibilities.extend(
+                [bullet.strip() for bullet in bullets if bullet.strip()]
+            )
 
-        for pattern in resp_patterns:
-            match = re.search(pattern, text, re.DOTALL)
-            if match:
-                section_text = match.group()
+        return responsibilities
 
-                # Extract bullet points
-                bullets = re.findall(r"[-•*]\s*([^\n]+)", section_text)
-                responsibilities.extend(
-                    [bullet.strip() for bullet in bullets if bullet.strip()]
-                )
 
-        return responsibilities
+def _section_bodies(text: str, sections: Optional[SectionMap], name: str) -> List[str]:
+    """Bodies of every section of a type, segmenting the text first if no map was given"""
+    if sections is None:
+        sections = segment_job_description(text)
+    return [text[section.body_start : section.end] for section in sections.all(name)]
+
+
+def _section_spans(sections: SectionMap) -> Dict[str, List[Tuple[int, int]]]:
+    """(start, end) spans of each typed section, for JobDescription.sections"""
+    spans: Dict[str, List[Tuple[int, int]]] = {}
+    for section in sections:
+        if section.name != "other":
+            spans.setdefault(section.name, []).append((section.start, section.end))
+    return spans
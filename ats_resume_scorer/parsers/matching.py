@@ -0,0 +1,133 @@
+# ats_resume_scorer/parsers/matching.py
+"""
+Hardened Matching - Linear-time stand-ins for backtracking-prone resume patterns
+
+The job-entry, comma-list and email patterns backtrack super-linearly on
+long lines that almost match, so a crafted upload could pin a worker for
+minutes. The helpers here produce the same matches on ordinary resumes by
+scanning lines and tokens in Python, and check a per-document
+``MatchBudget`` as they go so that even unforeseen slow input is cut off.
+"""
+
+import logging
+import re
+import time
+from typing import List, Optional, Tuple
+
+from . import patterns
+
+logger = logging.getLogger(__name__)
+
+# Seconds of matching allowed per resume
+DEFAULT_MATCH_BUDGET = 1.0
+
+# Longest whitespace-free token searched for an email address; real
+# addresses are capped at 254 characters
+MAX_EMAIL_TOKEN = 320
+
+# A line that starts a new job description block, as in the legacy pattern
+_NEW_ENTRY = re.compile(r"[A-Z]")
+
+JobEntry = Tuple[str, str, str, str]  # title, company, duration, description
+
+
+class MatchBudget:
+    """Wall-clock allowance shared by the matching calls for one document"""
+
+    def __init__(self, seconds: Optional[float] = DEFAULT_MATCH_BUDGET):
+        """Start the clock; ``None`` never expires"""
+        self.seconds = seconds
+        self.deadline = time.monotonic() + seconds if seconds is not None else None
+        self.exhausted = False
+
+    def expired(self) -> bool:
+        """Whether the budget is spent, logging the first time it is"""
+        if self.exhausted:
+            return True
+        if self.deadline is not None and time.monotonic() >= self.deadline:
+            logger.warning(f"Resume matching budget of {self.seconds}s spent")
+            self.exhausted = True
+        return self.exhausted
+
+
+def _expired(budget: Optional[MatchBudget]) -> bool:
+    return budget is not None and budget.expired()
+
+
+def find_emails(text: str, budget: Optional[MatchBudget] = None) -> List[str]:
+    """Email addresses in text, matched token by token
+
+    Addresses never contain whitespace, so only tokens holding an ``@`` are
+    searched and each search is bounded by the token length.
+    """
+    emails: List[str] = []
+    for token in text.split():
+        if "@" not in token or len(token) > MAX_EMAIL_TOKEN:
+            continue
+        if _expired(budget):
+            break
+        emails.extend(patterns.EMAIL.findall(token))
+    return emails
+
+
+def comma_items(text: str, budget: Optional[MatchBudget] = None) -> List[str]:
+    """Comma-terminated items, plus the trailing item of the text
+
+    Matches what ``([^,\\n]+)(?:,|$)`` finds, in one pass: on each line the
+    pieces followed by a comma, and on the last line its final piece too.
+    """
+    items: List[str] = []
+    lines = text.split("\n")
+    if len(lines) > 1 and lines[-1] == "":
+        lines.pop()  # "$" also matches before a final newline
+    last = len(lines) - 1
+    for number, line in enumerate(lines):
+        if _expired(budget):
+            break
+        pieces = line.split(",")
+        if number != last:
+            pieces.pop()
+        items.extend(piece for piece in pieces if piece)
+    return items
+
+
+def job_entries(text: str, budget: Optional[MatchBudget] = None) -> List[JobEntry]:
+    """``Title | Company | Duration`` entries and the description under each
+
+    A line with at least two pipes opens an entry. Its description always
+    takes the next line, then every following line up to one that starts
+    with a capital letter or is blank. This is the legacy ``JOB_ENTRY``
+    pattern read line by line, so an entry header must fit on one line.
+    """
+    entries: List[JobEntry] = []
+    lines = text.split("\n")
+    last = len(lines) - 1
+    number = 0
+    while number <= last:
+        if _expired(budget):
+            break
+        line = lines[number]
+        number += 1
+        if line.count("|") < 2:
+            continue
+        title, company, duration = line.rsplit("|", 2)
+        if not title or not company or not duration.strip():
+            continue
+
+        description: List[str] = []
+        if number <= last:
+            description.append(lines[number])
+            number += 1
+            while number <= last and not _ends_description(lines[number], number == last):
+                description.append(lines[number])
+                number += 1
+        entries.append((title, company, duration, "\n".join(description)))
+    return entries
+
+
+def _ends_description(line: str, is_last: bool) -> bool:
+    """Whether a line stops the description above it"""
+    if _NEW_ENTRY.match(line):
+        return True
+    # A blank line, unless it's trailing whitespace at the very end
+    return not line.strip() and (not is_last or not line)
@@ -0,0 +1,64 @@
+# ats_resume_scorer/parsers/nlp.py
+"""
+Shared NLP Model Provider - Lazily loads one spaCy pipeline per process
+"""
+
+import logging
+import threading
+from typing import Any, Dict
+
+logger = logging.getLogger(__name__)
+
+DEFAULT_MODEL = "en_core_web_sm"
+
+_models: Dict[str, Any] = {}
+_lock = threading.Lock()
+
+
+def get_nlp(model_name: str = DEFAULT_MODEL) -> Any:
+    """Return the shared spaCy pipeline, loading it on first use
+
+    Every parser in the process shares the same pipeline. Nothing is
+    imported or loaded until a code path actually asks for it, and a
+    missing spaCy install or model is remembered as ``None`` so the
+    load is not retried on every call.
+    """
+    try:
+        return _models[model_name]
+    except KeyError:
+        pass
+
+    with _lock:
+        # Another thread may have finished loading while we waited
+        if model_name not in _models:
+            _models[model_name] = _load_model(model_name)
+        return _models[model_name]
+
+
+def is_nlp_loaded(model_name: str = DEFAULT_MODEL) -> bool:
+    """Check whether a load has been attempted for the given model"""
+    return model_name in _models
+
+
+def clear_nlp_cache() -> None:
+    """Drop every loaded pipeline (mainly useful for tests)"""
+    with _lock:
+        _models.clear()
+
+
+def _load_model(model_name: str) -> Any:
+    """Import spaCy and load a pipeline, returning None if unavailable"""
+    try:
+        import spacy
+    except ImportError:
+        logger.warning("spaCy not installed. Some features may be limited.")
+        return None
+
+    try:
+        logger.info(f"Loading spaCy model: {model_name}")
+        return spacy.load(model_name)
+    except OSError:
+        logger.warning(
+            f"spaCy model not found. Install with: python -m spacy download {model_name}"
+        )
+        return None
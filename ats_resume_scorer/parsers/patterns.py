@@ -0,0 +1,171 @@
+# ats_resume_scorer/parsers/patterns.py
+"""
+Regex Pattern Registry - Precompiled patterns shared by the parsers and scoring engine
+
+Every pattern used on the hot path is compiled once at import time so that
+parsing and scoring never go through the ``re`` module cache. Under load,
+and with more than 512 distinct patterns alive in a process, that cache
+gets thrashed and patterns are silently recompiled.
+"""
+
+import re
+from functools import lru_cache
+from typing import Iterable, Pattern, Tuple
+
+# Shared helpers
+BULLET_ITEM = re.compile(r"[-•*]\s*([^\n]+)")
+YEAR = re.compile(r"(\d{4})")
+
+# Resume contact information
+EMAIL = re.compile(r"\b[A-Za-z0-9._%+-]+@[A-Za-z0-9.-]+\.[A-Z|a-z]{2,}\b")
+PHONES = (
+    re.compile(r"(\+\d{1,3}[-.\s]?)?\(?\d{3}\)?[-.\s]?\d{3}[-.\s]?\d{4}"),
+    re.compile(r"\+\d{1,3}\s?\d{1,14}"),
+    re.compile(r"\(\d{3}\)\s?\d{3}-\d{4}"),
+)
+LINKEDIN = re.compile(r"linkedin\.com/in/[\w-]+")
+GITHUB = re.compile(r"github\.com/[\w-]+")
+WEBSITE = re.compile(r"https?://[\w.-]+\.[a-zA-Z]{2,}")
+
+# Resume sections, sliced out by sections.segment_text; job entries and
+# comma lists are scanned by matching.py instead of by pattern
+DEGREES = (
+    re.compile(r"((?:Bachelor|Master|PhD|Doctorate|Associate).*?)(?:\n|$)", re.I),
+    re.compile(r"(B\.?[AS]\.?.*?)(?:\n|$)", re.I),
+    re.compile(r"(M\.?[AS]\.?.*?)(?:\n|$)", re.I),
+)
+CERTIFIED_LINE = re.compile(r"(?i)certified[^\n]*")
+
+# Job description fields
+JD_TITLES = (
+    re.compile(r"^([^\n]+)(?:\n|$)"),  # First line
+    re.compile(r"(?i)(?:position|role|title):\s*([^\n]+)"),
+    re.compile(r"(?i)job\s+title:\s*([^\n]+)"),
+    re.compile(r"(?i)we\s+are\s+looking\s+for\s+a\s+([^\n,.]+)"),
+    re.compile(r"(?i)seeking\s+(?:a|an)\s+([^\n,.]+)"),
+)
+JD_TITLE_CLEANUP = re.compile(r"[^\w\s-]")
+JD_COMPANIES = (
+    re.compile(r"(?i)company:\s*([^\n]+)"),
+    re.compile(r"(?i)at\s+([A-Z][a-zA-Z\s&]+)(?:\s+we|\s+is|\s+has)"),
+    re.compile(r"(?i)([A-Z][a-zA-Z\s&]+)\s+is\s+(?:seeking|looking)"),
+)
+JD_LOCATIONS = (
+    re.compile(r"(?i)location:\s*([^\n]+)"),
+    re.compile(r"(?i)based\s+in\s+([^\n,.]+)"),
+    re.compile(r"(?i)([A-Z][a-z]+,\s*[A-Z]{2})"),  # City, State
+    re.compile(r"(?i)(remote|hybrid|on-site)"),
+)
+JD_SALARIES = (
+    re.compile(r"(?i)\$[\d,]+\s*-\s*\$[\d,]+"),
+    re.compile(r"(?i)\$[\d,]+k?\s*(?:per\s+year|annually|yearly)?"),
+    re.compile(r"(?i)salary:\s*([^\n]+)"),
+    re.compile(r"(?i)compensation:\s*([^\n]+)"),
+)
+# A number of years, optionally led by "minimum of" / "at least"; the tails
+# are matched where it ends to tell experience requirements and skills apart
+JD_YEARS = re.compile(r"(?:(minimum\s+of|at\s+least)\s+)?(\d+)\+?\s*years?", re.IGNORECASE)
+JD_YEARS_EXPERIENCE_TAIL = re.compile(r"\s+(?:of\s+)?experience", re.IGNORECASE)
+JD_YEARS_SKILL_TAIL = re.compile(
+    r"\s+(?:of\s+)?(?:experience\s+(?:with|in)\s+)?([^\n,.]+)", re.IGNORECASE
+)
+# Years in a free-form experience requirement string
+REQUIRED_YEARS = (
+    re.compile(r"(\d+)\+?\s*years?"),
+    re.compile(r"minimum\s+of\s+(\d+)"),
+    re.compile(r"at\s+least\s+(\d+)"),
+    re.compile(r"(\d+)-\d+\s*years?"),
+)
+JD_SKILL_PREFIX = re.compile(
+    r"(?i)(?:experience\s+(?:with|in)|knowledge\s+of|proficiency\s+in)"
+)
+JD_SKILL_DELIMITERS = re.compile(r"[,;&/]")
+JD_EDUCATION = (
+    re.compile(r"(?i)(bachelor\'?s?\s+degree)"),
+    re.compile(r"(?i)(master\'?s?\s+degree)"),
+    re.compile(r"(?i)(phd|doctorate)"),
+    re.compile(r"(?i)(associate\'?s?\s+degree)"),
+    re.compile(r"(?i)(b\.?[as]\.?)"),
+    re.compile(r"(?i)(m\.?[as]\.?)"),
+    re.compile(r"(?i)degree\s+in\s+([^\n,.]+)"),
+    re.compile(r"(?i)(certification\s+in\s+[^\n,.]+)"),
+)
+
+# File format extraction
+RTF_TOKEN = re.compile(
+    r"\\([a-z]{1,32})(-?\d{1,10})?[ ]?|\\'([0-9a-f]{2})|\\([^a-z])|([{}])|[\r\n]+|(.)",
+    re.IGNORECASE | re.DOTALL,
+)
+HTML_DOCUMENT = re.compile(
+    rb"^\s*(?:<!--.*?-->\s*)*<(?:!doctype\s+html|html)\b", re.IGNORECASE | re.DOTALL
+)
+BLANK_LINES = re.compile(r"\n\s*\n\s*\n+")
+C1_BYTES = re.compile(rb"[\x80-\x9f]")
+CP1252_UNDEFINED = re.compile(rb"[\x81\x8d\x8f\x90\x9d]")
+DOCX_HEADER_PART = re.compile(r"word/header\d*\.xml$")
+DOCX_FOOTER_PART = re.compile(r"word/footer\d*\.xml$")
+
+# Scoring engine
+DURATION_YEAR_RANGE = re.compile(r"(\d{4})\s*-\s*(\d{4})")
+DURATION_YEARS = re.compile(r"(\d+(?:\.\d+)?)\s*years?")
+DURATION_MONTHS = re.compile(r"(\d+)\s*months?")
+BULLET_MARKER = re.compile(r"[•\-\*]\s+")
+SECTION_HEADER = re.compile(r"\n[A-Z][A-Z\s]+:\s*\n")
+SPECIAL_CHARACTER = re.compile(r"[^\w\s\-\.\,\(\)]")
+PASSIVE_INDICATORS = re.compile(r"\b(?:was|were|been|being)\b")
+QUANTIFIED_ACHIEVEMENT = re.compile(r"\d+%|\d+\s*(?:percent|million|thousand|k\b)")
+FIRST_PERSON = re.compile(r"\bi\s")
+SENTENCE_SPLIT = re.compile(r"[.!?]+")
+
+
+def compile_word_alternation(words: Iterable[str]) -> Pattern[str]:
+    """Compile a single whole-word pattern matching any of the given words
+
+    ``findall`` counts each occurrence once, which for distinct single words
+    (such as the action verbs) is the sum of one whole-word findall per word.
+    A word listed twice is counted once, and where a phrase contains
+    another listed word only the longer match is counted.
+    """
+    return _compile_word_alternation(tuple(words))
+
+
+@lru_cache(maxsize=32)
+def _compile_word_alternation(words: Tuple[str, ...]) -> Pattern[str]:
+    # Longest first so that a word is never shadowed by one of its prefixes,
+    # then alphabetical so the pattern doesn't depend on the input order
+    alternatives = [
+        re.escape(word) for word in sorted(set(words), key=lambda w: (-len(w), w))
+    ]
+    if not alternatives:
+        # Matches nothing
+        return re.compile(r"(?!)")
+    return re.compile(r"\b(?:" + "|".join(alternatives) + r")\b")
+
+
+def compile_indicator_alternation(indicators: Iterable[str]) -> Pattern[str]:
+    """Compile one pattern finding the phrase after any of the indicator phrases
+
+    Indicator ``n`` is named group ``i{n}`` and the phrase after it is the
+    unnamed group right after that, so ``match.lastgroup`` names the
+    indicator and ``match.group(match.lastindex + 1)`` is the phrase. The
+    match is a lookahead, so ``finditer`` tries every position once and
+    hits for different indicators may overlap, as separate patterns would.
+    A leading class of the indicators' first characters lets the regex
+    engine skip ahead to candidate positions instead of trying every
+    alternative at each one.
+    """
+    return _compile_indicator_alternation(tuple(indicators))
+
+
+@lru_cache(maxsize=32)
+def _compile_indicator_alternation(indicators: Tuple[str, ...]) -> Pattern[str]:
+    if not indicators:
+        return re.compile(r"(?!)")
+    first_chars = "".join(sorted({re.escape(indicator[0]) for indicator in indicators}))
+    alternatives = (
+        rf"(?P<i{n}>{re.escape(indicator)}\s+([^,.;\n]+))"
+        for n, indicator in enumerate(indicators)
+    )
+    return re.compile(
+        rf"(?=[{first_chars}])(?=" + "|".join(alternatives) + r")", re.IGNORECASE
+    )
@@ -3,29 +3,23 @@
 Resume Parser Module - Extracts structured data from resume files
 """
 
-import re
 import json
-import spacy
-from typing import List, Dict, Optional, Union
-from dataclasses import dataclass
+from typing import Any, List, Dict, Optional, Tuple, Union
+from dataclasses import dataclass, asdict, field
 from pathlib import Path
 import logging
 
-# File parsing imports
-try:
-    import fitz  # PyMuPDF
-except ImportError:
-    import PyPDF2
-
-    fitz = None
-
-try:
-    from docx import Document
-except ImportError:
-    Document = None
+from . import extractors, patterns
+from .matching import DEFAULT_MATCH_BUDGET, MatchBudget, comma_items, find_emails, job_entries
+from .nlp import get_nlp
+from .sections import SectionMap, segment_text
+from .skill_matcher import SkillMatcher
 
 logger = logging.getLogger(__name__)
 
+# Bump whenever extraction output changes so cached ResumeData is invalidated
+PARSER_VERSION = "8"
+
 
 @dataclass
 class ContactInfo:
@@ -72,25 +66,61 @@ class ResumeData:
     experience: List[Experience]
     certifications: List[str]
     raw_text: str
+    truncated: bool = False  # Extraction stopped at a page, size or time budget
+    # Section name -> (start, end) offsets into raw_text, when headings were found
+    sections: Dict[str, Tuple[int, int]] = field(default_factory=dict)
+    encoding: Optional[str] = None  # Detected source encoding, for text files
+
+    def to_dict(self) -> Dict[str, Any]:
+        """Convert to a JSON-serializable dictionary"""
+        return asdict(self)
+
+    @classmethod
+    def from_dict(cls, data: Dict[str, Any]) -> "ResumeData":
+        """Rebuild resume data from the output of to_dict"""
+        data = dict(data)
+        data["contact_info"] = ContactInfo(**data["contact_info"])
+        data["education"] = [Education(**edu) for edu in data["education"]]
+        data["experience"] = [Experience(**exp) for exp in data["experience"]]
+        data["sections"] = {
+            name: tuple(span) for name, span in data.get("sections", {}).items()
+        }
+        return cls(**data)
+
+
+def _read_source(source: Union[str, Path, bytes, bytearray, memoryview]) -> bytes:
+    """Return the bytes of a file path or of an in-memory buffer"""
+    if isinstance(source, (str, Path)):
+        return Path(source).read_bytes()
+    return bytes(source)
+
+
+def _section_body(text: str, sections: Optional[SectionMap], name: str) -> str:
+    """Stripped body of a section, segmenting the text first if no map was given"""
+    if sections is None:
+        sections = segment_text(text)
+    return (sections.text(text, name, body=True) or "").strip()
 
 
 class ResumeParser:
     """Main resume parser class"""
 
-    def __init__(self, skills_db_path: Optional[str] = None):
-        """Initialize parser with NLP model and skills database"""
-        self.nlp = self._load_spacy_model()
+    def __init__(
+        self,
+        skills_db_path: Optional[str] = None,
+        limits: Optional[extractors.ExtractionLimits] = None,
+        match_budget: Optional[float] = DEFAULT_MATCH_BUDGET,
+    ):
+        """Initialize parser with skills database, extraction and matching budgets"""
         self.skills_db = self._load_skills_database(skills_db_path)
+        self.skill_matcher = SkillMatcher(self.skills_db)
+        self.limits = limits or extractors.ExtractionLimits()
+        self.match_budget = match_budget
 
-    def _load_spacy_model(self):
-        """Load spaCy NLP model"""
-        try:
-            return spacy.load("en_core_web_sm")
-        except OSError:
-            logger.warning(
-                "spaCy model not found. Install with: python -m spacy download en_core_web_sm"
-            )
-            return None
+    @property
+    def nlp(self):
+        """Shared spaCy model, loaded on first use"""
+        return get_nlp()
 
     def _load_skills_database(self, skills_db_path: Optional[str]) -> Dict:
         """Load skills database from JSON file"""
@@ -174,23 +204,55 @@ class ResumeParser:
         if not file_path.exists():
             raise FileNotFoundError(f"Resume file not found: {file_path}")
 
-        # Extract text based on file type
-        if file_path.suffix.lower() == ".pdf":
-            raw_text = self.parse_pdf(str(file_path))
-        elif file_path.suffix.lower() == ".docx":
-            raw_text = self.parse_docx(str(file_path))
-        elif file_path.suffix.lower() == ".txt":
-            raw_text = self.parse_txt(str(file_path))
-        else:
-            raise ValueError(f"Unsupported file format: {file_path.suffix}")
-
-        # Extract structured data
-        contact_info = self.extract_contact_info(raw_text)
-        summary = self.extract_summary(raw_text)
-        skills = self.extract_skills(raw_text)
-        education = self.extract_education(raw_text)
-        experience = self.extract_experience(raw_text)
-        certifications = self.extract_certifications(raw_text)
+        return self.parse_resume_bytes(file_path.read_bytes(), file_path.name)
+
+    def parse_resume_bytes(
+        self, data: Union[bytes, bytearray, memoryview], filename_or_mime: str
+    ) -> ResumeData:
+        """Parse a resume held in memory, e.g. an upload, without touching disk
+
+        The format is sniffed from the content and falls back to
+        ``filename_or_mime``, a file name or a MIME type such as
+        ``application/pdf``; see ``extractors.resolve_extractor``.
+        """
+        data = bytes(data)
+        extractor = extractors.resolve_extractor(data, filename_or_mime)
+        extracted = extractor.run(data, self.limits)
+        if extracted.truncated:
+            logger.warning(
+                f"Resume {filename_or_mime} truncated by extraction limits "
+                f"({len(extracted.text)} chars, {extracted.pages or '-'} pages read)"
+            )
+        return self.parse_text(
+            extracted.text,
+            truncated=extracted.truncated,
+            sections=extracted.sections,
+            encoding=extracted.encoding,
+        )
+
+    def parse_text(
+        self,
+        raw_text: str,
+        truncated: bool = False,
+        sections: Optional[SectionMap] = None,
+        encoding: Optional[str] = None,
+    ) -> ResumeData:
+        """Extract structured data from already extracted resume text
+
+        The text is segmented once into a section map, unless the extractor
+        already supplied a non-empty one, and each section extractor then
+        reads only its own slice. Matching stops early, and the result is
+        marked truncated, once the parser's ``match_budget`` is spent.
+        """
+        budget = MatchBudget(self.match_budget)
+        if not sections:
+            sections = segment_text(raw_text)
+        contact_info = self.extract_contact_info(raw_text, budget)
+        summary = self.extract_summary(raw_text, sections)
+        skills = self.extract_skills(raw_text, sections, budget)
+        education = self.extract_education(raw_text, sections)
+        experience = self.extract_experience(raw_text, sections, budget)
+        certifications = self.extract_certifications(raw_text, sections)
 
         return ResumeData(
             contact_info=contact_info,
@@ -200,89 +262,39 @@ class ResumeParser:
             experience=experience,
             certifications=certifications,
             raw_text=raw_text,
+            truncated=truncated or budget.exhausted,
+            sections=sections.spans(),
+            encoding=encoding,
         )
 
-    def parse_pdf(self, file_path: str) -> str:
-        """Extract text from PDF file"""
-        text = ""
-
-        if fitz:  # PyMuPDF
-            try:
-                doc = fitz.open(file_path)
-                for page in doc:
-                    text += page.get_text()
-                doc.close()
-            except Exception as e:
-                logger.error(f"Error parsing PDF with PyMuPDF: {e}")
-                raise
-        else:  # PyPDF2 fallback
-            try:
-                import PyPDF2
-
-                with open(file_path, "rb") as file:
-                    pdf_reader = PyPDF2.PdfReader(file)
-                    for page in pdf_reader.pages:
-                        text += page.extract_text()
-            except Exception as e:
-                logger.error(f"Error parsing PDF with PyPDF2: {e}")
-                raise
-
-        return text
-
-    def parse_docx(self, file_path: str) -> str:
-        """Extract text from DOCX file"""
-        if not Document:
-            raise ImportError(
-                "python-docx not installed. Install with: pip install python-docx"
-            )
+    def parse_pdf(self, source: Union[str, bytes, bytearray, memoryview]) -> str:
+        """Extract text from a PDF file path or in-memory PDF bytes"""
+        return extractors.extract_pdf(_read_source(source), self.limits).text
 
-        try:
-            doc = Document(file_path)
-            text = "\n".join([paragraph.text for paragraph in doc.paragraphs])
-            return text
-        except Exception as e:
-            logger.error(f"Error parsing DOCX: {e}")
-            raise
+    def parse_docx(self, source: Union[str, bytes, bytearray, memoryview]) -> str:
+        """Extract text from a DOCX file path or in-memory DOCX bytes"""
+        return extractors.extract_docx(_read_source(source))
 
     def parse_txt(self, file_path: str) -> str:
-        """Extract text from TXT file"""
-        try:
-            with open(file_path, "r", encoding="utf-8") as file:
-                return file.read()
-        except UnicodeDecodeError:
-            # Try different encodings
-            for encoding in ["latin-1", "cp1252", "iso-8859-1"]:
-                try:
-                    with open(file_path, "r", encoding=encoding) as file:
-                        return file.read()
-                except UnicodeDecodeError:
-                    continue
-            raise ValueError(f"Could not decode text file: {file_path}")
-
-    def extract_contact_info(self, text: str) -> ContactInfo:
+        """Extract text from TXT file, reading and decoding it once"""
+        return extractors.decode_text(Path(file_path).read_bytes(), file_path)
+
+    def extract_contact_info(
+        self, text: str, budget: Optional[MatchBudget] = None
+    ) -> ContactInfo:
         """Extract contact information from text"""
         # Email patterns
-        email_pattern = r"\b[A-Za-z0-9._%+-]+@[A-Za-z0-9.-]+\.[A-Z|a-z]{2,}\b"
-        emails = re.findall(email_pattern, text)
+        emails = find_emails(text, budget)
 
         # Phone patterns
-        phone_patterns = [
-            r"(\+\d{1,3}[-.\s]?)?\(?\d{3}\)?[-.\s]?\d{3}[-.\s]?\d{4}",
-            r"\+\d{1,3}\s?\d{1,14}",
-            r"\(\d{3}\)\s?\d{3}-\d{4}",
-        ]
         phones = []
-        for pattern in phone_patterns:
-            phones.extend(re.findall(pattern, text))
+        for pattern in patterns.PHONES:
+            phones.extend(pattern.findall(text))
 
         # Social media profiles
-        linkedin_pattern = r"linkedin\.com/in/[\w-]+"
-        github_pattern = r"github\.com/[\w-]+"
-        website_pattern = r"https?://[\w.-]+\.[a-zA-Z]{2,}"
-
-        linkedin = re.search(linkedin_pattern, text)
-        github = re.search(github_pattern, text)
-        websites = re.findall(website_pattern, text)
+        linkedin = patterns.LINKEDIN.search(text)
+        github = patterns.GITHUB.search(text)
+        websites = patterns.WEBSITE.findall(text)
 
         return ContactInfo(
             emails=list(set(emails)),
@@ -292,42 +304,31 @@ class ResumeParser:
             website=websites[0] if websites else None,
         )
 
-    def extract_summary(self, text: str) -> Optional[str]:
+    def extract_summary(
+        self, text: str, sections: Optional[SectionMap] = None
+    ) -> Optional[str]:
         """Extract professional summary/objective"""
-        summary_patterns = [
-            r"(?i)(?:summary|objective|profile|about)\s*[:;]?\s*(.*?)(?=\n\s*\n|\n\s*[A-Z])",
-            r"(?i)(professional\s+summary.*?)(?=\n\s*\n|\n\s*[A-Z])",
-        ]
-
-        for pattern in summary_patterns:
-            match = re.search(pattern, text, re.DOTALL)
-            if match:
-                summary = match.group(1).strip()
-                if len(summary) > 50:  # Ensure it's substantial
-                    return summary
-
-        return None
-
-    def extract_skills(self, text: str) -> List[str]:
+        # First paragraph of the section, if it's substantial
+        summary = _section_body(text, sections, "summary").split("\n\n", 1)[0].strip()
+        return summary if len(summary) > 50 else None
+
+    def extract_skills(
+        self,
+        text: str,
+        sections: Optional[SectionMap] = None,
+        budget: Optional[MatchBudget] = None,
+    ) -> List[str]:
         """Extract technical and professional skills"""
-        text_lower = text.lower()
-        found_skills = set()
-
-        # Extract from skills database
-        for category, skills in self.skills_db.items():
-            for skill in skills:
-                if skill.lower() in text_lower:
-                    found_skills.add(skill.lower())
+        # Extract from skills database in a single pass over the text
+        found_skills = self.skill_matcher.find_skills(text)
 
         # Extract from skills section specifically
-        skills_section_pattern = r"(?i)(?:skills|technologies|technical\s+skills).*?(?=\n\s*\n|\n\s*[A-Z][A-Z\s]+:)"
-        skills_match = re.search(skills_section_pattern, text, re.DOTALL)
+        skills_text = _section_body(text, sections, "skills")
 
-        if skills_match:
-            skills_text = skills_match.group()
+        if skills_text:
             # Extract bullet points and comma-separated items
-            bullet_skills = re.findall(r"[-•*]\s*([^\n]+)", skills_text)
-            comma_skills = re.findall(r"([^,\n]+)(?:,|$)", skills_text)
+            bullet_skills = patterns.BULLET_ITEM.findall(skills_text)
+            comma_skills = comma_items(skills_text, budget)
 
             for skill_list in [bullet_skills, comma_skills]:
                 for skill in skill_list:
@@ -337,36 +338,31 @@ class ResumeParser:
 
         return list(found_skills)
 
-    def extract_education(self, text: str) -> List[Education]:
+    def extract_education(
+        self, text: str, sections: Optional[SectionMap] = None
+    ) -> List[Education]:
         """Extract education information"""
         education_list = []
 
-        # Education section pattern
-        edu_pattern = r"(?i)(?:education|academic.*?)(?=\n\s*\n|\n\s*[A-Z][A-Z\s]+:|$)"
-        edu_match = re.search(edu_pattern, text, re.DOTALL)
+        edu_text = _section_body(text, sections, "education")
 
-        if edu_match:
-            edu_text = edu_match.group()
+        if edu_text:
 
             # Degree patterns
-            degree_patterns = [
-                r"((?:Bachelor|Master|PhD|Doctorate|Associate).*?)(?:\n|$)",
-                r"(B\.?[AS]\.?.*?)(?:\n|$)",
-                r"(M\.?[AS]\.?.*?)(?:\n|$)",
-            ]
-
-            for pattern in degree_patterns:
-                matches = re.findall(pattern, edu_text, re.IGNORECASE)
+            for pattern in patterns.DEGREES:
+                matches = pattern.findall(edu_text)
                 for match in matches:
                     # Extract institution
                     lines = match.split("\n")
                     degree = lines[0].strip()
+                    if any(edu.degree == degree for edu in education_list):
+                        continue  # Also matched by a looser degree pattern
                     institution = (
                         lines[1].strip() if len(lines) > 1 else "Unknown Institution"
                     )
 
                     # Extract graduation year
-                    year_match = re.search(r"(\d{4})", match)
+                    year_match = patterns.YEAR.search(match)
                     graduation_year = year_match.group(1) if year_match else None
 
                     education_list.append(
@@ -379,20 +375,21 @@ class ResumeParser:
 
         return education_list
 
-    def extract_experience(self, text: str) -> List[Experience]:
+    def extract_experience(
+        self,
+        text: str,
+        sections: Optional[SectionMap] = None,
+        budget: Optional[MatchBudget] = None,
+    ) -> List[Experience]:
         """Extract work experience"""
         experience_list = []
 
-        # Experience section pattern
-        exp_pattern = r"(?i)(?:experience|employment|work\s+history).*?(?=\n\s*\n[A-Z][A-Z\s]+:|$)"
-        exp_match = re.search(exp_pattern, text, re.DOTALL)
+        exp_text = _section_body(text, sections, "experience")
 
-        if exp_match:
-            exp_text = exp_match.group()
+        if exp_text:
 
             # Split into individual jobs (look for job titles)
-            job_pattern = r"([^\n]+)\s*\|\s*([^\n]+)\s*\|\s*([^\n]+)(?:\n(.*?))?(?=\n[A-Z]|\n\s*\n|$)"
-            jobs = re.findall(job_pattern, exp_text, re.DOTALL)
+            jobs = job_entries(exp_text, budget)
 
             for job in jobs:
                 title = job[0].strip()
@@ -403,7 +400,7 @@ class ResumeParser:
                 # Extract bullet points from description
                 description = []
                 if description_text:
-                    bullets = re.findall(r"[-•*]\s*([^\n]+)", description_text)
+                    bullets = patterns.BULLET_ITEM.findall(description_text)
                     description = [
                         bullet.strip() for bullet in bullets if bullet.strip()
                     ]
@@ -419,19 +416,17 @@ class ResumeParser:
 
         return experience_list
 
-    def extract_certifications(self, text: str) -> List[str]:
+    def extract_certifications(
+        self, text: str, sections: Optional[SectionMap] = None
+    ) -> List[str]:
         """Extract certifications"""
-        cert_patterns = [
-            r"(?i)(?:certification|certificate)s?.*?(?=\n\s*\n|\n\s*[A-Z][A-Z\s]+:|$)",
-            r"(?i)certified.*?(?=\n|$)",
-        ]
-
         certifications = []
-        for pattern in cert_patterns:
-            matches = re.findall(pattern, text, re.DOTALL)
-            for match in matches:
-                # Extract individual certifications
-                certs = re.findall(r"[-•*]\s*([^\n]+)", match)
-                certifications.extend([cert.strip() for cert in certs if cert.strip()])
+        # The certifications section, plus "certified" lines anywhere else
+        matches = [_section_body(text, sections, "certifications")]
+        matches.extend(patterns.CERTIFIED_LINE.findall(text))
+        for match in matches:
+            # Extract individual certifications
+            certs = patterns.BULLET_ITEM.findall(match)
+            certifications.extend([cert.strip() for cert in certs if cert.strip()])
 
         return list(set(certifications))
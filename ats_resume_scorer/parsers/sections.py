@@ -0,0 +1,259 @@
+# ats_resume_scorer/parsers/sections.py
+"""
+Section Index - Where each resume or job description section starts and ends
+
+A ``SectionMap`` is built once per document and lets the field extractors
+work on their own slice of the text instead of each rescanning all of it
+for its heading. PDFs read in layout mode get one from their typography;
+everything else goes through ``segment_text``, a single scan over the lines.
+Job descriptions are split the same way by ``segment_job_description``.
+"""
+
+import re
+from dataclasses import dataclass
+from typing import Dict, Iterable, Iterator, List, Optional, Tuple
+
+# Heading wordings for each canonical section. Sections the parser doesn't
+# extract are still listed so that they end the section before them.
+SECTION_ALIASES: Dict[str, Tuple[str, ...]] = {
+    "summary": (
+        "summary", "professional summary", "career summary", "executive summary",
+        "objective", "career objective", "profile", "professional profile",
+        "about", "about me",
+    ),
+    "skills": (
+        "skills", "technical skills", "core skills", "key skills", "technologies",
+        "core competencies", "competencies", "skills and technologies",
+    ),
+    "experience": (
+        "experience", "work experience", "professional experience",
+        "employment", "employment history", "work history", "career history",
+    ),
+    "education": (
+        "education", "academic background", "academics", "education and training",
+    ),
+    "certifications": (
+        "certifications", "certification", "certificates",
+        "licenses and certifications", "certifications and licenses",
+    ),
+    "projects": ("projects", "personal projects", "key projects"),
+    "awards": ("awards", "honors", "honors and awards", "achievements"),
+    "publications": ("publications",),
+    "languages": ("languages",),
+    "interests": ("interests", "hobbies", "hobbies and interests"),
+    "volunteering": ("volunteering", "volunteer experience"),
+    "references": ("references",),
+}
+
+_HEADING_LOOKUP = {
+    alias: name for name, aliases in SECTION_ALIASES.items() for alias in aliases
+}
+_HEADING_NOISE = re.compile(r"[\s:;\-–—_|•*#]+")
+
+# Longest heading worth classifying, in characters
+MAX_HEADING_LENGTH = 48
+
+
+def classify_heading(line: str) -> Optional[str]:
+    """Canonical section name for a heading line, or None if it isn't one"""
+    if len(line) > MAX_HEADING_LENGTH:
+        return None
+    key = _HEADING_NOISE.sub(" ", line.replace("&", " and ")).strip().lower()
+    return _HEADING_LOOKUP.get(key)
+
+
+@dataclass(frozen=True)
+class Section:
+    """One section: its canonical name and its span in the text"""
+
+    name: str
+    start: int  # Offset of the heading
+    body_start: int  # Offset just past the heading line
+    end: int
+
+
+class SectionMap:
+    """Sections of one document, in text order"""
+
+    def __init__(self, sections: Iterable[Section] = ()):
+        self.sections: List[Section] = list(sections)
+        self._first: Dict[str, Section] = {}
+        for section in self.sections:
+            self._first.setdefault(section.name, section)
+
+    @classmethod
+    def from_headings(
+        cls, headings: Iterable[Tuple[str, int, int]], length: int
+    ) -> "SectionMap":
+        """Build the map from (name, start, body_start) headings in text order
+
+        Each section runs until the next heading or the end of the text.
+        """
+        headings = [h for h in headings if h[1] < length]
+        ends = [start for _, start, _ in headings[1:]] + [length]
+        return cls(
+            Section(name, start, min(body_start, end, length), end)
+            for (name, start, body_start), end in zip(headings, ends)
+        )
+
+    def __contains__(self, name: str) -> bool:
+        return name in self._first
+
+    def __iter__(self) -> Iterator[Section]:
+        return iter(self.sections)
+
+    def __len__(self) -> int:
+        return len(self.sections)
+
+    def __repr__(self) -> str:
+        return f"SectionMap({self.spans()})"
+
+    def get(self, name: str) -> Optional[Section]:
+        """First section with the given name"""
+        return self._first.get(name)
+
+    def all(self, name: str) -> List[Section]:
+        """Every section with the given name, in text order"""
+        return [section for section in self.sections if section.name == name]
+
+    def text(self, text: str, name: str, body: bool = False) -> Optional[str]:
+        """Slice of ``text`` holding a section, from its heading or only its body"""
+        section = self._first.get(name)
+        if section is None:
+            return None
+        return text[section.body_start if body else section.start : section.end]
+
+    def clip(self, length: int) -> "SectionMap":
+        """Map for the text cut to its first ``length`` characters"""
+        return SectionMap(
+            Section(s.name, s.start, min(s.body_start, length), min(s.end, length))
+            for s in self.sections
+            if s.start < length
+        )
+
+    def spans(self) -> Dict[str, Tuple[int, int]]:
+        """Span of the first section of each name, for serialization"""
+        return {name: (s.start, s.end) for name, s in self._first.items()}
+
+
+def _alias_pattern(alias: str) -> str:
+    words = [r"(?:and|&)" if word == "and" else re.escape(word) for word in alias.split()]
+    return r"[^\S\n]+".join(words)
+
+
+# A line holding only a known heading, possibly decorated, or one followed
+# by a colon and inline content. The heading sits in group 1.
+# Every repetition is over a single class of characters, so a failed match
+# costs one scan of the line rather than a backtracking search.
+_DECORATION = r"(?:[^\S\n]|[#*•\-_|])*"
+HEADING_LINE = re.compile(
+    r"^" + _DECORATION + r"(?=[^\W\d_])("
+    + "|".join(_alias_pattern(a) for a in sorted(_HEADING_LOOKUP, key=len, reverse=True))
+    + r")(?:[^\S\n]*:|" + _DECORATION + "$)",
+    re.IGNORECASE | re.MULTILINE,
+)
+_WHITESPACE = re.compile(r"\s+")
+
+
+def segment_text(text: str) -> SectionMap:
+    """Map the sections of plain text in one linear scan
+
+    A heading is a line naming a known section, optionally followed by a
+    colon, e.g. ``EXPERIENCE`` or ``Technical Skills:``. Inline headings
+    such as ``Skills: Python, SQL`` start a section whose body begins after
+    the colon.
+    """
+    headings: List[Tuple[str, int, int]] = []
+    for match in HEADING_LINE.finditer(text):
+        key = _WHITESPACE.sub(" ", match.group(1).replace("&", "and")).lower()
+        body_start = match.end()
+        if text.startswith("\n", body_start):
+            body_start += 1
+        headings.append((_HEADING_LOOKUP[key], match.start(), body_start))
+    return SectionMap.from_headings(headings, len(text))
+
+
+# Heading wordings for each job description section type. "about" and
+# unrecognized headings only end the section before them.
+JD_SECTION_ALIASES: Dict[str, Tuple[str, ...]] = {
+    "requirements": (
+        "requirements", "required", "required skills", "required qualifications",
+        "requirements and qualifications", "qualifications", "minimum qualifications",
+        "basic qualifications", "key requirements", "job requirements",
+        "must have", "must haves", "essential",
+        "essential skills", "skills required", "what we're looking for",
+        "what you'll need", "what you need", "what you bring", "who you are",
+    ),
+    "preferred": (
+        "preferred", "preferred skills", "preferred qualifications", "nice to have",
+        "nice to haves", "bonus", "bonus points",
+        "plus", "pluses", "additional", "additional skills", "good to have",
+        "great to have", "desired", "desired skills", "desirable",
+        "would be great if", "it would be nice if",
+    ),
+    "responsibilities": (
+        "responsibilities", "key responsibilities", "duties", "job duties",
+        "role", "the role", "your role", "about the role", "in this role",
+        "role and responsibilities", "what you'll do", "what you will do",
+        "what you'll be doing", "you will", "day to day",
+    ),
+    "benefits": (
+        "benefits", "perks", "perks and benefits", "benefits and perks",
+        "what we offer", "compensation and benefits", "why join us",
+    ),
+    "about": (
+        "about", "about us", "about the company", "who we are", "company overview",
+        "overview", "the company", "the team", "our team",
+    ),
+}
+
+_JD_HEADING_LOOKUP = {
+    alias: name for name, aliases in JD_SECTION_ALIASES.items() for alias in aliases
+}
+_JD_HEADING_NOISE = re.compile(r"[\s:;\-–—_|•*#]+")
+_JD_LINE = re.compile(r"[^\n]*\n?")
+
+
+def classify_jd_heading(line: str) -> Optional[str]:
+    """Job description section type for a heading, or None if it isn't one"""
+    if len(line) > MAX_HEADING_LENGTH:
+        return None
+    key = line.replace("\u2019", "'").replace("&", " and ").lower()
+    return _JD_HEADING_LOOKUP.get(_JD_HEADING_NOISE.sub(" ", key).strip())
+
+
+def _is_generic_heading(line: str) -> bool:
+    """A short line that looks like a heading this module doesn't know"""
+    if not line or len(line) > MAX_HEADING_LENGTH or line[0] in "-•*":
+        return False
+    return line.endswith(":") or (line.isupper() and any(c.isalpha() for c in line))
+
+
+def segment_job_description(text: str) -> SectionMap:
+    """Split a job description into typed sections in one pass over its lines
+
+    A heading is a line naming a known section type, optionally followed by
+    a colon and inline content (``Requirements: 5+ years of Python``). Each
+    section runs to the next heading; short colon-terminated or upper-case
+    lines that aren't known headings end it as an "other" section.
+    """
+    headings: List[Tuple[str, int, int]] = []
+    for match in _JD_LINE.finditer(text):
+        raw = match.group()
+        if not raw:
+            break
+        line = raw.strip()
+        if not line:
+            continue
+
+        head, colon, rest = line.partition(":")
+        name = classify_jd_heading(head if colon else line)
+        if name is not None:
+            body_start = match.end()
+            if colon and rest.strip():
+                # Inline content starts the body, right after the colon
+                body_start -= len(raw.split(":", 1)[1].lstrip())
+            headings.append((name, match.start(), body_start))
+        elif _is_generic_heading(line):
+            headings.append(("other", match.start(), match.end()))
+    return SectionMap.from_headings(headings, len(text))
@@ -0,0 +1,254 @@
+# ats_resume_scorer/parsers/skill_index.py
+"""
+Skill Index - Canonical skill IDs for free-text skill phrases
+
+Job descriptions list skills as bullet fragments ("5+ years building REST
+APIs", "Kubernetes/K8s") and resumes as whatever the candidate typed, so
+comparing the raw strings almost never matches. ``SkillIndex`` is built
+once from a skills database: every skill's name, alias, stem and joined
+form becomes a key pointing at the skill's canonical ID. A phrase is then
+mapped by looking up its word n-grams, longest first, which takes time
+linear in its length, and skill matching becomes a set intersection of IDs.
+"""
+
+import functools
+import hashlib
+import json
+import logging
+import pkgutil
+import re
+from typing import Dict, FrozenSet, Iterable, List, Optional, Tuple
+
+from .compact import SkillVocabulary
+
+logger = logging.getLogger(__name__)
+
+# Skills database shipped as package data, relative to the top-level package
+DEFAULT_SKILLS_DB_RESOURCE = ("config", "skills_database.json")
+
+# Common alternate spellings, keyed by the canonical database skill
+SKILL_ALIASES: Dict[str, Tuple[str, ...]] = {
+    "javascript": ("js", "ecmascript", "es6"),
+    "go": ("golang",),
+    "c#": ("csharp", "c sharp"),
+    "c++": ("cpp",),
+    "node.js": ("node", "nodejs", "node js"),
+    "react": ("reactjs", "react.js"),
+    "vue": ("vuejs", "vue.js"),
+    "angular": ("angularjs", "angular.js"),
+    "next.js": ("nextjs",),
+    "postgresql": ("postgres", "psql"),
+    "mongodb": ("mongo",),
+    "sql server": ("mssql", "ms sql"),
+    "kubernetes": ("k8s",),
+    "aws": ("amazon web services",),
+    "gcp": ("google cloud", "google cloud platform"),
+    "azure": ("microsoft azure",),
+    "machine learning": ("ml",),
+    "nlp": ("natural language processing",),
+    "ci/cd": ("cicd", "continuous integration", "continuous delivery"),
+    "rest": ("restful", "rest api", "restful api"),
+    "scikit-learn": ("sklearn",),
+    "github actions": ("gh actions",),
+    "elk stack": ("elk",),
+    "power bi": ("powerbi",),
+    "objective-c": ("objc",),
+    "generative ai": ("genai", "gen ai"),
+    "llm": ("large language models",),
+}
+
+# Words in a phrase: runs of letters, digits, "+" and "#", optionally joined
+# by inner dots (node.js, asp.net) or led by one (.net). Other punctuation,
+# including "/" and "-", separates words, in keys and phrases alike.
+_WORD = re.compile(r"\.?[a-z0-9+#]+(?:\.[a-z0-9+#]+)*")
+
+# Longest key considered, in words
+MAX_KEY_WORDS = 4
+
+# Shorter words ("r", "c") name a skill only when they are the whole phrase,
+# not inside prose such as "R&D" or "Series C"
+MIN_EMBEDDED_WORD = 2
+
+
+def _words(text: str) -> List[str]:
+    return _WORD.findall(text.lower())
+
+
+def _stem(word: str) -> str:
+    """Crude singular form: drop a plural "s" from longer words"""
+    if len(word) > 3 and word.endswith("s") and not word.endswith("ss"):
+        return word[:-1]
+    return word
+
+
+def _fallback_id(phrase: str) -> int:
+    """Stable negative ID for a phrase no database skill matched
+
+    Unknown phrases still match identical phrases elsewhere, as the raw
+    strings did, without growing the index; the ID is derived from the
+    normalized text so every process agrees on it.
+    """
+    digest = hashlib.blake2b(phrase.encode("utf-8"), digest_size=8).digest()
+    return -1 - (int.from_bytes(digest, "big") >> 1)
+
+
+class SkillIndex:
+    """Maps skill phrases to canonical skill IDs from a skills database
+
+    There is one ID space: canonical IDs are the ``SkillVocabulary`` IDs of
+    the database skills, so a ``CompactResume`` built with a vocabulary from
+    the same database stores database skills under their canonical IDs.
+    Such a vocabulary also appends every other spelling it sees ("js", free
+    text) to keep records lossless; ``vocabulary_ids`` resolves those to
+    the skill they name, or to the stable fallback ID for unknown phrases.
+    """
+
+    def __init__(
+        self,
+        skills_db: Dict[str, List[str]],
+        aliases: Optional[Dict[str, Iterable[str]]] = None,
+    ):
+        """Index every database skill under its name, aliases, stems and joined form"""
+        self.vocabulary = SkillVocabulary.from_skills_db(skills_db)
+        self._keys: Dict[str, int] = {}
+        self._stem_keys: Dict[str, int] = {}
+        self._max_words = 1
+        self._fingerprint: Optional[str] = None
+
+        canonical = self.vocabulary.names(range(len(self.vocabulary)))
+        # Exact names first so an alias can never shadow a real skill
+        for skill_id, skill in enumerate(canonical):
+            self._add_key(skill, skill_id)
+        for skill, skill_aliases in (SKILL_ALIASES if aliases is None else aliases).items():
+            skill = skill.strip().lower()
+            if skill in self.vocabulary:
+                for alias in skill_aliases:
+                    self._add_key(alias, self.vocabulary.intern(skill))
+
+    @classmethod
+    def from_file(cls, path: str) -> "SkillIndex":
+        """Index of a skills database JSON file"""
+        with open(path, "r") as f:
+            return cls(json.load(f))
+
+    def __len__(self) -> int:
+        return len(self.vocabulary)
+
+    @property
+    def fingerprint(self) -> str:
+        """Digest of every key and ID; equal fingerprints map phrases identically"""
+        if self._fingerprint is None:
+            digest = hashlib.sha256()
+            for keys in (self._keys, self._stem_keys):
+                for key, skill_id in sorted(keys.items()):
+                    digest.update(f"{key}\t{skill_id}\n".encode("utf-8"))
+            self._fingerprint = digest.hexdigest()[:16]
+        return self._fingerprint
+
+    def _add_key(self, text: str, skill_id: int) -> None:
+        words = _words(text)
+        if not words or len(words) > MAX_KEY_WORDS:
+            return
+        self._max_words = max(self._max_words, len(words))
+        self._keys.setdefault(" ".join(words), skill_id)
+        self._stem_keys.setdefault(" ".join(_stem(w) for w in words), skill_id)
+        if len(words) > 1:
+            # "scikit learn" also written "scikitlearn"
+            self._keys.setdefault("".join(words), skill_id)
+
+    def _lookup(self, words: List[str], stems: List[str], start: int, size: int) -> Optional[int]:
+        key = " ".join(words[start : start + size])
+        skill_id = self._keys.get(key)
+        if skill_id is None:
+            skill_id = self._stem_keys.get(" ".join(stems[start : start + size]))
+        return skill_id
+
+    def phrase_ids(self, phrase: str) -> List[int]:
+        """Canonical IDs of the skills named in a phrase, in order
+
+        Scans word positions left to right and takes the longest key at
+        each, so "sql server" is one skill rather than "sql" plus noise.
+        A phrase naming no database skill gets one stable fallback ID.
+        """
+        words = _words(phrase)
+        if not words:
+            return []
+        stems = [_stem(word) for word in words]
+
+        if len(words) <= self._max_words:
+            whole = self._lookup(words, stems, 0, len(words))
+            if whole is not None:
+                return [whole]
+
+        ids: List[int] = []
+        position = 0
+        while position < len(words):
+            for size in range(min(self._max_words, len(words) - position), 0, -1):
+                if size == 1 and len(words[position]) < MIN_EMBEDDED_WORD:
+                    continue
+                skill_id = self._lookup(words, stems, position, size)
+                if skill_id is not None:
+                    if skill_id not in ids:
+                        ids.append(skill_id)
+                    position += size
+                    break
+            else:
+                position += 1
+
+        return ids or [_fallback_id(" ".join(words))]
+
+    def ids(self, phrases: Iterable[str]) -> FrozenSet[int]:
+        """Canonical IDs of every skill named in any of the phrases"""
+        return frozenset(skill_id for phrase in phrases for skill_id in self.phrase_ids(phrase))
+
+    def vocabulary_ids(
+        self, vocabulary: SkillVocabulary, skill_ids: Iterable[int]
+    ) -> FrozenSet[int]:
+        """Canonical IDs for skills stored as vocabulary IDs, e.g. CompactResume.skill_ids
+
+        Database skills keep their ID; appended names are mapped like any
+        phrase, so a compact record matches exactly as its ResumeData would.
+        """
+        return self.ids(vocabulary.names(skill_ids))
+
+    def name(self, skill_id: int) -> Optional[str]:
+        """Canonical name of a database skill ID; None for fallback IDs"""
+        if 0 <= skill_id < len(self.vocabulary):
+            return self.vocabulary.names([skill_id])[0]
+        return None
+
+
+@functools.lru_cache(maxsize=None)
+def default_skill_index() -> SkillIndex:
+    """Index of the shipped skills database, built on first use
+
+    Falls back to the resume parser's built-in database, with a warning, when
+    the package data is missing; canonical IDs then differ from a full install.
+    """
+    data = _read_package_resource(*DEFAULT_SKILLS_DB_RESOURCE)
+    if data is not None:
+        return SkillIndex(json.loads(data))
+
+    from .resume_parser import ResumeParser
+
+    logger.warning(
+        f"Shipped skills database {'/'.join(DEFAULT_SKILLS_DB_RESOURCE)} not found; "
+        "using the built-in skills list"
+    )
+    return SkillIndex(ResumeParser().skills_db)
+
+
+def _read_package_resource(*parts: str) -> Optional[bytes]:
+    """Bytes of a data file shipped in the top-level package, or None if missing"""
+    package = __name__.split(".")[0]
+    try:
+        from importlib.resources import files
+    except ImportError:  # Python 3.8
+        try:
+            return pkgutil.get_data(package, "/".join(parts))
+        except OSError:
+            return None
+    resource = files(package)
+    for part in parts:
+        resource = resource.joinpath(part)
+    return resource.read_bytes() if resource.is_file() else None
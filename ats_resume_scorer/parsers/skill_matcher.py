@@ -0,0 +1,169 @@
+# ats_resume_scorer/parsers/skill_matcher.py
+"""
+Skill Matcher Module - Compiled multi-pattern matcher for skills database lookups
+"""
+
+from collections import deque
+from dataclasses import dataclass
+from typing import Dict, Iterator, List, Optional, Set, Tuple
+
+
+@dataclass
+class SkillMatch:
+    """A single skill occurrence found in text"""
+
+    skill: str
+    start: int
+    end: int
+    category: Optional[str] = None
+
+
+def _is_word_char(char: str) -> bool:
+    """Return True for characters that form part of a word"""
+    return char.isalnum() or char == "_"
+
+
+def _lower_with_offsets(text: str) -> Tuple[str, Optional[List[int]]]:
+    """Lowercase text, with the index in text of each lowered character
+
+    The map is None when every index stays in place, which holds unless a
+    character lowers to several, as "İ" does.
+    """
+    lowered = text.lower()
+    if len(lowered) == len(text):
+        return lowered, None
+    pieces: List[str] = []
+    origin: List[int] = []
+    for index, char in enumerate(text):
+        piece = char.lower()
+        pieces.append(piece)
+        origin.extend([index] * len(piece))
+    return "".join(pieces), origin
+
+
+class SkillMatcher:
+    """Aho-Corasick automaton over every skill in a skills database
+
+    The automaton is built once and then scans text in a single pass, so
+    lookup cost depends on the length of the text and the number of hits,
+    not on the size of the skills database. Matches are case-insensitive
+    and respect word boundaries: "r" does not match inside "docker" and
+    "go" does not match inside "google", while skills that start or end
+    with punctuation ("c++", ".net") still match next to word characters.
+    """
+
+    def __init__(self, skills_db: Dict[str, List[str]]):
+        """Build the automaton from a {category: [skills]} mapping"""
+        # Node 0 is the root; each node has goto edges, a failure link and
+        # the skills that end at it (including those reached via failure links)
+        self._goto: List[Dict[str, int]] = [{}]
+        self._fail: List[int] = [0]
+        self._output: List[List[str]] = [[]]
+        self.categories: Dict[str, str] = {}
+
+        for category, skills in skills_db.items():
+            for skill in skills:
+                self._add_skill(skill, category)
+
+        self._build_failure_links()
+
+    def __len__(self) -> int:
+        return len(self.categories)
+
+    def __contains__(self, skill: str) -> bool:
+        return skill.lower() in self.categories
+
+    def _add_skill(self, skill: str, category: str) -> None:
+        """Insert a skill into the trie"""
+        skill = skill.strip().lower()
+        if not skill or skill in self.categories:
+            return
+
+        self.categories[skill] = category
+
+        node = 0
+        for char in skill:
+            next_node = self._goto[node].get(char)
+            if next_node is None:
+                next_node = len(self._goto)
+                self._goto[node][char] = next_node
+                self._goto.append({})
+                self._fail.append(0)
+                self._output.append([])
+            node = next_node
+        self._output[node].append(skill)
+
+    def _build_failure_links(self) -> None:
+        """Compute failure links breadth-first and merge suffix outputs"""
+        queue = deque(self._goto[0].values())
+        while queue:
+            node = queue.popleft()
+            for char, child in self._goto[node].items():
+                queue.append(child)
+
+                fallback = self._fail[node]
+                while fallback and char not in self._goto[fallback]:
+                    fallback = self._fail[fallback]
+                self._fail[child] = self._goto[fallback].get(char, 0)
+                self._output[child] = self._output[child] + self._output[
+                    self._fail[child]
+                ]
+
+    def iter_matches(self, text: str) -> Iterator[SkillMatch]:
+        """Yield every word-bounded skill occurrence in a single pass
+
+        Offsets index into ``text`` as given, even where lowercasing it
+        changes its length.
+        """
+        text_lower, origin = _lower_with_offsets(text)
+        goto = self._goto
+        fail = self._fail
+        output = self._output
+        text_length = len(text_lower)
+
+        node = 0
+        for index, char in enumerate(text_lower):
+            while node and char not in goto[node]:
+                node = fail[node]
+            node = goto[node].get(char, 0)
+
+            for skill in output[node]:
+                end = index + 1
+                start = end - len(skill)
+                if self._is_bounded(text_lower, start, end, text_length, skill):
+                    if origin is not None:
+                        start, end = origin[start], origin[end - 1] + 1
+                    yield SkillMatch(
+                        skill=skill,
+                        start=start,
+                        end=end,
+                        category=self.categories.get(skill) or None,
+                    )
+
+    def find_all(self, text: str) -> List[SkillMatch]:
+        """Return every skill occurrence with its character offsets"""
+        return list(self.iter_matches(text))
+
+    def find_skills(self, text: str) -> Set[str]:
+        """Return the distinct skills present in text"""
+        return {match.skill for match in self.iter_matches(text)}
+
+    @staticmethod
+    def _is_bounded(
+        text: str, start: int, end: int, text_length: int, skill: str
+    ) -> bool:
+        """Check that a match is not glued to surrounding word characters"""
+        if (
+            start > 0
+            and _is_word_char(skill[0])
+            and _is_word_char(text[start - 1])
+        ):
+            return False
+        if (
+            end < text_length
+            and _is_word_char(skill[-1])
+            and _is_word_char(text[end])
+        ):
+            return False
+        return True
+
@@ -3,6 +3,7 @@
 ATS Scoring Engine Package
 """
 
+from .parsed_job import ParsedJob
 from .scoring_engine import ATSScoringEngine, ScoringWeights
 
-__all__ = ["ATSScoringEngine", "ScoringWeights"]
+__all__ = ["ATSScoringEngine", "ParsedJob", "ScoringWeights"]
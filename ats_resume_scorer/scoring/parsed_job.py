@@ -0,0 +1,213 @@
+# ats_resume_scorer/scoring/parsed_job.py
+"""
+Parsed Jobs - Job descriptions compiled once with their scoring features
+
+A requisition is scored against far more resumes than it changes, so
+everything the scoring engine derives from a job description can be
+computed when it is posted and stored: the parsed fields, canonical skill
+IDs, required years, title tokens and the TF-IDF vector together with the
+vocabulary and IDF weights that define it. ``ParsedJob.dumps`` writes that
+as versioned JSON; ``ParsedJob.loads`` reads it back without re-parsing or
+refitting anything, and ``ATSScoringEngine`` scores against it directly.
+"""
+
+import json
+import math
+from collections import Counter
+from dataclasses import dataclass
+from pathlib import Path
+from typing import Any, Callable, Dict, Iterable, List, Optional, Tuple, Union
+
+import numpy as np
+from scipy import sparse
+
+from ..parsers.jd_parser import JD_PARSER_VERSION, JobDescription
+
+# Bump whenever the serialized layout changes
+PARSED_JOB_FORMAT = 1
+
+
+class TfidfFeatures:
+    """A job description's TF-IDF vector and the vocabulary that defines it
+
+    Resumes are vectorized against the stored terms and IDF weights, so the
+    similarity doesn't depend on whichever vectorizer the scoring process
+    has fitted since the job was compiled.
+    """
+
+    __slots__ = ("terms", "idf", "vector", "_columns", "_sparse")
+
+    def __init__(
+        self,
+        terms: Iterable[str],
+        idf: Iterable[float],
+        vector: Iterable[Tuple[int, float]],
+    ):
+        self.terms: Tuple[str, ...] = tuple(terms)
+        self.idf: Tuple[float, ...] = tuple(idf)
+        self.vector: Dict[int, float] = dict(vector)  # Column -> L2-normalized weight
+        self._columns: Optional[Dict[str, int]] = None
+        self._sparse: Optional[Tuple[Any, Any]] = None
+
+    @classmethod
+    def from_vectorizer(cls, vectorizer: Any, jd_vector: Any) -> "TfidfFeatures":
+        """Capture a fitted TfidfVectorizer and the sparse JD row it produced"""
+        terms = [""] * len(vectorizer.vocabulary_)
+        for term, column in vectorizer.vocabulary_.items():
+            terms[column] = term
+        row = jd_vector.tocsr()
+        vector = zip(row.indices.tolist(), row.data.tolist())
+        return cls(terms, vectorizer.idf_.tolist(), vector)
+
+    def similarity(self, text: str, analyzer: Callable[[str], List[str]]) -> float:
+        """Cosine similarity of a text to the job on a 0-100 scale
+
+        Mirrors ``TfidfVectorizer.transform``: raw term counts over the
+        stored vocabulary, times IDF, L2-normalized.
+        """
+        if self._columns is None:
+            self._columns = {term: column for column, term in enumerate(self.terms)}
+        columns = self._columns
+        counts = Counter(
+            columns[term] for term in analyzer(text.lower()) if term in columns
+        )
+        norm = math.sqrt(sum((count * self.idf[c]) ** 2 for c, count in counts.items()))
+        if not norm:
+            return 0.0
+        dot = sum(
+            count * self.idf[c] * self.vector[c]
+            for c, count in counts.items()
+            if c in self.vector
+        )
+        return dot / norm * 100
+
+    def sparse_form(self, template: Any) -> Tuple[Any, Any]:
+        """A vectorizer over the stored vocabulary and IDF, and the JD as a sparse row
+
+        ``template`` is an unfitted TfidfVectorizer with the scoring engine's
+        settings. Built once per instance, so a batch of resumes is
+        vectorized with one ``transform`` and compared with one product.
+        """
+        if self._sparse is None:
+            vectorizer = template.set_params(vocabulary=list(self.terms))
+            vectorizer.idf_ = np.asarray(self.idf)
+            columns = list(self.vector)
+            jd_vector = sparse.csr_matrix(
+                (list(self.vector.values()), ([0] * len(columns), columns)),
+                shape=(1, len(self.terms)),
+            )
+            self._sparse = (vectorizer, jd_vector)
+        return self._sparse
+
+    def to_dict(self) -> Dict[str, Any]:
+        return {
+            "terms": list(self.terms),
+            "idf": list(self.idf),
+            "vector": [[column, weight] for column, weight in sorted(self.vector.items())],
+        }
+
+    @classmethod
+    def from_dict(cls, data: Dict[str, Any]) -> "TfidfFeatures":
+        return cls(data["terms"], data["idf"], (tuple(item) for item in data["vector"]))
+
+
+@dataclass
+class ParsedJob:
+    """A job description plus the features scoring derives from it
+
+    ``skill_index`` is the fingerprint of the index the skill IDs came from;
+    an engine with a different index maps the skill phrases again instead.
+    ``tfidf`` is None when the job was compiled in "pair" mode, where the
+    vectorizer is fitted per resume and nothing can be precomputed.
+    """
+
+    job_description: JobDescription
+    content_hash: str
+    required_skill_ids: Tuple[int, ...]
+    preferred_skill_ids: Tuple[int, ...]
+    skill_index: str
+    title_tokens: Tuple[str, ...]
+    tfidf: Optional[TfidfFeatures] = None
+    parser_version: str = JD_PARSER_VERSION
+
+    @property
+    def required_years(self) -> int:
+        """Years of experience required, 0 if none"""
+        return self.job_description.required_years or 0
+
+    @property
+    def stale(self) -> bool:
+        """Whether the job was parsed by a different JD parser version"""
+        return self.parser_version != JD_PARSER_VERSION
+
+    def to_dict(self) -> Dict[str, Any]:
+        """Convert to a JSON-serializable dictionary stamped with format and parser versions"""
+        return {
+            "format": PARSED_JOB_FORMAT,
+            "parser_version": self.parser_version,
+            "content_hash": self.content_hash,
+            "job_description": self.job_description.to_dict(),
+            "skills": {
+                "index": self.skill_index,
+                "required": list(self.required_skill_ids),
+                "preferred": list(self.preferred_skill_ids),
+            },
+            "title_tokens": list(self.title_tokens),
+            "tfidf": self.tfidf.to_dict() if self.tfidf is not None else None,
+        }
+
+    @classmethod
+    def from_dict(cls, data: Dict[str, Any], allow_stale: bool = False) -> "ParsedJob":
+        """Rebuild a parsed job from the output of to_dict
+
+        Raises ValueError for an unknown format, and for a job parsed by an
+        older JD parser unless ``allow_stale`` is set.
+        """
+        if data.get("format") != PARSED_JOB_FORMAT:
+            raise ValueError(
+                f"Unsupported parsed job format {data.get('format')!r}, "
+                f"expected {PARSED_JOB_FORMAT}"
+            )
+        if data["parser_version"] != JD_PARSER_VERSION and not allow_stale:
+            raise ValueError(
+                f"Parsed job is from JD parser version {data['parser_version']}, "
+                f"current is {JD_PARSER_VERSION}; recompile it"
+            )
+        skills = data["skills"]
+        return cls(
+            job_description=JobDescription.from_dict(data["job_description"]),
+            content_hash=data["content_hash"],
+            required_skill_ids=tuple(skills["required"]),
+            preferred_skill_ids=tuple(skills["preferred"]),
+            skill_index=skills["index"],
+            title_tokens=tuple(data["title_tokens"]),
+            tfidf=TfidfFeatures.from_dict(data["tfidf"]) if data["tfidf"] else None,
+            parser_version=data["parser_version"],
+        )
+
+    def dumps(self) -> str:
+        """Serialize to compact JSON"""
+        return json.dumps(self.to_dict(), ensure_ascii=False, separators=(",", ":"))
+
+    @classmethod
+    def loads(cls, payload: Union[str, bytes], allow_stale: bool = False) -> "ParsedJob":
+        """Deserialize the output of dumps"""
+        return cls.from_dict(json.loads(payload), allow_stale=allow_stale)
+
+    def save(self, path: Union[str, Path]) -> None:
+        """Write the serialized job to a file"""
+        Path(path).parent.mkdir(parents=True, exist_ok=True)
+        Path(path).write_text(self.dumps(), encoding="utf-8")
+
+    @classmethod
+    def load(cls, path: Union[str, Path], allow_stale: bool = False) -> "ParsedJob":
+        """Read a job written by save"""
+        return cls.loads(Path(path).read_text(encoding="utf-8"), allow_stale=allow_stale)
+
+
+JobLike = Union[JobDescription, ParsedJob]
+
+
+def job_description_of(job: JobLike) -> JobDescription:
+    """The JobDescription behind a job description or parsed job"""
+    return job.job_description if isinstance(job, ParsedJob) else job
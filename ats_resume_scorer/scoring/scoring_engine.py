@@ -3,17 +3,23 @@
 ATS Scoring Engine - Core scoring logic for resume evaluation
 """
 
-import re
 import json
 import logging
-from typing import Dict, List, Any, Optional
+import threading
+from pathlib import Path
+from typing import Dict, FrozenSet, List, Any, Iterable, Optional, Tuple, Union
 from dataclasses import dataclass
+import joblib
 from sklearn.feature_extraction.text import TfidfVectorizer
 from sklearn.metrics.pairwise import cosine_similarity
 import numpy as np
 
+from ..parsers import patterns
 from ..parsers.resume_parser import ResumeData
 from ..parsers.jd_parser import JobDescription
+from ..parsers.skill_index import SkillIndex, default_skill_index
+from ..utils.cache import LRUCache, content_hash
+from .parsed_job import JobLike, ParsedJob, TfidfFeatures, job_description_of
 
 logger = logging.getLogger(__name__)
 
@@ -47,12 +53,159 @@ class ScoringWeights:
 
 
 class ATSScoringEngine:
-    """Main ATS scoring engine"""
+    """Main ATS scoring engine
+
+    Text similarity is computed with TF-IDF in one of three modes:
+
+    * ``pair`` fits a fresh vectorizer on every resume/JD pair (original behavior)
+    * ``jd`` fits once per job description and only transforms each resume
+    * ``corpus`` uses one vectorizer fitted on a corpus via ``fit_corpus`` or
+      loaded from disk, so IDF weights come from real document frequencies
+    """
+
+    TFIDF_MODES = ("pair", "jd", "corpus")
+
+    def __init__(
+        self,
+        weights: Optional[ScoringWeights] = None,
+        tfidf_mode: str = "pair",
+        vectorizer_path: Optional[Union[str, Path]] = None,
+        jd_vector_cache_size: int = 128,
+        skill_index: Optional[SkillIndex] = None,
+    ):
+        """Initialize scoring engine with weights, TF-IDF mode and skill index"""
+        if tfidf_mode not in self.TFIDF_MODES:
+            raise ValueError(
+                f"Unknown tfidf_mode {tfidf_mode!r}, expected one of {self.TFIDF_MODES}"
+            )
 
-    def __init__(self, weights: Optional[ScoringWeights] = None):
-        """Initialize scoring engine with weights"""
         self.weights = weights or ScoringWeights()
+        # Resume and JD skills are compared as canonical skill IDs
+        self.skill_index = skill_index or default_skill_index()
         self.action_verbs = self._load_action_verbs()
+        self.action_verbs_pattern = patterns.compile_word_alternation(
+            self.action_verbs
+        )
+
+        self.tfidf_mode = tfidf_mode
+        self.vectorizer: Optional[TfidfVectorizer] = None
+        self.jd_vectors = LRUCache(maxsize=jd_vector_cache_size)
+        # Tokenizes resumes for parsed jobs that carry their own TF-IDF vector
+        self._analyzer = self._new_vectorizer().build_analyzer()
+        self._vectorizer_lock = threading.Lock()
+        if vectorizer_path:
+            self.load_vectorizer(vectorizer_path)
+
+    @staticmethod
+    def _new_vectorizer() -> TfidfVectorizer:
+        """Create a vectorizer with the engine's standard settings"""
+        return TfidfVectorizer(stop_words="english", ngram_range=(1, 2), max_features=1000)
+
+    def fit_corpus(self, documents: Iterable[str]) -> TfidfVectorizer:
+        """Fit the shared vectorizer on a corpus of resumes and/or JDs"""
+        vectorizer = self._new_vectorizer()
+        vectorizer.fit([doc.lower() for doc in documents])
+        with self._vectorizer_lock:
+            self.vectorizer = vectorizer
+            self.jd_vectors.clear()
+        logger.info(
+            f"Fitted TF-IDF vocabulary with {len(vectorizer.vocabulary_)} terms"
+        )
+        return vectorizer
+
+    def save_vectorizer(self, path: Union[str, Path]) -> None:
+        """Persist the fitted corpus vectorizer"""
+        if self.vectorizer is None:
+            raise ValueError("No fitted vectorizer to save; call fit_corpus first")
+        Path(path).parent.mkdir(parents=True, exist_ok=True)
+        joblib.dump(self.vectorizer, path)
+
+    def load_vectorizer(self, path: Union[str, Path]) -> TfidfVectorizer:
+        """Load a previously saved corpus vectorizer"""
+        vectorizer = joblib.load(path)
+        if not isinstance(vectorizer, TfidfVectorizer):
+            raise ValueError(f"{path} does not contain a TfidfVectorizer")
+        with self._vectorizer_lock:
+            self.vectorizer = vectorizer
+            self.jd_vectors.clear()
+        return vectorizer
+
+    def _jd_vector(self, jd_text: str) -> Tuple[TfidfVectorizer, Any]:
+        """Return the vectorizer and cached vector for a job description"""
+        vectorizer = self.vectorizer if self.tfidf_mode == "corpus" else None
+        if self.tfidf_mode == "corpus" and vectorizer is None:
+            logger.warning("No corpus vectorizer fitted; fitting on the job description")
+
+        def build() -> Tuple[TfidfVectorizer, Any]:
+            if vectorizer is None:
+                fitted = self._new_vectorizer()
+                return fitted, fitted.fit_transform([jd_text.lower()])
+            return vectorizer, vectorizer.transform([jd_text.lower()])
+
+        # Vectors from different vectorizers are not comparable, so key on both
+        key = (id(vectorizer), content_hash(jd_text))
+        return self.jd_vectors.get_or_compute(key, build)
+
+    def calculate_text_similarity(self, resume_text: str, jd_text: str) -> float:
+        """Return the TF-IDF cosine similarity of two texts on a 0-100 scale"""
+        try:
+            if self.tfidf_mode == "pair":
+                vectorizer = self._new_vectorizer()
+                tfidf_matrix = vectorizer.fit_transform(
+                    [resume_text.lower(), jd_text.lower()]
+                )
+                resume_vector, jd_vector = tfidf_matrix[0:1], tfidf_matrix[1:2]
+            else:
+                vectorizer, jd_vector = self._jd_vector(jd_text)
+                resume_vector = vectorizer.transform([resume_text.lower()])
+            return float(cosine_similarity(resume_vector, jd_vector)[0][0]) * 100
+        except Exception as e:
+            # sklearn raises ValueError when a document has no usable terms
+            logger.debug(f"TF-IDF similarity unavailable: {e}")
+            return 0.0
+
+    def compile_job(self, job_description: JobDescription) -> ParsedJob:
+        """Precompute the features scoring derives from a job description
+
+        The result can be serialized with ``ParsedJob.dumps`` and passed in
+        place of the job description to every scoring method.
+        """
+        tfidf = None
+        if self.tfidf_mode != "pair":
+            try:
+                vectorizer, jd_vector = self._jd_vector(job_description.raw_text)
+                tfidf = TfidfFeatures.from_vectorizer(vectorizer, jd_vector)
+            except ValueError as e:
+                # sklearn raises ValueError when the JD has no usable terms
+                logger.debug(f"TF-IDF vector unavailable for parsed job: {e}")
+
+        required = self.skill_index.ids(job_description.required_skills)
+        preferred = self.skill_index.ids(job_description.preferred_skills)
+        return ParsedJob(
+            job_description=job_description,
+            content_hash=content_hash(job_description.raw_text),
+            required_skill_ids=tuple(sorted(required)),
+            preferred_skill_ids=tuple(sorted(preferred)),
+            skill_index=self.skill_index.fingerprint,
+            title_tokens=tuple(sorted(set(job_description.title.lower().split()))),
+            tfidf=tfidf,
+        )
+
+    def _job_skill_ids(self, job: JobLike) -> Tuple[FrozenSet[int], FrozenSet[int]]:
+        """Required and preferred skill IDs, precomputed when the index matches"""
+        if isinstance(job, ParsedJob) and job.skill_index == self.skill_index.fingerprint:
+            return frozenset(job.required_skill_ids), frozenset(job.preferred_skill_ids)
+        job_description = job_description_of(job)
+        return (
+            self.skill_index.ids(job_description.required_skills),
+            self.skill_index.ids(job_description.preferred_skills),
+        )
+
+    def _job_text_similarity(self, resume_text: str, job: JobLike) -> float:
+        """TF-IDF similarity to a job, from its stored vector when it has one"""
+        if isinstance(job, ParsedJob) and job.tfidf is not None:
+            return job.tfidf.similarity(resume_text, self._analyzer)
+        return self.calculate_text_similarity(resume_text, job_description_of(job).raw_text)
 
     def _load_action_verbs(self) -> List[str]:
         """Load action verbs database"""
@@ -126,13 +279,114 @@ class ATSScoringEngine:
         ]
 
     def calculate_overall_score(
-        self, resume_data: ResumeData, job_description: JobDescription
+        self, resume_data: ResumeData, job_description: JobLike
     ) -> Dict[str, Any]:
         """Calculate comprehensive ATS score"""
+        keyword_score = self.calculate_keyword_match_score(resume_data, job_description)
+        return self._overall_score(resume_data, job_description, keyword_score)
+
+    def score_batch(
+        self, resumes: List[ResumeData], job_description: JobLike
+    ) -> List[Dict[str, Any]]:
+        """Score many resumes against one job description
+
+        The keyword component is computed for the whole batch at once by
+        ``keyword_match_scores``; the remaining components are per resume.
+        Results are in input order and match ``calculate_overall_score``.
+        """
+        keyword_scores = self.keyword_match_scores(resumes, job_description)
+        return [
+            self._overall_score(resume_data, job_description, float(keyword_score))
+            for resume_data, keyword_score in zip(resumes, keyword_scores)
+        ]
+
+    def keyword_match_scores(
+        self, resumes: List[ResumeData], job_description: JobLike
+    ) -> np.ndarray:
+        """Vectorized keyword match scores for a batch of resumes
+
+        All resume texts are transformed into one sparse TF-IDF matrix and
+        compared to the JD with a single matrix-vector product. Skill overlap
+        uses a boolean resume-by-skill incidence matrix instead of per-pair
+        set intersections. Skills are compared as canonical IDs from the skill
+        index, as in ``calculate_keyword_match_score``. The TF-IDF vocabulary
+        is the corpus vectorizer when one is fitted and is otherwise fitted on
+        the job description, so scores equal ``calculate_keyword_match_score``
+        in ``jd``/``corpus`` mode. A parsed job brings its own vocabulary, IDF
+        weights and vector, rebuilt once into the same sparse form.
+        """
+        if not resumes:
+            return np.zeros(0)
+
+        required_ids, preferred_ids = self._job_skill_ids(job_description)
+        required_skills = sorted(required_ids)
+        preferred_skills = sorted(preferred_ids)
+        skill_columns = {
+            skill: i for i, skill in enumerate(set(required_skills + preferred_skills))
+        }
+
+        incidence = np.zeros((len(resumes), len(skill_columns)), dtype=bool)
+        for row, resume_data in enumerate(resumes):
+            for skill in self.skill_index.ids(resume_data.skills):
+                column = skill_columns.get(skill)
+                if column is not None:
+                    incidence[row, column] = True
+
+        required_score = self._skill_coverage(incidence, skill_columns, required_skills)
+        if required_skills:
+            required_score = required_score * 100
+        else:
+            required_score = np.full(len(resumes), 100.0)
+        preferred_score = (
+            self._skill_coverage(incidence, skill_columns, preferred_skills) * 100 * 0.3
+        )
+
+        text_similarity_score = self._batch_text_similarity(
+            [resume_data.raw_text for resume_data in resumes], job_description
+        )
 
+        final_score = (
+            (required_score * 0.7)
+            + (preferred_score * 0.1)
+            + (text_similarity_score * 0.2)
+        )
+        return np.minimum(final_score, 100)
+
+    @staticmethod
+    def _skill_coverage(
+        incidence: np.ndarray, skill_columns: Dict[int, int], skills: List[int]
+    ) -> np.ndarray:
+        """Fraction of the given skills present in each resume row"""
+        if not skills:
+            return np.zeros(incidence.shape[0])
+        columns = [skill_columns[skill] for skill in skills]
+        return incidence[:, columns].sum(axis=1) / len(skills)
+
+    def _batch_text_similarity(self, resume_texts: List[str], job: JobLike) -> np.ndarray:
+        """TF-IDF cosine similarity of every resume text to the JD, 0-100"""
+        try:
+            if isinstance(job, ParsedJob) and job.tfidf is not None:
+                vectorizer, jd_vector = job.tfidf.sparse_form(self._new_vectorizer())
+            else:
+                vectorizer, jd_vector = self._jd_vector(job_description_of(job).raw_text)
+            resume_matrix = vectorizer.transform([text.lower() for text in resume_texts])
+            # Rows are L2-normalized by the vectorizer, so the dot product is the cosine
+            similarities = resume_matrix @ jd_vector.T
+            return np.asarray(similarities.todense()).ravel() * 100
+        except Exception as e:
+            logger.debug(f"TF-IDF similarity unavailable: {e}")
+            return np.zeros(len(resume_texts))
+
+    def _overall_score(
+        self,
+        resume_data: ResumeData,
+        job_description: JobLike,
+        keyword_score: float,
+    ) -> Dict[str, Any]:
+        """Combine a precomputed keyword score with the remaining components"""
         # Calculate individual scores
-        keyword_score = self.calculate_keyword_match_score(resume_data, job_description)
         title_score = self.calculate_title_match_score(resume_data, job_description)
+        job_description = job_description_of(job_description)
         education_score = self.calculate_education_match_score(
             resume_data, job_description
         )
@@ -177,16 +431,12 @@ class ATSScoringEngine:
         }
 
     def calculate_keyword_match_score(
-        self, resume_data: ResumeData, job_description: JobDescription
+        self, resume_data: ResumeData, job_description: JobLike
     ) -> float:
         """Calculate keyword/skills matching score"""
-        resume_skills = set([skill.lower() for skill in resume_data.skills])
-        required_skills = set(
-            [skill.lower() for skill in job_description.required_skills]
-        )
-        preferred_skills = set(
-            [skill.lower() for skill in job_description.preferred_skills]
-        )
+        # Canonical skill IDs, so "Postgres" matches "postgresql"
+        resume_skills = self.skill_index.ids(resume_data.skills)
+        required_skills, preferred_skills = self._job_skill_ids(job_description)
 
         # Calculate matches
         required_matches = len(resume_skills.intersection(required_skills))
@@ -206,16 +456,9 @@ class ATSScoringEngine:
             )  # 30% weight for preferred
 
         # Use TF-IDF similarity for overall text matching
-        try:
-            documents = [resume_data.raw_text.lower(), job_description.raw_text.lower()]
-            vectorizer = TfidfVectorizer(
-                stop_words="english", ngram_range=(1, 2), max_features=1000
-            )
-            tfidf_matrix = vectorizer.fit_transform(documents)
-            similarity = cosine_similarity(tfidf_matrix[0:1], tfidf_matrix[1:2])[0][0]
-            text_similarity_score = similarity * 100
-        except:
-            text_similarity_score = 0
+        text_similarity_score = self._job_text_similarity(
+            resume_data.raw_text, job_description
+        )
 
         # Combine scores (70% skills match, 30% text similarity)
         final_score = (
@@ -226,7 +469,7 @@ class ATSScoringEngine:
         return min(final_score, 100)
 
     def calculate_title_match_score(
-        self, resume_data: ResumeData, job_description: JobDescription
+        self, resume_data: ResumeData, job_description: JobLike
     ) -> float:
         """Calculate job title matching score"""
         if not resume_data.experience:
@@ -234,11 +477,14 @@ class ATSScoringEngine:
 
         # Get most recent job title
         recent_title = resume_data.experience[0].title.lower()
-        target_title = job_description.title.lower()
+        target_title = job_description_of(job_description).title.lower()
 
         # Calculate similarity using word overlap
         recent_words = set(recent_title.split())
-        target_words = set(target_title.split())
+        if isinstance(job_description, ParsedJob):
+            target_words = set(job_description.title_tokens)
+        else:
+            target_words = set(target_title.split())
 
         if len(target_words) == 0:
             return 50  # Default score if no target title
@@ -317,9 +563,8 @@ class ATSScoringEngine:
         if not resume_data.experience:
             return 0
 
-        # Extract years from job description
-        exp_requirement = job_description.experience_requirements
-        required_years = self._extract_years_from_text(exp_requirement)
+        # Parsed once with the job description
+        required_years = job_description.required_years or 0
 
         # Calculate total experience years from resume
         total_years = 0
@@ -343,45 +588,25 @@ class ATSScoringEngine:
 
         return min(score, 100)
 
-    def _extract_years_from_text(self, text: str) -> int:
-        """Extract years from text like '3+ years' or '2-5 years'"""
-        if not text:
-            return 0
-
-        # Look for patterns like "3+ years", "2-5 years", "minimum 4 years"
-        patterns = [
-            r"(\d+)\+?\s*years?",
-            r"minimum\s+of\s+(\d+)",
-            r"at\s+least\s+(\d+)",
-            r"(\d+)-\d+\s*years?",
-        ]
-
-        for pattern in patterns:
-            match = re.search(pattern, text.lower())
-            if match:
-                return int(match.group(1))
-
-        return 0
-
     def _extract_years_from_duration(self, duration: str) -> float:
         """Extract years from duration string like '2020-2023' or '2 years'"""
         if not duration:
             return 0
 
         # Try to extract year range
-        year_match = re.search(r"(\d{4})\s*-\s*(\d{4})", duration)
+        year_match = patterns.DURATION_YEAR_RANGE.search(duration)
         if year_match:
             start_year = int(year_match.group(1))
             end_year = int(year_match.group(2))
             return end_year - start_year
 
         # Try to extract explicit years
-        years_match = re.search(r"(\d+(?:\.\d+)?)\s*years?", duration.lower())
+        years_match = patterns.DURATION_YEARS.search(duration.lower())
         if years_match:
             return float(years_match.group(1))
 
         # Try to extract months and convert
-        months_match = re.search(r"(\d+)\s*months?", duration.lower())
+        months_match = patterns.DURATION_MONTHS.search(duration.lower())
         if months_match:
             return int(months_match.group(1)) / 12
 
@@ -410,11 +635,11 @@ class ATSScoringEngine:
         text = resume_data.raw_text
 
         # Bullet points usage
-        if re.search(r"[•\-\*]\s+", text):
+        if patterns.BULLET_MARKER.search(text):
             score += 10
 
         # Consistent structure (check for section headers)
-        section_headers = len(re.findall(r"\n[A-Z][A-Z\s]+:\s*\n", text))
+        section_headers = len(patterns.SECTION_HEADER.findall(text))
         if section_headers >= 3:
             score += 10
         elif section_headers >= 1:
@@ -428,7 +653,8 @@ class ATSScoringEngine:
             score += 5
 
         # Check for excessive special characters
-        special_char_ratio = len(re.findall(r"[^\w\s\-\.\,\(\)]", text)) / len(text)
+        special_chars = len(patterns.SPECIAL_CHARACTER.findall(text))
+        special_char_ratio = special_chars / len(text)
         if special_char_ratio < 0.05:
             score += 5
 
@@ -439,10 +665,8 @@ class ATSScoringEngine:
         text = resume_data.raw_text.lower()
         score = 0
 
-        # Count action verbs usage
-        action_verb_count = 0
-        for verb in self.action_verbs:
-            action_verb_count += len(re.findall(rf"\b{verb}\b", text))
+        # Count action verbs usage in a single scan
+        action_verb_count = len(self.action_verbs_pattern.findall(text))
 
         # Score based on action verb density
         word_count = len(text.split())
@@ -453,23 +677,20 @@ class ATSScoringEngine:
             verb_score = 0
 
         # Check for passive voice (deduct points)
-        passive_indicators = ["was", "were", "been", "being"]
-        passive_count = sum(
-            len(re.findall(rf"\b{indicator}\b", text))
-            for indicator in passive_indicators
-        )
+        passive_count = len(patterns.PASSIVE_INDICATORS.findall(text))
         passive_penalty = min(passive_count * 2, 20)  # Max 20 point penalty
 
         # Check for quantified achievements (bonus points)
-        numbers_pattern = r"\d+%|\d+\s*(?:percent|million|thousand|k\b)"
-        quantified_achievements = len(re.findall(numbers_pattern, text))
+        quantified_achievements = len(
+            patterns.QUANTIFIED_ACHIEVEMENT.findall(text)
+        )
         quantified_bonus = min(quantified_achievements * 5, 20)  # Max 20 point bonus
 
         # Professional language check (basic grammar)
         grammar_score = 20  # Base score
 
         # Check for common grammar issues
-        if re.search(r"\bi\s", text):  # First person usage (should be avoided)
+        if patterns.FIRST_PERSON.search(text):  # First person usage (should be avoided)
             grammar_score -= 10
 
         total_score = verb_score + grammar_score + quantified_bonus - passive_penalty
@@ -481,7 +702,7 @@ class ATSScoringEngine:
         score = 0
 
         # Sentence length analysis
-        sentences = re.split(r"[.!?]+", text)
+        sentences = patterns.SENTENCE_SPLIT.split(text)
         if sentences:
             avg_sentence_length = sum(len(s.split()) for s in sentences) / len(
                 sentences
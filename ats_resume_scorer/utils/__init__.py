@@ -4,5 +4,16 @@ Utility Functions Package
 """
 
 from .report_generator import ReportGenerator, RecommendationItem
+from .cache import LRUCache, ResumeCache, content_hash
+from .job_index import IngestStats, JobIndex, read_postings
 
-__all__ = ["ReportGenerator", "RecommendationItem"]
+__all__ = [
+    "ReportGenerator",
+    "RecommendationItem",
+    "LRUCache",
+    "ResumeCache",
+    "content_hash",
+    "IngestStats",
+    "JobIndex",
+    "read_postings",
+]
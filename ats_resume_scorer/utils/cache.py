@@ -0,0 +1,247 @@
+# ats_resume_scorer/utils/cache.py
+"""
+Caching Utilities - Thread-safe LRU caches keyed by content hashes
+"""
+
+import hashlib
+import json
+import logging
+import sqlite3
+import threading
+import time
+from collections import OrderedDict
+from pathlib import Path
+from typing import Any, Callable, Dict, Hashable, List, Optional, TypeVar, Union
+
+from ..parsers.resume_parser import ResumeData, PARSER_VERSION
+
+logger = logging.getLogger(__name__)
+
+T = TypeVar("T")
+
+
+def content_hash(data: Any) -> str:
+    """Return the SHA-256 hex digest of text or bytes"""
+    if isinstance(data, str):
+        data = data.encode("utf-8")
+    return hashlib.sha256(data).hexdigest()
+
+
+class LRUCache:
+    """Bounded least-recently-used cache with hit/miss counters"""
+
+    def __init__(self, maxsize: int = 128):
+        """
+        Initialize the cache
+
+        Args:
+            maxsize: Maximum number of entries kept; 0 disables caching
+        """
+        self.maxsize = maxsize
+        self.hits = 0
+        self.misses = 0
+        self._data: "OrderedDict[Hashable, Any]" = OrderedDict()
+        self._lock = threading.Lock()
+
+    def __len__(self) -> int:
+        return len(self._data)
+
+    def __contains__(self, key: Hashable) -> bool:
+        return key in self._data
+
+    def get(self, key: Hashable, default: Optional[Any] = None) -> Any:
+        """Look up a key, counting the hit or miss and refreshing its recency"""
+        with self._lock:
+            if key in self._data:
+                self._data.move_to_end(key)
+                self.hits += 1
+                return self._data[key]
+            self.misses += 1
+            return default
+
+    def put(self, key: Hashable, value: Any) -> None:
+        """Store a value, evicting the least recently used entry when full"""
+        if self.maxsize <= 0:
+            return
+        with self._lock:
+            self._data[key] = value
+            self._data.move_to_end(key)
+            while len(self._data) > self.maxsize:
+                self._data.popitem(last=False)
+
+    def get_or_compute(self, key: Hashable, factory: Callable[[], T]) -> T:
+        """Return the cached value for key, computing and storing it on a miss"""
+        sentinel = object()
+        value = self.get(key, sentinel)
+        if value is sentinel:
+            # Computed outside the lock so slow factories don't serialize callers
+            value = factory()
+            self.put(key, value)
+        return value
+
+    def values(self) -> List[Any]:
+        """Snapshot of the cached values, least recently used first"""
+        with self._lock:
+            return list(self._data.values())
+
+    def clear(self) -> None:
+        """Remove all entries and reset the counters"""
+        with self._lock:
+            self._data.clear()
+            self.hits = 0
+            self.misses = 0
+
+    def stats(self) -> Dict[str, Any]:
+        """Return size and hit-rate statistics"""
+        lookups = self.hits + self.misses
+        return {
+            "size": len(self._data),
+            "maxsize": self.maxsize,
+            "hits": self.hits,
+            "misses": self.misses,
+            "hit_rate": round(self.hits / lookups, 4) if lookups else 0.0,
+        }
+
+
+class ResumeCache:
+    """Two-tier cache of parsed resumes keyed by file content
+
+    Entries are keyed by the SHA-256 of the file bytes plus the parser
+    version and the skills database fingerprint, so renamed or copied files
+    still hit while any change to the file, the extraction logic or the
+    skills extracted against misses. The memory tier is an LRU; the
+    optional disk tier is a SQLite database under ``cache_dir`` that
+    survives restarts and is shared by CLI runs and worker processes.
+    """
+
+    DB_FILENAME = "resume_cache.sqlite3"
+
+    # Seconds a writer waits on another process's lock before giving up
+    BUSY_TIMEOUT = 5.0
+
+    def __init__(
+        self,
+        maxsize: int = 256,
+        cache_dir: Optional[Union[str, Path]] = None,
+        parser_version: str = PARSER_VERSION,
+        skills_fingerprint: str = "",
+    ):
+        """
+        Initialize the cache
+
+        Args:
+            maxsize: Number of parsed resumes kept in memory
+            cache_dir: Directory for the on-disk tier (optional)
+            parser_version: Version stamp mixed into every key
+            skills_fingerprint: Fingerprint of the skills database the parser uses
+        """
+        self.memory = LRUCache(maxsize=maxsize)
+        self.parser_version = parser_version
+        self.skills_fingerprint = skills_fingerprint
+        self.disk_hits = 0
+        self.disk_misses = 0
+        self._db: Optional[sqlite3.Connection] = None
+        self._db_lock = threading.Lock()
+
+        if cache_dir:
+            self.db_path: Optional[Path] = Path(cache_dir) / self.DB_FILENAME
+            self.db_path.parent.mkdir(parents=True, exist_ok=True)
+            self._db = sqlite3.connect(
+                str(self.db_path), timeout=self.BUSY_TIMEOUT, check_same_thread=False
+            )
+            self._db.execute("PRAGMA journal_mode=WAL")
+            self._db.execute(
+                "CREATE TABLE IF NOT EXISTS resumes ("
+                "key TEXT PRIMARY KEY, data TEXT NOT NULL, created_at REAL NOT NULL)"
+            )
+            self._db.commit()
+        else:
+            self.db_path = None
+
+    def key_for(self, data: Union[bytes, memoryview]) -> str:
+        """Build the cache key for raw file bytes"""
+        return f"{self.parser_version}:{self.skills_fingerprint}:{content_hash(data)}"
+
+    def get(self, key: str) -> Optional[ResumeData]:
+        """Return cached resume data, promoting disk hits into memory"""
+        resume_data = self.memory.get(key)
+        if resume_data is not None or self._db is None:
+            return resume_data
+
+        try:
+            with self._db_lock:
+                row = self._db.execute(
+                    "SELECT data FROM resumes WHERE key = ?", (key,)
+                ).fetchone()
+        except sqlite3.Error as e:
+            # A locked or broken disk tier degrades to a miss, never a failed parse
+            logger.warning(f"Resume cache read failed for {key}: {e}")
+            row = None
+
+        if row is None:
+            self.disk_misses += 1
+            return None
+
+        try:
+            resume_data = ResumeData.from_dict(json.loads(row[0]))
+        except (ValueError, TypeError, KeyError) as e:
+            logger.warning(f"Discarding unreadable resume cache entry {key}: {e}")
+            self.disk_misses += 1
+            return None
+
+        self.disk_hits += 1
+        self.memory.put(key, resume_data)
+        return resume_data
+
+    def put(self, key: str, resume_data: ResumeData) -> None:
+        """Store resume data in memory and, if enabled, on disk"""
+        self.memory.put(key, resume_data)
+        if self._db is None:
+            return
+
+        payload = json.dumps(resume_data.to_dict(), ensure_ascii=False)
+        try:
+            with self._db_lock:
+                self._db.execute(
+                    "INSERT OR REPLACE INTO resumes (key, data, created_at) VALUES (?, ?, ?)",
+                    (key, payload, time.time()),
+                )
+                self._db.commit()
+        except sqlite3.Error as e:
+            # Skipping the write only costs a future re-parse
+            logger.warning(f"Resume cache write failed for {key}: {e}")
+
+    def clear(self) -> None:
+        """Remove all entries from both tiers and reset the counters"""
+        self.memory.clear()
+        self.disk_hits = 0
+        self.disk_misses = 0
+        if self._db is not None:
+            with self._db_lock:
+                self._db.execute("DELETE FROM resumes")
+                self._db.commit()
+
+    def close(self) -> None:
+        """Close the on-disk tier"""
+        if self._db is not None:
+            with self._db_lock:
+                self._db.close()
+                self._db = None
+
+    def stats(self) -> Dict[str, Any]:
+        """Return hit-rate statistics for both tiers"""
+        memory_stats = self.memory.stats()
+        lookups = memory_stats["hits"] + memory_stats["misses"]
+        hits = memory_stats["hits"] + self.disk_hits
+        return {
+            "memory": memory_stats,
+            "disk": {
+                "enabled": self._db is not None,
+                "path": str(self.db_path) if self.db_path else None,
+                "hits": self.disk_hits,
+                "misses": self.disk_misses,
+            },
+            "hits": hits,
+            "misses": lookups - hits,
+            "hit_rate": round(hits / lookups, 4) if lookups else 0.0,
+        }
@@ -0,0 +1,546 @@
+# ats_resume_scorer/utils/job_index.py
+"""
+Job Index - Bulk ingestion of job postings into compiled ParsedJob artifacts
+
+A corpus of postings (a directory of text files, a JSONL file or a CSV
+file) is read, deduplicated by content hash and compiled into one
+``ParsedJob`` artifact per distinct posting, in parallel across processes
+for large batches. A manifest records every source file's size and
+modification time together with the postings it held, so re-ingesting an
+unchanged corpus only stats the files; changed files are re-read, and only
+postings whose content hash has no artifact yet are parsed. Postings that
+can't be read or compiled are reported and left out of the index rather
+than failing the run, and are retried on the next one.
+"""
+
+import csv
+import inspect
+import json
+import logging
+import os
+import time
+from concurrent.futures import ProcessPoolExecutor
+from dataclasses import asdict, dataclass, field
+from pathlib import Path
+from typing import Any, Dict, Iterable, Iterator, List, NamedTuple, Optional, Set, Tuple, Union
+
+from ..parsers.jd_parser import JD_PARSER_VERSION, JobDescriptionParser
+from ..parsers.skill_index import SkillIndex, default_skill_index
+from ..scoring.parsed_job import PARSED_JOB_FORMAT, ParsedJob
+from .cache import content_hash
+
+logger = logging.getLogger(__name__)
+
+# Bump whenever the manifest layout changes
+JOB_INDEX_FORMAT = 2
+
+MANIFEST_NAME = "manifest.json"
+
+# File types read as one posting each when ingesting a directory
+POSTING_SUFFIXES = (".txt", ".md")
+
+# Fewer new postings than this are compiled in-process: starting workers
+# costs more than parsing them
+PARALLEL_INGEST_THRESHOLD = 32
+
+# Files modified this close to the previous run are re-read regardless of
+# their recorded mtime, covering filesystems with coarse timestamps
+RACY_WINDOW_NS = 2_000_000_000
+
+
+class JobPosting(NamedTuple):
+    """One posting read from a corpus"""
+
+    posting_id: str
+    text: str
+
+
+@dataclass
+class IngestStats:
+    """What an ingest run read, compiled and reused"""
+
+    files: int = 0
+    files_read: int = 0
+    postings: int = 0
+    unique: int = 0
+    compiled: int = 0
+    reused: int = 0
+    removed: int = 0
+    seconds: float = 0.0
+    # Postings left out of the index, by posting ID or file location
+    failures: Dict[str, str] = field(default_factory=dict)
+
+    def to_dict(self) -> Dict[str, Any]:
+        return asdict(self)
+
+
+class JobCompiler:
+    """Parses postings and compiles them as a scorer with these settings would
+
+    Built from plain settings so worker processes can construct their own.
+    """
+
+    def __init__(
+        self,
+        skills_db: Optional[Dict[str, List[str]]] = None,
+        tfidf_mode: str = "pair",
+        vectorizer_path: Optional[str] = None,
+    ):
+        # Imported here: the scoring engine imports this package's cache module
+        from ..scoring.scoring_engine import ATSScoringEngine
+
+        self.config = {
+            "skills_db": skills_db,
+            "tfidf_mode": tfidf_mode,
+            "vectorizer_path": vectorizer_path,
+        }
+        self.jd_parser = JobDescriptionParser()
+        self.engine = ATSScoringEngine(
+            tfidf_mode=tfidf_mode,
+            vectorizer_path=vectorizer_path,
+            skill_index=SkillIndex(skills_db) if skills_db else None,
+        )
+
+    def compile(self, text: str) -> ParsedJob:
+        """Parse a posting and precompute its scoring features"""
+        return self.engine.compile_job(self.jd_parser.parse_job_description(text))
+
+
+def compiler_settings(compiler_config: Dict[str, Any]) -> Dict[str, Any]:
+    """Everything about a JobCompiler config that changes its artifacts"""
+    skills_db = compiler_config.get("skills_db")
+    skill_index = SkillIndex(skills_db) if skills_db else default_skill_index()
+    vectorizer_path = compiler_config.get("vectorizer_path")
+    return {
+        "job_format": PARSED_JOB_FORMAT,
+        "parser_version": JD_PARSER_VERSION,
+        "skill_index": skill_index.fingerprint,
+        "tfidf_mode": compiler_config.get("tfidf_mode", "pair"),
+        "vectorizer": (
+            content_hash(Path(vectorizer_path).read_bytes()) if vectorizer_path else None
+        ),
+    }
+
+
+def read_postings(
+    path: Union[str, Path],
+    name: Optional[str] = None,
+    text_field: str = "description",
+    title_field: Optional[str] = "title",
+    id_field: str = "id",
+    skipped: Optional[Dict[str, str]] = None,
+) -> Iterator[JobPosting]:
+    """Postings in one corpus file
+
+    ``.jsonl`` and ``.csv`` files hold one posting per record: its text is
+    ``text_field``, led by ``title_field`` when the text doesn't already
+    start with it, and its ID is ``id_field`` or else ``<name>:<line>``.
+    Any other file is a single posting identified by ``name``, which
+    defaults to the file name. Records that aren't valid JSON objects or
+    have no text are logged and skipped, and recorded in ``skipped`` by
+    ``<name>:<line>`` when it is given.
+    """
+    path = Path(path)
+    name = name or path.name
+    suffix = path.suffix.lower()
+    skipped = {} if skipped is None else skipped
+    if suffix == ".jsonl":
+        with open(path, "r", encoding="utf-8") as f:
+            records = _jsonl_records(name, f, skipped)
+            yield from _record_postings(
+                name, records, text_field, title_field, id_field, skipped
+            )
+    elif suffix == ".csv":
+        with open(path, "r", encoding="utf-8", newline="") as f:
+            records = enumerate(csv.DictReader(f), 2)
+            yield from _record_postings(
+                name, records, text_field, title_field, id_field, skipped
+            )
+    else:
+        text = path.read_text(encoding="utf-8", errors="replace").strip()
+        if text:
+            yield JobPosting(name, text)
+
+
+def reader_settings(reader_options: Dict[str, Any]) -> Dict[str, Any]:
+    """read_postings options with their defaults filled in"""
+    parameters = inspect.signature(read_postings).parameters
+    unknown = set(reader_options) - {"text_field", "title_field", "id_field"}
+    if unknown:
+        raise TypeError(f"Unknown reader options: {', '.join(sorted(unknown))}")
+    return {
+        option: reader_options.get(option, parameters[option].default)
+        for option in ("text_field", "title_field", "id_field")
+    }
+
+
+def _skip(skipped: Dict[str, str], location: str, reason: str) -> None:
+    logger.warning(f"Skipping {location}: {reason}")
+    skipped[location] = reason
+
+
+def _jsonl_records(
+    name: str, lines: Iterable[str], skipped: Dict[str, str]
+) -> Iterator[Tuple[int, Dict[str, Any]]]:
+    for line, raw in enumerate(lines, 1):
+        if not raw.strip():
+            continue
+        try:
+            record = json.loads(raw)
+        except ValueError as e:
+            _skip(skipped, f"{name}:{line}", f"invalid JSON ({e})")
+            continue
+        if not isinstance(record, dict):
+            _skip(skipped, f"{name}:{line}", "not a JSON object")
+            continue
+        yield line, record
+
+
+def _record_postings(
+    name: str,
+    records: Iterable[Tuple[int, Dict[str, Any]]],
+    text_field: str,
+    title_field: Optional[str],
+    id_field: str,
+    skipped: Dict[str, str],
+) -> Iterator[JobPosting]:
+    for line, record in records:
+        text = str(record.get(text_field) or "").strip()
+        if not text:
+            _skip(skipped, f"{name}:{line}", f"no {text_field!r} field")
+            continue
+        title = str(record.get(title_field) or "").strip() if title_field else ""
+        if title and not text.startswith(title):
+            text = f"{title}\n{text}"
+        posting_id = record.get(id_field)
+        yield JobPosting(
+            str(posting_id) if posting_id not in (None, "") else f"{name}:{line}",
+            text,
+        )
+
+
+def scan_corpus(source: Union[str, Path]) -> Dict[str, Tuple[str, os.stat_result]]:
+    """The files making up a corpus, by name, with their paths and stats
+
+    A directory contributes every posting, JSONL and CSV file below it,
+    named relative to it so nested names stay distinct; a file is its own
+    corpus.
+    """
+    source = Path(source)
+    if source.is_file():
+        return {source.name: (str(source), source.stat())}
+    if not source.is_dir():
+        raise FileNotFoundError(f"Job posting source not found: {source}")
+
+    suffixes = POSTING_SUFFIXES + (".jsonl", ".csv")
+    files: Dict[str, Tuple[str, os.stat_result]] = {}
+    pending = [("", str(source))]
+    while pending:
+        prefix, directory = pending.pop()
+        with os.scandir(directory) as entries:
+            for entry in entries:
+                if entry.is_dir():
+                    pending.append((f"{prefix}{entry.name}/", entry.path))
+                elif entry.is_file() and os.path.splitext(entry.name)[1].lower() in suffixes:
+                    files[prefix + entry.name] = (entry.path, entry.stat())
+    return dict(sorted(files.items()))
+
+
+class JobIndex:
+    """A directory of compiled jobs mirroring one corpus of postings
+
+    Layout: ``manifest.json`` maps posting IDs to content hashes and records
+    the source files they came from; ``jobs/<hh>/<hash>.json`` holds one
+    ``ParsedJob`` per distinct posting.
+    """
+
+    def __init__(self, directory: Union[str, Path]):
+        self.directory = Path(directory)
+        self._manifest: Optional[Dict[str, Any]] = None
+
+    @property
+    def manifest(self) -> Dict[str, Any]:
+        """The stored manifest, or an empty one for a new index"""
+        if self._manifest is None:
+            path = self.directory / MANIFEST_NAME
+            manifest = None
+            if path.is_file():
+                with open(path, "r", encoding="utf-8") as f:
+                    manifest = json.load(f)
+                if manifest.get("format") != JOB_INDEX_FORMAT:
+                    logger.warning(
+                        f"Ignoring job index manifest with format {manifest.get('format')!r}"
+                    )
+                    manifest = None
+            self._manifest = manifest or {
+                "format": JOB_INDEX_FORMAT,
+                "settings": None,
+                "source": None,
+                "ingested_at_ns": 0,
+                "files": {},
+                "postings": {},
+            }
+        return self._manifest
+
+    def __len__(self) -> int:
+        return len(self.manifest["postings"])
+
+    def __contains__(self, posting_id: str) -> bool:
+        return posting_id in self.manifest["postings"]
+
+    def posting_ids(self) -> List[str]:
+        return list(self.manifest["postings"])
+
+    def content_hash(self, posting_id: str) -> str:
+        """Content hash of a posting; KeyError if it isn't indexed"""
+        return self.manifest["postings"][posting_id]
+
+    def artifact_path(self, digest: str) -> Path:
+        return self.directory / "jobs" / digest[:2] / f"{digest}.json"
+
+    def get(self, posting_id: str) -> ParsedJob:
+        """Load the compiled job for a posting ID"""
+        return ParsedJob.load(self.artifact_path(self.content_hash(posting_id)))
+
+    def items(self) -> Iterator[Tuple[str, ParsedJob]]:
+        """Every posting ID with its compiled job, loading each distinct job once"""
+        loaded: Dict[str, ParsedJob] = {}
+        for posting_id, digest in self.manifest["postings"].items():
+            if digest not in loaded:
+                loaded[digest] = ParsedJob.load(self.artifact_path(digest))
+            yield posting_id, loaded[digest]
+
+    def ingest(
+        self,
+        source: Union[str, Path],
+        compiler_config: Optional[Dict[str, Any]] = None,
+        max_workers: Optional[int] = None,
+        **reader_options: Any,
+    ) -> IngestStats:
+        """
+        Bring the index in line with a corpus of postings
+
+        Args:
+            source: Directory of postings, or a .jsonl, .csv or text file
+            compiler_config: JobCompiler arguments (skills_db, tfidf_mode, vectorizer_path)
+            max_workers: Worker processes for large batches; 1 compiles in-process
+            **reader_options: text_field, title_field and id_field for read_postings
+
+        Returns:
+            Counts of files, postings and compiled jobs, and the postings that failed
+        """
+        started = time.perf_counter()
+        started_ns = time.time_ns()
+        compiler_config = compiler_config or {}
+        manifest = self.manifest
+        stats = IngestStats()
+
+        # Postings read with other options may have other texts and IDs
+        settings = {
+            **compiler_settings(compiler_config),
+            "reader": reader_settings(reader_options),
+        }
+        reusable = settings == manifest["settings"]
+        if not reusable and manifest["settings"] is not None:
+            logger.info("Job index settings changed; recompiling every posting")
+
+        # Entries recorded for another source say nothing about this one
+        source_key = str(Path(source).resolve())
+        recorded = manifest["files"] if reusable and manifest.get("source") == source_key else {}
+
+        files: Dict[str, Any] = {}
+        texts: Dict[str, str] = {}
+        corpus = scan_corpus(source)
+        for name, (path, stat) in corpus.items():
+            entry = recorded.get(name)
+            if entry is None or not _unchanged(entry, stat, manifest["ingested_at_ns"]):
+                entry = _read_file(path, name, stat, texts, reader_options)
+                stats.files_read += 1
+            files[name] = entry
+
+        postings: Dict[str, str] = {}
+        conflicts: Dict[str, Set[str]] = {}
+        unique: Set[str] = set()
+        for entry in files.values():
+            stats.failures.update(entry["skipped"])
+            for posting_id, digest in entry["postings"]:
+                unique.add(digest)
+                indexed = postings.setdefault(posting_id, digest)
+                if indexed != digest:
+                    conflicts.setdefault(posting_id, {indexed}).add(digest)
+        # Neither posting is the right one to serve under a shared ID
+        for posting_id, digests in conflicts.items():
+            del postings[posting_id]
+            reason = f"{len(digests)} postings with different content share this ID"
+            logger.warning(f"Skipping posting ID {posting_id!r}: {reason}")
+            stats.failures[posting_id] = reason
+        stats.files = len(files)
+        stats.postings = sum(len(entry["postings"]) for entry in files.values())
+        stats.unique = len(unique)
+
+        existing = self._artifacts()
+        pending = sorted(unique - existing if reusable else unique)
+        # Artifacts deleted from under unchanged files: re-read just those files
+        missing = set(pending).difference(texts)
+        for name, entry in files.items():
+            if missing.intersection(digest for _, digest in entry["postings"]):
+                path, stat = corpus[name]
+                _read_file(path, name, stat, texts, reader_options)
+                stats.files_read += 1
+
+        stats.reused = stats.unique - len(pending)
+        errors: Dict[str, str] = {}
+        if pending:
+            jobs = [(texts[digest], str(self.artifact_path(digest))) for digest in pending]
+            results = self._compile(jobs, compiler_config, max_workers)
+            errors = {digest: error for digest, error in zip(pending, results) if error}
+        stats.compiled = len(pending) - len(errors)
+        # Left out of the manifest, so the next ingest tries them again
+        for posting_id, digest in list(postings.items()):
+            if digest in errors:
+                stats.failures[posting_id] = errors[digest]
+                del postings[posting_id]
+
+        # Every compile follows a read, so an untouched corpus skips both writes
+        if stats.files_read or files.keys() != recorded.keys() or not reusable:
+            for digest in existing - unique:
+                self.artifact_path(digest).unlink()
+            stats.removed = len(existing - unique)
+            self._write_manifest(
+                {
+                    "format": JOB_INDEX_FORMAT,
+                    "settings": settings,
+                    "source": source_key,
+                    "ingested_at_ns": started_ns,
+                    "files": files,
+                    "postings": postings,
+                }
+            )
+        stats.seconds = time.perf_counter() - started
+        logger.info(
+            f"Ingested {stats.postings} postings ({stats.unique} unique): "
+            f"{stats.compiled} compiled, {stats.reused} reused in {stats.seconds:.2f}s"
+        )
+        if stats.failures:
+            logger.warning(f"{len(stats.failures)} postings could not be indexed")
+        return stats
+
+    def _compile(
+        self,
+        jobs: List[Tuple[str, str]],
+        compiler_config: Dict[str, Any],
+        max_workers: Optional[int],
+    ) -> List[Optional[str]]:
+        """Compile (text, artifact path) pairs, across processes for large batches
+
+        Returns each job's error message, or None where it was compiled.
+        """
+        logger.info(f"Compiling {len(jobs)} job postings")
+        if max_workers == 1 or len(jobs) < PARALLEL_INGEST_THRESHOLD:
+            compiler = JobCompiler(**compiler_config)
+            return [_compile_job(compiler, job) for job in jobs]
+
+        workers = max_workers or os.cpu_count() or 1
+        with ProcessPoolExecutor(
+            max_workers=workers,
+            initializer=_init_ingest_worker,
+            initargs=(compiler_config,),
+        ) as pool:
+            # Several chunks per worker keeps them busy without a round trip per posting
+            chunksize = max(1, len(jobs) // (workers * 4))
+            return list(pool.map(_compile_in_ingest_worker, jobs, chunksize=chunksize))
+
+    def _artifacts(self) -> Set[str]:
+        """Content hashes of every compiled job on disk"""
+        digests: Set[str] = set()
+        jobs_dir = self.directory / "jobs"
+        if not jobs_dir.is_dir():
+            return digests
+        with os.scandir(jobs_dir) as shards:
+            for shard in shards:
+                if shard.is_dir():
+                    with os.scandir(shard.path) as entries:
+                        digests.update(
+                            entry.name[:-5] for entry in entries if entry.name.endswith(".json")
+                        )
+        return digests
+
+    def _write_manifest(self, manifest: Dict[str, Any]) -> None:
+        self.directory.mkdir(parents=True, exist_ok=True)
+        path = self.directory / MANIFEST_NAME
+        tmp = path.with_suffix(".tmp")
+        with open(tmp, "w", encoding="utf-8") as f:
+            json.dump(manifest, f, separators=(",", ":"))
+        os.replace(tmp, path)
+        self._manifest = manifest
+
+
+def _unchanged(entry: Dict[str, Any], stat: os.stat_result, ingested_at_ns: int) -> bool:
+    """Whether a file still holds the postings recorded for it
+
+    A file modified around the previous run may have been edited again
+    within its timestamp granularity, so it only counts as unchanged once
+    its mtime is safely older than that run.
+    """
+    return (
+        entry["size"] == stat.st_size
+        and entry["mtime_ns"] == stat.st_mtime_ns
+        and stat.st_mtime_ns < ingested_at_ns - RACY_WINDOW_NS
+    )
+
+
+def _read_file(
+    path: str,
+    name: str,
+    stat: os.stat_result,
+    texts: Dict[str, str],
+    reader_options: Dict[str, Any],
+) -> Dict[str, Any]:
+    """Manifest entry for a file, collecting its posting texts by content hash"""
+    postings = []
+    skipped: Dict[str, str] = {}
+    for posting in read_postings(path, name, skipped=skipped, **reader_options):
+        digest = content_hash(posting.text)
+        texts.setdefault(digest, posting.text)
+        postings.append([posting.posting_id, digest])
+    return {
+        "size": stat.st_size,
+        "mtime_ns": stat.st_mtime_ns,
+        "postings": postings,
+        "skipped": skipped,
+    }
+
+
+def _compile_job(compiler: JobCompiler, job: Tuple[str, str]) -> Optional[str]:
+    """Compile one posting and write its artifact; the error message if that failed"""
+    text, path = job
+    try:
+        _write_job(compiler.compile(text), path)
+    except Exception as e:
+        logger.warning(f"Failed to compile job posting for {path}: {e}")
+        return f"{type(e).__name__}: {e}"
+    return None
+
+
+def _write_job(job: ParsedJob, path: str) -> None:
+    """Write an artifact so readers never see a partial file"""
+    target = Path(path)
+    target.parent.mkdir(parents=True, exist_ok=True)
+    tmp = target.with_name(f"{target.name}.{os.getpid()}.tmp")
+    tmp.write_text(job.dumps(), encoding="utf-8")
+    os.replace(tmp, target)
+
+
+# Per-process state for JobIndex.ingest
+_ingest_compiler: Optional[JobCompiler] = None
+
+
+def _init_ingest_worker(compiler_config: Dict[str, Any]) -> None:
+    """Build this process's compiler once"""
+    global _ingest_compiler
+    _ingest_compiler = JobCompiler(**compiler_config)
+
+
+def _compile_in_ingest_worker(job: Tuple[str, str]) -> Optional[str]:
+    """Compile one posting in a worker process and write its artifact"""
+    return _compile_job(_ingest_compiler, job)
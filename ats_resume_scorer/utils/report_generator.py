@@ -5,6 +5,7 @@ Enhanced Report Generator with LLM Integration and Multiple Recommendation Level
 
 from typing import Dict, List, Any, Optional, Literal
 from dataclasses import dataclass
+import asyncio
 import json
 import os
 
@@ -47,6 +48,7 @@ class LLMRecommendationEngine:
     def __init__(self, config: LLMConfig):
         self.config = config
         self.client = None
+        self.async_client = None
         
         if config.enabled:
             self._initialize_llm_client()
@@ -128,6 +130,156 @@ class LLMRecommendationEngine:
         
         return self._parse_llm_response(recommendation, response, level)
     
+    async def aenhance_recommendations(
+        self,
+        basic_recommendations: List[RecommendationItem],
+        resume_data: ResumeData,
+        job_description: JobDescription,
+        level: RecommendationLevel = "normal"
+    ) -> List[RecommendationItem]:
+        """Enhance recommendations concurrently using async LLM clients"""
+        
+        if not self.config.enabled or not self.client:
+            return basic_recommendations
+        
+        async def enhance(rec: RecommendationItem) -> RecommendationItem:
+            try:
+                return await self._aenhance_single_recommendation(
+                    rec, resume_data, job_description, level
+                )
+            except Exception as e:
+                print(f"Warning: Failed to enhance recommendation: {e}")
+                return rec
+        
+        return list(await asyncio.gather(*(enhance(rec) for rec in basic_recommendations)))
+    
+    async def _aenhance_single_recommendation(
+        self,
+        recommendation: RecommendationItem,
+        resume_data: ResumeData,
+        job_description: JobDescription,
+        level: RecommendationLevel
+    ) -> RecommendationItem:
+        """Enhance a single recommendation without blocking the event loop"""
+        
+        prompt = self._build_enhancement_prompt(
+            recommendation, resume_data, job_description, level
+        )
+        
+        if self.config.provider == "openai":
+            response = await self._acall_openai(prompt)
+        elif self.config.provider == "anthropic":
+            response = await self._acall_anthropic(prompt)
+        elif self.config.provider == "gemini":
+            response = await self._acall_gemini(prompt)
+        elif self.config.provider == "local":
+            response = await self._acall_local_model(prompt)
+        else:
+            return recommendation
+        
+        return self._parse_llm_response(recommendation, response, level)
+    
+    def _get_async_client(self):
+        """Create the provider's async client on first use"""
+        if self.async_client is None:
+            if self.config.provider == "openai":
+                import openai
+                self.async_client = openai.AsyncOpenAI(api_key=self.config.api_key)
+            elif self.config.provider == "anthropic":
+                import anthropic
+                self.async_client = anthropic.AsyncAnthropic(api_key=self.config.api_key)
+            elif self.config.provider == "local":
+                import httpx
+                self.async_client = httpx.AsyncClient(timeout=30)
+        return self.async_client
+    
+    async def _acall_openai(self, prompt: str) -> str:
+        """Call OpenAI API asynchronously"""
+        response = await self._get_async_client().chat.completions.create(
+            model=self.config.model,
+            messages=[{"role": "user", "content": prompt}],
+            max_tokens=self.config.max_tokens,
+            temperature=self.config.temperature
+        )
+        return response.choices[0].message.content
+    
+    async def _acall_anthropic(self, prompt: str) -> str:
+        """Call Anthropic API asynchronously"""
+        response = await self._get_async_client().messages.create(
+            model=self.config.model,
+            max_tokens=self.config.max_tokens,
+            temperature=self.config.temperature,
+            messages=[{"role": "user", "content": prompt}]
+        )
+        return response.content[0].text
+    
+    async def _acall_gemini(self, prompt: str) -> str:
+        """Call Google Gemini API asynchronously"""
+        try:
+            generation_config = {
+                "temperature": self.config.temperature,
+                "max_output_tokens": self.config.max_tokens,
+                "top_p": 0.95,
+                "top_k": 64
+            }
+            
+            response = await self.client.generate_content_async(
+                prompt,
+                generation_config=generation_config
+            )
+            
+            if response.candidates and response.candidates[0].content:
+                return response.candidates[0].content.parts[0].text
+            else:
+                return '{"enhanced_message": "Unable to generate enhanced recommendation due to content policy."}'
+                
+        except Exception as e:
+            print(f"Gemini API error: {e}")
+            return '{"enhanced_message": "Error generating enhanced recommendation."}'
+    
+    async def _acall_local_model(self, prompt: str) -> str:
+        """Call local model (e.g., Ollama) asynchronously"""
+        if not self.config.endpoint:
+            raise ValueError("Endpoint required for local model")
+        
+        try:
+            payload = {
+                "model": self.config.model,
+                "prompt": prompt,
+                "stream": False,
+                "options": {
+                    "temperature": self.config.temperature,
+                    "num_predict": self.config.max_tokens
+                }
+            }
+            
+            response = await self._get_async_client().post(
+                self.config.endpoint,
+                json=payload
+            )
+            
+            if response.status_code == 200:
+                result = response.json()
+                return result.get("response", "")
+            else:
+                print(f"Local model error: {response.status_code} - {response.text}")
+                return '{"enhanced_message": "Error calling local model."}'
+                
+        except Exception as e:
+            print(f"Local model connection error: {e}")
+            return '{"enhanced_message": "Failed to connect to local model."}'
+    
+    async def aclose(self) -> None:
+        """Close the async client, if one was created"""
+        client, self.async_client = self.async_client, None
+        if client is None:
+            return
+        close = getattr(client, "aclose", None) or getattr(client, "close", None)
+        if close is not None:
+            result = close()
+            if asyncio.iscoroutine(result):
+                await result
+    
     def _build_enhancement_prompt(
         self,
         recommendation: RecommendationItem,
@@ -483,9 +635,6 @@ class ReportGenerator:
     ) -> Dict[str, Any]:
         """Generate complete ATS scoring report with enhanced recommendations"""
 
-        # Calculate grade
-        grade = self._calculate_grade(scoring_results["total_score"])
-
         # Generate basic recommendations
         basic_recommendations = self._generate_recommendations(
             resume_data, job_description, scoring_results
@@ -503,9 +652,62 @@ class ReportGenerator:
         else:
             enhanced_recommendations = basic_recommendations
 
+        return self._assemble_report(
+            resume_data,
+            job_description,
+            scoring_results,
+            enhanced_recommendations,
+            recommendation_level,
+        )
+
+    async def agenerate_comprehensive_report(
+        self,
+        resume_data: ResumeData,
+        job_description: JobDescription,
+        scoring_results: Dict[str, Any],
+        recommendation_level: RecommendationLevel = "normal"
+    ) -> Dict[str, Any]:
+        """Async variant of generate_comprehensive_report using async LLM clients"""
+
+        basic_recommendations = self._generate_recommendations(
+            resume_data, job_description, scoring_results
+        )
+
+        if self.llm_engine and self.llm_config.enabled:
+            try:
+                enhanced_recommendations = await self.llm_engine.aenhance_recommendations(
+                    basic_recommendations, resume_data, job_description, recommendation_level
+                )
+            except Exception as e:
+                print(f"Warning: LLM enhancement failed: {e}")
+                enhanced_recommendations = basic_recommendations
+        else:
+            enhanced_recommendations = basic_recommendations
+
+        return self._assemble_report(
+            resume_data,
+            job_description,
+            scoring_results,
+            enhanced_recommendations,
+            recommendation_level,
+        )
+
+    def _assemble_report(
+        self,
+        resume_data: ResumeData,
+        job_description: JobDescription,
+        scoring_results: Dict[str, Any],
+        recommendations: List[RecommendationItem],
+        recommendation_level: RecommendationLevel
+    ) -> Dict[str, Any]:
+        """Build the report dict from scores and final recommendations"""
+
+        # Calculate grade
+        grade = self.calculate_grade(scoring_results["total_score"])
+
         # Format recommendations based on level
         formatted_recommendations = self._format_recommendations_by_level(
-            enhanced_recommendations, recommendation_level
+            recommendations, recommendation_level
         )
 
         # Analyze job match
@@ -626,7 +828,7 @@ class ReportGenerator:
         """Convert priority number to text"""
         return {1: "High", 2: "Medium", 3: "Low"}.get(priority, "Medium")
 
-    def _calculate_grade(self, score: float) -> str:
+    def calculate_grade(self, score: float) -> str:
         """Convert numerical score to letter grade"""
         if score >= 90:
             return "A"
@@ -653,6 +855,7 @@ class ReportGenerator:
             "total_word_count": len(resume_data.raw_text.split()),
             "has_linkedin": bool(resume_data.contact_info.linkedin),
             "has_github": bool(resume_data.contact_info.github),
+            "truncated": resume_data.truncated,
         }
 
     def _analyze_job_match(
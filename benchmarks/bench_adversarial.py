@@ -0,0 +1,102 @@
+# benchmarks/bench_adversarial.py
+"""
+Fuzz benchmark - worst-case ResumeParser.parse_text time on hostile text
+
+Usage:
+    python benchmarks/bench_adversarial.py [--cases 300] [--max-chars 200000]
+                                           [--bound 2.0] [--seed 0]
+
+Generates random documents up to ``--max-chars`` (the default extraction
+cap) by mixing ordinary resume lines with runs built to trip backtracking:
+long lines that nearly match a job entry, email, phone or heading, runs of
+separators, whitespace and heading words with no blank lines. It parses
+each one with the default matching budget and exits non-zero if any takes
+longer than ``--bound`` seconds.
+"""
+
+import argparse
+import logging
+import random
+import sys
+import time
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
+
+from ats_resume_scorer.parsers.resume_parser import ResumeParser
+
+RESUME_LINES = [
+    "Jane Smith",
+    "jane.smith@example.com | (555) 987-6543 | linkedin.com/in/janesmith",
+    "PROFESSIONAL EXPERIENCE",
+    "Senior Software Engineer | Example Corp | 2018-2023",
+    "- Led migration to Kubernetes and reduced infrastructure costs by 30%",
+    "Technical Skills: Python, Django, PostgreSQL, AWS, Docker",
+    "EDUCATION",
+    "Bachelor of Science in Computer Science, State University, 2015",
+    "AWS Certified Solutions Architect",
+    "",
+]
+
+# Fragments whose long repetitions used to make a pattern backtrack
+HOSTILE_ATOMS = [
+    " ", "-", " -", "|", "a|", "a | ", "a.", "a@", "a@a.", "@", "1", "+1 ",
+    "(555) ", "http://", "skills ", "Experience ", "b.a.", "Bachelor ",
+    "certified ", "a,", "a", "\n", " \n", "\nA", "Skills:\n", "#",
+]
+
+
+def hostile_document(rng: random.Random, max_chars: int) -> str:
+    parts = []
+    size = 0
+    while size < max_chars:
+        if rng.random() < 0.3:
+            piece = rng.choice(RESUME_LINES) + "\n"
+        else:
+            atom = rng.choice(HOSTILE_ATOMS)
+            piece = atom * rng.randint(1, max(1, (max_chars - size) // len(atom)))
+        parts.append(piece)
+        size += len(piece)
+    return "".join(parts)[:max_chars]
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument("--cases", type=int, default=300)
+    parser.add_argument("--max-chars", type=int, default=200_000)
+    parser.add_argument("--bound", type=float, default=2.0)
+    parser.add_argument("--seed", type=int, default=0)
+    args = parser.parse_args()
+
+    # Budget warnings would drown the report
+    logging.disable(logging.WARNING)
+    rng = random.Random(args.seed)
+    resume_parser = ResumeParser()
+
+    timings = []
+    truncated = 0
+    worst_text = ""
+    for _ in range(args.cases):
+        text = hostile_document(rng, rng.randint(1, args.max_chars))
+        start = time.perf_counter()
+        resume = resume_parser.parse_text(text)
+        elapsed = time.perf_counter() - start
+        truncated += resume.truncated
+        if not timings or elapsed > max(timings):
+            worst_text = text
+        timings.append(elapsed)
+
+    timings.sort()
+    print(f"cases:          {len(timings)}")
+    print(f"median:         {timings[len(timings) // 2] * 1000:.1f} ms")
+    print(f"p99:            {timings[int(len(timings) * 0.99) - 1] * 1000:.1f} ms")
+    print(f"worst:          {timings[-1] * 1000:.1f} ms ({len(worst_text)} chars)")
+    print(f"budget cut-offs: {truncated}")
+    if timings[-1] > args.bound:
+        print(f"FAIL: worst case exceeds {args.bound}s")
+        sys.exit(1)
+    print(f"OK: every document parsed within {args.bound}s")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,84 @@
+# benchmarks/bench_batch_scoring.py
+"""
+Benchmark - keyword scoring for N resumes against one JD, per pair vs vectorized
+
+Usage:
+    python benchmarks/bench_batch_scoring.py [--resumes 50000] [--pairwise-sample 500]
+
+The per-pair path is timed on a sample and extrapolated to the full batch,
+since fitting a vectorizer per pair for 50k resumes takes minutes.
+"""
+
+import argparse
+import random
+import sys
+import time
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
+
+from ats_resume_scorer.parsers.jd_parser import JobDescription
+from ats_resume_scorer.parsers.resume_parser import ResumeData, ContactInfo
+from ats_resume_scorer.scoring.scoring_engine import ATSScoringEngine
+
+SKILLS = [
+    "python", "java", "javascript", "sql", "aws", "docker", "kubernetes",
+    "react", "django", "flask", "git", "linux", "terraform", "spark", "go",
+]
+WORDS = (
+    "developed led designed implemented scalable services data pipelines team "
+    "customers reduced latency improved reliability migrated cloud platform"
+).split()
+
+
+def make_resume(rng: random.Random) -> ResumeData:
+    skills = rng.sample(SKILLS, rng.randint(2, 8))
+    text = " ".join(rng.choices(WORDS + skills, k=300))
+    return ResumeData(
+        contact_info=ContactInfo(emails=[], phones=[]),
+        summary=None,
+        skills=skills,
+        education=[],
+        experience=[],
+        certifications=[],
+        raw_text=text,
+    )
+
+
+def run(n_resumes: int, pairwise_sample: int) -> None:
+    rng = random.Random(0)
+    resumes = [make_resume(rng) for _ in range(n_resumes)]
+    jd = JobDescription(
+        title="Backend Engineer",
+        required_skills=["python", "sql", "aws", "docker"],
+        preferred_skills=["kubernetes", "terraform"],
+        education_requirements=[],
+        experience_requirements="3+ years",
+        responsibilities=[],
+        raw_text="Backend engineer building scalable python services on aws "
+        "with sql data pipelines, docker and kubernetes",
+    )
+
+    engine = ATSScoringEngine(tfidf_mode="pair")
+    sample = resumes[:pairwise_sample]
+    start = time.perf_counter()
+    for resume in sample:
+        engine.calculate_keyword_match_score(resume, jd)
+    pairwise = (time.perf_counter() - start) / len(sample) * n_resumes
+
+    start = time.perf_counter()
+    engine.keyword_match_scores(resumes, jd)
+    vectorized = time.perf_counter() - start
+
+    print(f"resumes:            {n_resumes}")
+    print(f"per pair (est.):    {pairwise:.2f}s")
+    print(f"vectorized:         {vectorized:.2f}s")
+    print(f"speedup:            {pairwise / vectorized:.1f}x")
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument("--resumes", type=int, default=50000)
+    parser.add_argument("--pairwise-sample", type=int, default=500)
+    args = parser.parse_args()
+    run(args.resumes, args.pairwise_sample)
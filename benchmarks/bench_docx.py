@@ -0,0 +1,79 @@
+# benchmarks/bench_docx.py
+"""
+Benchmark - DOCX text extraction with python-docx vs streaming the OOXML
+
+Usage:
+    python benchmarks/bench_docx.py [--paragraphs 200 2000] [--runs 5]
+
+Builds resumes of the given paragraph counts with python-docx (plus a
+skills table) and reports time and peak traced memory for the old
+``Document(...).paragraphs`` join and for ``extractors.extract_docx``.
+"""
+
+import argparse
+import io
+import sys
+import time
+import tracemalloc
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
+
+from docx import Document
+
+from ats_resume_scorer.parsers import extractors
+
+BULLET = "Led migration of 40 services to Kubernetes and cut infrastructure costs by 30%"
+
+
+def make_docx(paragraphs: int) -> bytes:
+    doc = Document()
+    doc.add_paragraph("Jane Smith")
+    table = doc.add_table(rows=4, cols=3)
+    for row in table.rows:
+        for cell in row.cells:
+            cell.text = "Python, Django, AWS"
+    for _ in range(paragraphs):
+        doc.add_paragraph(BULLET)
+    buffer = io.BytesIO()
+    doc.save(buffer)
+    return buffer.getvalue()
+
+
+def python_docx_text(data: bytes) -> str:
+    doc = Document(io.BytesIO(data))
+    return "\n".join([paragraph.text for paragraph in doc.paragraphs])
+
+
+def measure(func, data: bytes, runs: int):
+    best = float("inf")
+    for _ in range(runs):
+        start = time.perf_counter()
+        func(data)
+        best = min(best, time.perf_counter() - start)
+    tracemalloc.start()
+    func(data)
+    peak = tracemalloc.get_traced_memory()[1]
+    tracemalloc.stop()
+    return best, peak
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument("--paragraphs", type=int, nargs="+", default=[200, 2000])
+    parser.add_argument("--runs", type=int, default=5)
+    args = parser.parse_args()
+
+    print(f"{'paragraphs':>10} {'extractor':>12} {'ms':>9} {'peak KiB':>10}")
+    for paragraphs in args.paragraphs:
+        data = make_docx(paragraphs)
+        for name, func in (
+            ("python-docx", python_docx_text),
+            ("streaming", extractors.extract_docx),
+        ):
+            seconds, peak = measure(func, data, args.runs)
+            print(f"{paragraphs:>10} {name:>12} {seconds * 1000:>9.1f} {peak / 1024:>10.0f}")
+
+
+if __name__ == "__main__":
+    main()
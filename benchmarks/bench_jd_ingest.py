@@ -0,0 +1,125 @@
+# benchmarks/bench_jd_ingest.py
+"""
+Benchmark - bulk job description ingestion into a job index
+
+Usage:
+    python benchmarks/bench_jd_ingest.py [--postings 2000] [--duplicates 0.2] [--workers N]
+
+Writes a synthetic corpus of postings (a directory of ``.txt`` files and a
+JSONL file with the same postings), then times ingesting each into a fresh
+job index in-process and with ``--workers`` processes, re-ingesting the
+unchanged corpus, and re-ingesting after one posting is edited.
+"""
+
+import argparse
+import json
+import os
+import random
+import sys
+import tempfile
+import time
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
+
+from ats_resume_scorer.utils.job_index import JobIndex
+
+TITLES = ["Data Engineer", "Backend Engineer", "Frontend Engineer", "ML Engineer", "SRE"]
+SKILLS = [
+    "Python", "SQL", "Airflow", "Spark", "Kafka", "AWS", "Terraform", "React",
+    "TypeScript", "Go", "Kubernetes", "Docker", "PostgreSQL", "GraphQL", "PyTorch",
+]
+TEMPLATE = """{title}
+Company: Company {n}
+Location: Remote
+
+About Us
+We build products for customer {n}.
+
+Responsibilities
+- Design and operate {a} services
+- Own reliability of the {b} platform
+
+Requirements
+- {years}+ years of experience with {a} and {b}
+- Knowledge of {c} and {d}; familiarity with {e}
+- Bachelor's degree in Computer Science or equivalent experience
+
+Nice to have
+- Experience with {f}
+"""
+
+
+def make_posting(rng: random.Random, n: int) -> str:
+    skills = rng.sample(SKILLS, 6)
+    return TEMPLATE.format(
+        title=rng.choice(TITLES),
+        n=n,
+        years=rng.randint(1, 8),
+        **dict(zip("abcdef", skills)),
+    )
+
+
+def timed(func):
+    start = time.perf_counter()
+    stats = func()
+    return time.perf_counter() - start, stats
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument("--postings", type=int, default=2000)
+    parser.add_argument("--duplicates", type=float, default=0.2)
+    parser.add_argument("--workers", type=int, default=os.cpu_count())
+    args = parser.parse_args()
+
+    rng = random.Random(0)
+    postings = []
+    for n in range(args.postings):
+        if postings and rng.random() < args.duplicates:
+            postings.append(rng.choice(postings))
+        else:
+            postings.append(make_posting(rng, n))
+
+    with tempfile.TemporaryDirectory() as root:
+        root = Path(root)
+        corpus_dir = root / "corpus"
+        corpus_dir.mkdir()
+        for n, text in enumerate(postings):
+            (corpus_dir / f"{n:06d}.txt").write_text(text, encoding="utf-8")
+        jsonl = root / "postings.jsonl"
+        with open(jsonl, "w", encoding="utf-8") as f:
+            for n, text in enumerate(postings):
+                f.write(json.dumps({"id": n, "description": text}) + "\n")
+        # Past the racy window, as a corpus written earlier would be
+        old = time.time() - 60
+        for path in [jsonl, *corpus_dir.iterdir()]:
+            os.utime(path, (old, old))
+
+        print(f"{len(postings)} postings, {len(set(postings))} unique, {args.workers} workers")
+        print(f"{'source':>10} {'run':>14} {'seconds':>9} {'read':>7} {'compiled':>9}")
+        for name, source in (("directory", corpus_dir), ("jsonl", jsonl)):
+            runs = [
+                ("cold, 1 proc", root / f"{name}-serial", 1),
+                ("cold, N procs", root / f"{name}-index", args.workers),
+                ("unchanged", root / f"{name}-index", args.workers),
+            ]
+            for label, index_dir, workers in runs:
+                seconds, stats = timed(
+                    lambda: JobIndex(index_dir).ingest(source, max_workers=workers)
+                )
+                print(f"{name:>10} {label:>14} {seconds:>9.3f} {stats.files_read:>7} {stats.compiled:>9}")
+
+            edited = corpus_dir / "000000.txt" if name == "directory" else jsonl
+            with open(edited, "a", encoding="utf-8") as f:
+                f.write("- Experience with Snowflake\n" if name == "directory" else "")
+                if name == "jsonl":
+                    f.write(json.dumps({"id": "new", "description": make_posting(rng, -1)}) + "\n")
+            seconds, stats = timed(
+                lambda: JobIndex(root / f"{name}-index").ingest(source, max_workers=args.workers)
+            )
+            print(f"{name:>10} {'one edit':>14} {seconds:>9.3f} {stats.files_read:>7} {stats.compiled:>9}")
+
+
+if __name__ == "__main__":
+    main()
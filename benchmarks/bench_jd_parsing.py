@@ -0,0 +1,151 @@
+# benchmarks/bench_jd_parsing.py
+"""
+Benchmark - job description parsing over a corpus of postings
+
+Usage:
+    python benchmarks/bench_jd_parsing.py [--corpus PATH ...] [--iterations 20]
+
+``--corpus`` takes posting files or directories of ``.txt`` postings; by
+default the repository's ``job.txt`` and the postings below are used. The
+first table times the skill-indicator scan of every section of every
+posting, running the eight per-indicator patterns the parser used to
+compile against the single compiled alternation. The second times
+``parse_job_description`` end to end per posting.
+"""
+
+import argparse
+import re
+import sys
+import time
+from pathlib import Path
+from typing import List
+
+ROOT = Path(__file__).resolve().parent.parent
+sys.path.insert(0, str(ROOT))
+
+from ats_resume_scorer.parsers.jd_parser import DEFAULT_SKILL_INDICATORS, JobDescriptionParser
+from ats_resume_scorer.parsers.sections import segment_job_description
+
+POSTINGS = [
+    """Senior Data Engineer
+Company: Northwind Analytics
+Location: Austin, TX
+
+About Us
+Northwind builds forecasting tools for retailers.
+
+Responsibilities
+- Design and operate batch and streaming pipelines on AWS
+- Own data quality checks and on-call for the warehouse
+- Partner with analysts to model new sources
+
+Requirements
+- 5+ years of experience with Python and SQL
+- Knowledge of Airflow, dbt and Spark; familiarity with Kafka
+- Proficiency in data modelling and understanding of columnar storage
+- Bachelor's degree in Computer Science or equivalent experience
+
+Nice to have
+- Experience with Terraform or Pulumi
+- Background in retail or supply chain analytics
+
+Benefits
+- Remote-friendly, 401k match, learning budget
+""",
+    """Frontend Engineer (React)
+
+We are looking for a frontend engineer with strong expertise in React and
+TypeScript and a background in accessible design systems. You will work
+closely with designers and backend engineers.
+
+What you'll do:
+- Build and maintain our component library
+- Improve page performance and Core Web Vitals
+- Review code and mentor two junior engineers
+
+What we're looking for:
+- At least 3 years building production React applications
+- Skilled in TypeScript, CSS and testing with Jest or Cypress
+- Understanding of REST and GraphQL APIs
+
+Bonus points:
+- Experience with Next.js and server-side rendering
+- Familiarity with Figma
+
+Salary: $120,000 - $150,000
+""",
+]
+
+LEGACY_INDICATORS = [
+    re.compile(rf"{indicator}\s+([^,.;\n]+)", re.IGNORECASE)
+    for indicator in DEFAULT_SKILL_INDICATORS
+]
+
+
+def load_corpus(paths: List[str]) -> List[str]:
+    """Postings from files and directories, or the built-in corpus"""
+    if not paths:
+        default = ROOT / "job.txt"
+        return ([default.read_text(encoding="utf-8")] if default.is_file() else []) + POSTINGS
+
+    postings = []
+    for path in map(Path, paths):
+        files = sorted(path.glob("*.txt")) if path.is_dir() else [path]
+        postings.extend(f.read_text(encoding="utf-8", errors="replace") for f in files)
+    return postings
+
+
+def legacy_indicators(text: str) -> List[str]:
+    skills = []
+    for pattern in LEGACY_INDICATORS:
+        skills.extend(match.strip() for match in pattern.findall(text))
+    return skills
+
+
+def compiled_indicators(parser: JobDescriptionParser, text: str) -> List[str]:
+    _, pattern = parser._skill_indicators
+    return [match.group(match.lastindex + 1).strip() for match in pattern.finditer(text)]
+
+
+def best_of(func, iterations: int) -> float:
+    best = float("inf")
+    for _ in range(iterations):
+        start = time.perf_counter()
+        func()
+        best = min(best, time.perf_counter() - start)
+    return best
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument("--corpus", nargs="*", default=[])
+    parser.add_argument("--iterations", type=int, default=20)
+    args = parser.parse_args()
+
+    postings = load_corpus(args.corpus)
+    jd_parser = JobDescriptionParser()
+    sections = [
+        posting[section.start : section.end]
+        for posting in postings
+        for section in segment_job_description(posting)
+    ]
+    total_chars = sum(len(posting) for posting in postings)
+    print(f"{len(postings)} postings, {len(sections)} sections, {total_chars} chars")
+
+    print(f"\n{'indicator scan':>16} {'ms':>9}")
+    for name, scan in (
+        ("8 patterns", legacy_indicators),
+        ("alternation", lambda text: compiled_indicators(jd_parser, text)),
+    ):
+        seconds = best_of(lambda: [scan(text) for text in sections], args.iterations)
+        print(f"{name:>16} {seconds * 1000:>9.3f}")
+
+    seconds = best_of(
+        lambda: [jd_parser.parse_job_description(posting) for posting in postings],
+        args.iterations,
+    )
+    print(f"\n{'full parse':>16} {seconds * 1000 / len(postings):>9.3f} ms/posting")
+
+
+if __name__ == "__main__":
+    main()
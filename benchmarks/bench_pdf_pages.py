@@ -0,0 +1,90 @@
+# benchmarks/bench_pdf_pages.py
+"""
+Benchmark - serial vs parallel per-page PDF text extraction
+
+Usage:
+    python benchmarks/bench_pdf_pages.py [--pages 2 8 32 128] [--workers 4]
+
+Builds synthetic text-dense PDFs of each size and extracts them serially and
+split across a warm process pool. Besides the wall-clock times it reports
+the per-page cost and the fixed cost of dispatching one document to the
+pool, and from those estimates the page count at which ``--workers``
+processes start to win. That estimate is what ``PARALLEL_PAGE_THRESHOLD``
+is set from; rerun this on the target hardware to tune ``parallel_pages``.
+"""
+
+import argparse
+import statistics
+import sys
+import time
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
+
+import fitz
+
+from ats_resume_scorer.parsers import extractors
+from ats_resume_scorer.parsers.extractors import UNLIMITED, ExtractionLimits
+
+LINE = (
+    "Led the migration of 40 services to Kubernetes and cut infrastructure "
+    "costs by 30 percent while mentoring four engineers. "
+)
+
+
+def make_pdf(pages: int) -> bytes:
+    doc = fitz.open()
+    for _ in range(pages):
+        doc.new_page().insert_textbox(fitz.Rect(50, 50, 550, 800), LINE * 40)
+    return doc.tobytes()
+
+
+def best_of(runs: int, func) -> float:
+    timings = []
+    for _ in range(runs):
+        start = time.perf_counter()
+        func()
+        timings.append(time.perf_counter() - start)
+    return min(timings)
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.split("\n")[1])
+    parser.add_argument("--pages", type=int, nargs="+", default=[2, 8, 32, 128])
+    parser.add_argument("--workers", type=int, default=4)
+    parser.add_argument("--runs", type=int, default=3)
+    args = parser.parse_args()
+
+    parallel = ExtractionLimits(
+        max_pages=None, max_chars=None, time_budget=None,
+        parallel_pages=1, page_workers=args.workers,
+    )
+    # Warm the pool so process start-up isn't charged to the first document
+    extractors.extract_pdf(make_pdf(args.workers), parallel)
+
+    print(f"{'pages':>6} {'serial ms':>10} {'parallel ms':>12} {'speedup':>8}")
+    per_page, overheads = [], []
+    for pages in args.pages:
+        data = make_pdf(pages)
+        serial_s = best_of(args.runs, lambda: extractors.extract_pdf(data, UNLIMITED))
+        parallel_s = best_of(args.runs, lambda: extractors.extract_pdf(data, parallel))
+        print(
+            f"{pages:>6} {serial_s * 1000:>10.1f} {parallel_s * 1000:>12.1f}"
+            f" {serial_s / parallel_s:>7.2f}x"
+        )
+        per_page.append(serial_s / pages)
+        # With ideal scaling parallel time is serial / workers plus dispatch cost
+        overheads.append(max(0.0, parallel_s - serial_s / min(args.workers, pages)))
+
+    page_cost = statistics.median(per_page)
+    dispatch = statistics.median(overheads)
+    saving = page_cost * (1 - 1 / args.workers)
+    print(f"\nper-page cost:     {page_cost * 1000:.2f} ms")
+    print(f"dispatch overhead: {dispatch * 1000:.2f} ms")
+    if saving > 0:
+        print(f"break-even at {args.workers} workers: ~{dispatch / saving:.0f} pages")
+    extractors.shutdown_page_pools()
+
+
+if __name__ == "__main__":
+    main()
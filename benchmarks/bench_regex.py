@@ -0,0 +1,198 @@
+# benchmarks/bench_regex.py
+"""
+Microbenchmark - per-resume regex time with raw pattern strings vs the compiled registry
+
+Usage:
+    python benchmarks/bench_regex.py [--iterations 200] [--thrash]
+
+Both sides run the same calls over the same text: every pattern the resume
+parser, job description parser and scoring engine use, with the method each
+one is called with. The raw side passes the pattern string to the ``re``
+module functions, as the code did before the registry; the registry side
+calls the compiled pattern. The action verbs and skill indicators are timed
+as the one-pattern-per-word loops they replaced.
+
+``--thrash`` calls ``re.purge()`` before every resume to simulate a process
+that keeps more than 512 distinct patterns alive, which is what happens to
+the ``re`` module cache under a mixed workload.
+"""
+
+import argparse
+import re
+import sys
+import time
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
+
+from ats_resume_scorer.parsers import patterns
+from ats_resume_scorer.parsers.jd_parser import JobDescriptionParser
+from ats_resume_scorer.scoring.scoring_engine import ATSScoringEngine
+
+SAMPLE_RESUME = """
+John Doe
+john.doe@example.com | +1 (555) 123-4567 | linkedin.com/in/johndoe
+github.com/johndoe | https://johndoe.dev
+
+PROFESSIONAL SUMMARY
+Software engineer with 6 years of experience building data platforms.
+
+PROFESSIONAL EXPERIENCE
+Senior Software Engineer | Tech Corp | 2020-2023
+- Developed and maintained web applications using Python and JavaScript
+- Led a team of 5 developers and mentored junior engineers
+- Improved performance by 40% and reduced costs by 2 million
+- Designed, built and launched a data platform; analyzed and resolved incidents
+
+Software Engineer | Startup Inc | 2018 - 2020 (2.5 years, 6 months remote)
+- Built APIs that were used by 300k customers
+
+EDUCATION
+Bachelor of Science in Computer Science, State University, 2018
+M.S. Data Science, Tech Institute, 2020
+
+SKILLS
+- Python, JavaScript, SQL
+- Docker; Kubernetes
+
+CERTIFICATIONS
+AWS Certified Solutions Architect
+"""
+
+SAMPLE_JD = """Senior Data Engineer
+Company: Northwind Analytics
+Location: Austin, TX (Hybrid)
+Salary: $120,000 - $150,000 per year
+
+Northwind Analytics is seeking a Senior Data Engineer to join our platform team.
+
+Requirements
+- Minimum of 5 years of experience with Python and SQL
+- At least 3 years experience in Airflow, Spark & Kafka
+- Knowledge of AWS/GCP; proficiency in Terraform
+- Bachelor's degree in Computer Science or related field
+
+Nice to have
+- Familiarity with dbt and background in streaming systems
+"""
+
+# (pattern, method, extra arguments before the text, text) for every call the
+# parsers and the scoring engine make; scoring runs on the lowered resume
+RESUME, JD, LOWERED = "resume", "jd", "lowered"
+WORKLOAD = {
+    "resume parsing": [
+        (patterns.EMAIL, "findall", (), RESUME),
+        *((pattern, "findall", (), RESUME) for pattern in patterns.PHONES),
+        (patterns.LINKEDIN, "search", (), RESUME),
+        (patterns.GITHUB, "search", (), RESUME),
+        (patterns.WEBSITE, "findall", (), RESUME),
+        (patterns.BULLET_ITEM, "findall", (), RESUME),
+        *((pattern, "findall", (), RESUME) for pattern in patterns.DEGREES),
+        (patterns.YEAR, "search", (), RESUME),
+        (patterns.CERTIFIED_LINE, "findall", (), RESUME),
+    ],
+    "jd parsing": [
+        *((pattern, "search", (), JD) for pattern in patterns.JD_TITLES),
+        (patterns.JD_TITLE_CLEANUP, "sub", ("",), JD),
+        *((pattern, "search", (), JD) for pattern in patterns.JD_COMPANIES),
+        *((pattern, "search", (), JD) for pattern in patterns.JD_LOCATIONS),
+        *((pattern, "search", (), JD) for pattern in patterns.JD_SALARIES),
+        (patterns.JD_YEARS, "findall", (), JD),
+        (patterns.JD_YEARS_EXPERIENCE_TAIL, "search", (), JD),
+        (patterns.JD_YEARS_SKILL_TAIL, "search", (), JD),
+        *((pattern, "findall", (), JD) for pattern in patterns.REQUIRED_YEARS),
+        (patterns.BULLET_ITEM, "findall", (), JD),
+        (patterns.JD_SKILL_PREFIX, "sub", ("",), JD),
+        (patterns.JD_SKILL_DELIMITERS, "split", (), JD),
+        *((pattern, "findall", (), JD) for pattern in patterns.JD_EDUCATION),
+    ],
+    "scoring": [
+        (patterns.DURATION_YEAR_RANGE, "search", (), LOWERED),
+        (patterns.DURATION_YEARS, "search", (), LOWERED),
+        (patterns.DURATION_MONTHS, "search", (), LOWERED),
+        (patterns.BULLET_MARKER, "search", (), RESUME),
+        (patterns.SECTION_HEADER, "findall", (), RESUME),
+        (patterns.SPECIAL_CHARACTER, "findall", (), RESUME),
+        (patterns.PASSIVE_INDICATORS, "findall", (), LOWERED),
+        (patterns.QUANTIFIED_ACHIEVEMENT, "findall", (), LOWERED),
+        (patterns.FIRST_PERSON, "search", (), LOWERED),
+        (patterns.SENTENCE_SPLIT, "split", (), RESUME),
+    ],
+}
+
+
+def raw_calls(group, texts, engine, jd_parser):
+    """The pre-registry calls: pattern strings through the re module cache"""
+    calls = [
+        (getattr(re, method), pattern.pattern, args, texts[text], pattern.flags)
+        for pattern, method, args, text in WORKLOAD[group]
+    ]
+
+    def run():
+        for func, pattern, args, text, flags in calls:
+            func(pattern, *args, text, flags=flags)
+        if group == "jd parsing":
+            for indicator in jd_parser.skill_indicators:
+                re.findall(rf"{indicator}\s+([^,.;\n]+)", texts[JD], re.IGNORECASE)
+        elif group == "scoring":
+            for verb in engine.action_verbs:
+                re.findall(rf"\b{verb}\b", texts[LOWERED])
+
+    return run
+
+
+def registry_calls(group, texts, engine, jd_parser):
+    """The same calls on the compiled patterns"""
+    calls = [
+        (getattr(pattern, method), args, texts[text])
+        for pattern, method, args, text in WORKLOAD[group]
+    ]
+    indicators = patterns.compile_indicator_alternation(jd_parser.skill_indicators)
+
+    def run():
+        for func, args, text in calls:
+            func(*args, text)
+        if group == "jd parsing":
+            list(indicators.finditer(texts[JD]))
+        elif group == "scoring":
+            engine.action_verbs_pattern.findall(texts[LOWERED])
+
+    return run
+
+
+def run(iterations: int, thrash: bool) -> None:
+    engine = ATSScoringEngine()
+    jd_parser = JobDescriptionParser()
+    texts = {
+        RESUME: SAMPLE_RESUME,
+        JD: SAMPLE_JD,
+        LOWERED: SAMPLE_RESUME.lower(),
+    }
+
+    def timed(func) -> float:
+        start = time.perf_counter()
+        for _ in range(iterations):
+            if thrash:
+                re.purge()
+            func()
+        return (time.perf_counter() - start) / iterations * 1e6
+
+    mode = "cache thrashing" if thrash else "warm re cache"
+    print(f"Regex time per resume ({mode}):")
+    print(f"  {'':16} {'raw (us)':>10} {'registry (us)':>14} {'speedup':>8}")
+    totals = [0.0, 0.0]
+    for group in WORKLOAD:
+        before = timed(raw_calls(group, texts, engine, jd_parser))
+        after = timed(registry_calls(group, texts, engine, jd_parser))
+        totals[0] += before
+        totals[1] += after
+        print(f"  {group:16} {before:10.1f} {after:14.1f} {before / after:7.1f}x")
+    print(f"  {'total':16} {totals[0]:10.1f} {totals[1]:14.1f} {totals[0] / totals[1]:7.1f}x")
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument("--iterations", type=int, default=200)
+    parser.add_argument("--thrash", action="store_true")
+    args = parser.parse_args()
+    run(args.iterations, args.thrash)
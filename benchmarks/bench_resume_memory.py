@@ -0,0 +1,153 @@
+# benchmarks/bench_resume_memory.py
+"""
+Benchmark - Memory held by parsed resumes, as ResumeData vs CompactResume
+
+Usage:
+    python benchmarks/bench_resume_memory.py [--resumes 20000] [--text-chars 6000]
+
+Builds synthetic parsed resumes the way the parser produces them (fresh
+string objects per resume, skills drawn from the default skills database),
+measures the traced memory of holding them all, and reports it per 100k
+resumes for ResumeData and for CompactResume keeping, dropping or
+externalizing the raw text. Compact records are built from a stream of
+parses, so only what they retain is counted; externalized text goes to a
+directory of files.
+"""
+
+import argparse
+import gc
+import random
+import sys
+import tempfile
+import tracemalloc
+from pathlib import Path
+from typing import Iterator, MutableMapping
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
+
+from ats_resume_scorer.parsers.compact import CompactResume, SkillVocabulary
+from ats_resume_scorer.parsers.resume_parser import (
+    ContactInfo,
+    Education,
+    Experience,
+    ResumeData,
+    ResumeParser,
+)
+
+TITLES = ["Software Engineer", "Senior Software Engineer", "Data Scientist", "DevOps Engineer"]
+COMPANIES = ["Acme Corp", "Globex", "Initech", "Umbrella", "Hooli", "Stark Industries"]
+DEGREES = ["Bachelor of Science", "Master of Science", "MBA"]
+SCHOOLS = ["State University", "Institute of Technology", "City College"]
+BULLET = "Built and operated services handling {} requests per second"
+
+
+class DirectoryStore(MutableMapping):
+    """Raw text store backed by one file per key"""
+
+    def __init__(self, directory: str):
+        self.directory = Path(directory)
+
+    def __getitem__(self, key: str) -> str:
+        try:
+            return (self.directory / key).read_text(encoding="utf-8")
+        except FileNotFoundError:
+            raise KeyError(key) from None
+
+    def __setitem__(self, key: str, value: str) -> None:
+        (self.directory / key).write_text(value, encoding="utf-8")
+
+    def __delitem__(self, key: str) -> None:
+        (self.directory / key).unlink()
+
+    def __iter__(self) -> Iterator[str]:
+        return (path.name for path in self.directory.iterdir())
+
+    def __len__(self) -> int:
+        return sum(1 for _ in self.directory.iterdir())
+
+
+def fresh(value: str) -> str:
+    """Copy of a string, as a separate parse would allocate it"""
+    return "".join(list(value))
+
+
+def make_resume(rng: random.Random, skills, text_chars: int) -> ResumeData:
+    n = rng.randrange(1_000_000)
+    return ResumeData(
+        contact_info=ContactInfo(
+            emails=[f"candidate{n}@example.com"],
+            phones=[f"+1 555 {n % 1000:03d} {n % 10000:04d}"],
+            linkedin=f"linkedin.com/in/candidate{n}",
+        ),
+        summary=f"Engineer number {n} with experience across backend systems.",
+        skills=[fresh(skill) for skill in rng.sample(skills, 20)],
+        education=[
+            Education(
+                degree=fresh(rng.choice(DEGREES)),
+                institution=fresh(rng.choice(SCHOOLS)),
+                graduation_year=str(rng.randint(1995, 2023)),
+            )
+        ],
+        experience=[
+            Experience(
+                title=fresh(rng.choice(TITLES)),
+                company=fresh(rng.choice(COMPANIES)),
+                duration=f"{2010 + i} - {2012 + i}",
+                description=[BULLET.format(rng.randint(10, 99999)) for _ in range(3)],
+            )
+            for i in range(3)
+        ],
+        certifications=[fresh("AWS Certified Solutions Architect")],
+        raw_text=f"{n} " + "x" * text_chars,
+        sections={"skills": (100, 400), "experience": (400, 2000)},
+    )
+
+
+def traced(build):
+    """Items returned by build and the traced bytes still held by them"""
+    gc.collect()
+    tracemalloc.start()
+    before = tracemalloc.get_traced_memory()[0]
+    items = build()
+    gc.collect()
+    held = tracemalloc.get_traced_memory()[0] - before
+    tracemalloc.stop()
+    return items, held
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument("--resumes", type=int, default=20000)
+    parser.add_argument("--text-chars", type=int, default=6000)
+    args = parser.parse_args()
+
+    skills_db = ResumeParser().skills_db
+    skills = [skill for group in skills_db.values() for skill in group]
+    scale = 100_000 / args.resumes
+
+    def parses():
+        rng = random.Random(0)
+        return (make_resume(rng, skills, args.text_chars) for _ in range(args.resumes))
+
+    resumes, held = traced(lambda: list(parses()))
+    del resumes
+    print(f"{args.resumes} resumes, {args.text_chars}-char raw text; sizes per 100k")
+    print(f"{'representation':>20} {'MiB':>10}")
+    print(f"{'ResumeData':>20} {held * scale / 2**20:>10.1f}")
+
+    for mode in ("keep", "drop", "external"):
+        vocabulary = SkillVocabulary.from_skills_db(skills_db)
+        with tempfile.TemporaryDirectory() as directory:
+            store = DirectoryStore(directory) if mode == "external" else None
+            compact, held = traced(
+                lambda: [
+                    CompactResume.from_resume(resume, vocabulary, mode, store)
+                    for resume in parses()
+                ]
+            )
+            del compact
+        print(f"{'Compact ' + mode:>20} {held * scale / 2**20:>10.1f}")
+
+
+if __name__ == "__main__":
+    main()
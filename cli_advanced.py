@@ -16,6 +16,9 @@ import time
 
 # Import from our package
 from ats_resume_scorer.main import ATSResumeScorer
+from ats_resume_scorer.parsers.extractors import (
+    PARALLEL_PAGE_THRESHOLD, ExtractionLimits, registered_extensions
+)
 from ats_resume_scorer.scoring.scoring_engine import ScoringWeights
 from ats_resume_scorer.utils.report_generator import LLMConfig, RecommendationLevel
 
@@ -47,7 +50,11 @@ def score_single_resume(args):
         scorer = ATSResumeScorer(
             weights=weights, 
             skills_db_path=args.skills_db,
-            llm_config=llm_config
+            llm_config=llm_config,
+            resume_cache_dir=args.cache_dir,
+            tfidf_mode=args.tfidf_mode,
+            vectorizer_path=args.vectorizer,
+            extraction_limits=extraction_limits_from_args(args)
         )
         
         # Score resume
@@ -88,7 +95,7 @@ def score_batch_resumes(args):
     
     # Find all resume files
     resume_files = []
-    extensions = ['*.pdf', '*.docx', '*.txt']
+    extensions = [f'*{ext}' for ext in registered_extensions()]
     for ext in extensions:
         resume_files.extend(resume_dir.glob(ext))
     
@@ -182,7 +189,11 @@ def process_resumes_sequential(resume_files, jd_text, weights, llm_config, recom
     scorer = ATSResumeScorer(
         weights=weights, 
         skills_db_path=args.skills_db,
-        llm_config=llm_config
+        llm_config=llm_config,
+        resume_cache_dir=args.cache_dir,
+        tfidf_mode=args.tfidf_mode,
+        vectorizer_path=args.vectorizer,
+        extraction_limits=extraction_limits_from_args(args)
     )
     
     for i, resume_file in enumerate(resume_files, 1):
@@ -208,19 +219,50 @@ def process_resumes_sequential(resume_files, jd_text, weights, llm_config, recom
     return results
 
 def process_resumes_parallel(resume_files, jd_text, weights, llm_config, recommendation_level, args):
-    """Process resumes in parallel using thread pool"""
+    """Process resumes in parallel using a thread or process pool"""
     results = []
     max_workers = min(args.workers, len(resume_files))
     
+    # One scorer for all workers so the job description is parsed only once
+    scorer = ATSResumeScorer(
+        weights=weights, 
+        skills_db_path=args.skills_db,
+        llm_config=llm_config,
+        resume_cache_dir=args.cache_dir,
+        tfidf_mode=args.tfidf_mode,
+        vectorizer_path=args.vectorizer,
+        extraction_limits=extraction_limits_from_args(args)
+    )
+    
+    if getattr(args, 'executor', 'thread') == 'process':
+        batch = scorer.batch_score_resumes(
+            [str(resume_file) for resume_file in resume_files], jd_text,
+            recommendation_level, max_workers=max_workers, executor='process',
+            compact=False  # Every report is rendered below
+        )
+        for entry in batch:
+            if not entry['success']:
+                results.append({'filename': entry['file_name'], 'error': entry['error']})
+                continue
+            result = entry['result']
+            results.append({
+                'filename': entry['file_name'],
+                'score': result['overall_score'],
+                'grade': result['grade'],
+                'ats_status': result['ats_compatibility']['status'],
+                'llm_enhanced': result.get('llm_enhanced', False),
+                'recommendation_level': recommendation_level,
+                'result': result
+            })
+        return results
+    
+    job_description = scorer.parse_job_description(jd_text)
+    
     def score_resume_worker(resume_file):
         """Worker function for parallel processing"""
-        scorer = ATSResumeScorer(
-            weights=weights, 
-            skills_db_path=args.skills_db,
-            llm_config=llm_config
-        )
         try:
-            result = scorer.score_resume(str(resume_file), jd_text, recommendation_level)
+            resume_data = scorer.parse_resume(str(resume_file))
+            result = scorer.score_resume_against(resume_data, job_description, recommendation_level)
             return {
                 'filename': resume_file.name,
                 'score': result['overall_score'],
@@ -439,6 +481,11 @@ def save_batch_results_json(results: List[Dict[str, Any]], output_path: str):
     with open(output_path, 'w', encoding='utf-8') as f:
         json.dump(results, f, indent=2, ensure_ascii=False)
 
+def extraction_limits_from_args(args) -> ExtractionLimits:
+    """Build extraction limits from command line arguments"""
+    return ExtractionLimits(parallel_pages=getattr(args, 'parallel_pages', None),
+                            layout=getattr(args, 'layout', False))
+
 def load_custom_weights(weights_path: str) -> ScoringWeights:
     """Load custom weights from JSON file"""
     try:
@@ -471,7 +518,9 @@ def compare_resumes(args):
         print(f"✓ Using custom weights from: {args.weights}")
     
     # Score all resumes
-    scorer = ATSResumeScorer(weights=weights, llm_config=llm_config)
+    scorer = ATSResumeScorer(weights=weights, llm_config=llm_config, resume_cache_dir=args.cache_dir,
+                            tfidf_mode=args.tfidf_mode, vectorizer_path=args.vectorizer,
+                            extraction_limits=extraction_limits_from_args(args))
     results = []
     recommendation_level = getattr(args, 'level', 'normal')
     
@@ -534,7 +583,9 @@ def analyze_resume_detailed(args):
         weights = load_custom_weights(args.weights)
     
     # Score resume with detailed level
-    scorer = ATSResumeScorer(weights=weights, llm_config=llm_config)
+    scorer = ATSResumeScorer(weights=weights, llm_config=llm_config, resume_cache_dir=args.cache_dir,
+                            tfidf_mode=args.tfidf_mode, vectorizer_path=args.vectorizer,
+                            extraction_limits=extraction_limits_from_args(args))
     result = scorer.score_resume(args.resume, jd_text, "detailed")
     
     # Generate detailed analysis
@@ -549,6 +600,38 @@ def analyze_resume_detailed(args):
             json.dump(analysis, f, indent=2, ensure_ascii=False)
         print(f"📄 Detailed analysis saved to: {args.output}")
 
+def fit_tfidf_vocabulary(args):
+    """Fit a TF-IDF vectorizer on a resume corpus and save it for --tfidf-mode corpus"""
+    resume_dir = Path(args.resume_dir)
+    if not resume_dir.exists():
+        print(f"❌ Error: Directory {args.resume_dir} does not exist")
+        sys.exit(1)
+
+    resume_files = []
+    for ext in [f'*{ext}' for ext in registered_extensions()]:
+        resume_files.extend(resume_dir.glob(ext))
+
+    scorer = ATSResumeScorer(resume_cache_dir=args.cache_dir)
+    documents = []
+    for resume_file in resume_files:
+        try:
+            documents.append(scorer.parse_resume(str(resume_file)).raw_text)
+        except Exception as e:
+            logger.warning(f"Skipping {resume_file.name}: {e}")
+
+    for jd_path in args.jd or []:
+        with open(jd_path, 'r', encoding='utf-8') as f:
+            documents.append(f.read())
+
+    if not documents:
+        print(f"❌ No documents to fit in {args.resume_dir}")
+        sys.exit(1)
+
+    vectorizer = scorer.scoring_engine.fit_corpus(documents)
+    scorer.scoring_engine.save_vectorizer(args.output)
+    print(f"✓ Fitted {len(vectorizer.vocabulary_)} terms on {len(documents)} documents")
+    print(f"📄 Vectorizer saved to: {args.output}")
+
 def main():
     """Enhanced advanced CLI main function"""
     parser = argparse.ArgumentParser(
@@ -568,6 +651,10 @@ Examples:
   # Detailed analysis with custom LLM settings
   python cli_advanced.py analyze --resume resume.pdf --jd job.txt --enable-llm --llm-model gpt-4
   
+  # Fit a TF-IDF vocabulary once and reuse it for batch scoring
+  python cli_advanced.py fit-tfidf --resume-dir ./resumes --jd job.txt --output tfidf.joblib
+  python cli_advanced.py batch --resume-dir ./resumes --jd job.txt --tfidf-mode corpus --vectorizer tfidf.joblib
+  
 Environment Variables:
   ATS_LLM_ENABLED=true          # Enable LLM integration
   ATS_LLM_API_KEY=your-key      # API key for LLM provider
@@ -582,6 +669,16 @@ Environment Variables:
     def add_common_args(subparser):
         subparser.add_argument('--weights', '-w', help='Custom weights JSON file')
         subparser.add_argument('--skills-db', help='Custom skills database JSON file')
+        subparser.add_argument('--cache-dir', default=os.getenv('ATS_CACHE_DIR'),
+                             help='Directory for the persistent parsed-resume cache (or set ATS_CACHE_DIR)')
+        subparser.add_argument('--tfidf-mode', choices=['pair', 'jd', 'corpus'], default='pair',
+                             help='Fit TF-IDF per resume/JD pair, once per JD, or from a saved corpus vectorizer')
+        subparser.add_argument('--vectorizer', help='Saved TF-IDF vectorizer for --tfidf-mode corpus')
+        subparser.add_argument('--parallel-pages', type=int, nargs='?', const=PARALLEL_PAGE_THRESHOLD,
+                             help=f'Split PDFs with at least this many pages across processes '
+                                  f'(default when given: {PARALLEL_PAGE_THRESHOLD})')
+        subparser.add_argument('--layout', action='store_true',
+                             help='Find PDF section headings from font size and weight')
         subparser.add_argument('--verbose', '-v', action='store_true', help='Verbose output')
         subparser.add_argument('--level', '-l', choices=['concise', 'normal', 'detailed'], 
                              default='normal', help='Recommendation detail level')
@@ -612,6 +709,8 @@ Environment Variables:
     batch_parser.add_argument('--output', '-o', help='Output file path (.json or .csv)')
     batch_parser.add_argument('--parallel', '-p', action='store_true', help='Enable parallel processing')
     batch_parser.add_argument('--workers', type=int, default=4, help='Number of parallel workers')
+    batch_parser.add_argument('--executor', choices=['thread', 'process'], default='thread',
+                            help='Parallel backend; use process for CPU-bound batches on multi-core machines')
     add_common_args(batch_parser)
     
     # Compare resumes command
@@ -628,6 +727,15 @@ Environment Variables:
     analyze_parser.add_argument('--output', '-o', help='Output detailed analysis report')
     add_common_args(analyze_parser)
     
+    # Fit a shared TF-IDF vocabulary for --tfidf-mode corpus
+    fit_parser = subparsers.add_parser('fit-tfidf', help='Fit and save a TF-IDF vectorizer on a resume corpus')
+    fit_parser.add_argument('--resume-dir', '-d', required=True, help='Directory containing resume files')
+    fit_parser.add_argument('--jd', '-j', nargs='*', help='Job description files to include in the corpus')
+    fit_parser.add_argument('--output', '-o', required=True, help='Path to write the fitted vectorizer')
+    fit_parser.add_argument('--cache-dir', default=os.getenv('ATS_CACHE_DIR'),
+                          help='Directory for the persistent parsed-resume cache (or set ATS_CACHE_DIR)')
+    fit_parser.add_argument('--verbose', '-v', action='store_true', help='Verbose output')
+    
     args = parser.parse_args()
     
     if not args.command:
@@ -647,6 +755,8 @@ Environment Variables:
             compare_resumes(args)
         elif args.command == 'analyze':
             analyze_resume_detailed(args)
+        elif args.command == 'fit-tfidf':
+            fit_tfidf_vocabulary(args)
             
     except KeyboardInterrupt:
         print("\n🛑 Operation cancelled by user")
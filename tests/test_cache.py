@@ -0,0 +1,99 @@
+# tests/test_cache.py
+"""
+Test cases for caching utilities
+"""
+
+import pytest
+from ats_resume_scorer.utils.cache import LRUCache, content_hash
+
+
+class TestLRUCache:
+
+    def test_eviction_order(self):
+        """Least recently used entries are evicted first"""
+        cache = LRUCache(maxsize=2)
+        cache.put("a", 1)
+        cache.put("b", 2)
+        cache.get("a")
+        cache.put("c", 3)
+
+        assert "a" in cache
+        assert "b" not in cache
+        assert "c" in cache
+
+    def test_hit_miss_counters(self):
+        """Lookups are counted as hits or misses"""
+        cache = LRUCache(maxsize=4)
+        cache.get_or_compute("key", lambda: "value")
+        cache.get_or_compute("key", lambda: "other")
+
+        stats = cache.stats()
+        assert stats["hits"] == 1
+        assert stats["misses"] == 1
+        assert stats["hit_rate"] == 0.5
+        assert cache.get("key") == "value"
+
+    def test_content_hash(self):
+        """Text and its UTF-8 bytes hash identically"""
+        assert content_hash("résumé") == content_hash("résumé".encode("utf-8"))
+        assert content_hash("a") != content_hash("b")
+
+
+class TestResumeCache:
+
+    def test_disk_tier_survives_restart(self, tmp_path, temp_resume_file):
+        """Parsed resumes persist across scorer instances"""
+        from ats_resume_scorer.main import ATSResumeScorer
+
+        first = ATSResumeScorer(resume_cache_dir=str(tmp_path))
+        parsed = first.parse_resume(temp_resume_file)
+        first.resume_cache.close()
+
+        second = ATSResumeScorer(resume_cache_dir=str(tmp_path))
+        second.resume_parser.parse_resume = None  # Parsing must be skipped
+        cached = second.parse_resume(temp_resume_file)
+
+        assert cached == parsed
+        stats = second.resume_cache.stats()
+        assert stats["disk"]["hits"] == 1
+        assert stats["hit_rate"] == 1.0
+
+    def test_key_includes_parser_version(self):
+        """Changing the parser version invalidates entries"""
+        from ats_resume_scorer.utils.cache import ResumeCache
+
+        data = b"resume bytes"
+        assert ResumeCache(parser_version="1").key_for(data) != ResumeCache(
+            parser_version="2"
+        ).key_for(data)
+
+    def test_key_includes_skills_database(self):
+        """Scorers with different skills databases don't share parsed skills"""
+        from ats_resume_scorer.utils.cache import ResumeCache
+
+        data = b"resume bytes"
+        assert ResumeCache(skills_fingerprint="a").key_for(data) != ResumeCache(
+            skills_fingerprint="b"
+        ).key_for(data)
+
+    def test_locked_database_degrades_to_memory(self, tmp_path, monkeypatch):
+        """A write blocked by another process is skipped instead of raising"""
+        import sqlite3
+
+        from ats_resume_scorer.parsers.resume_parser import ResumeParser
+        from ats_resume_scorer.utils.cache import ResumeCache
+
+        monkeypatch.setattr(ResumeCache, "BUSY_TIMEOUT", 0.05)
+        cache = ResumeCache(cache_dir=str(tmp_path))
+        resume = ResumeParser().parse_text("Jane Doe\njane@example.com")
+
+        other = sqlite3.connect(str(cache.db_path))
+        other.execute("BEGIN EXCLUSIVE")
+        try:
+            cache.put("key", resume)
+        finally:
+            other.rollback()
+            other.close()
+
+        assert cache.get("key") == resume
+        cache.close()
@@ -0,0 +1,93 @@
+# tests/test_compact.py
+"""
+Test cases for compact, immutable resume records
+"""
+
+import dataclasses
+import pickle
+
+import pytest
+
+from ats_resume_scorer.parsers.compact import CompactResume, SkillVocabulary
+from ats_resume_scorer.parsers.resume_parser import ResumeParser
+
+
+class TestCompactResume:
+
+    def setup_method(self):
+        """Setup test fixtures"""
+        self.parser = ResumeParser()
+        self.vocabulary = SkillVocabulary.from_skills_db(self.parser.skills_db)
+
+    def test_round_trip_keeps_every_field(self, sample_resume_text):
+        """Compacting and expanding gives back the parsed resume"""
+        resume = self.parser.parse_text(sample_resume_text)
+        compact = CompactResume.from_resume(resume, self.vocabulary)
+
+        assert compact.to_resume(self.vocabulary) == resume
+        assert pickle.loads(pickle.dumps(compact)) == compact
+
+    def test_records_are_slotted_and_frozen(self, sample_resume_text):
+        """No per-instance dict, and fields can't be reassigned"""
+        compact = CompactResume.from_resume(
+            self.parser.parse_text(sample_resume_text), self.vocabulary
+        )
+
+        for record in (compact, compact.contact_info, compact.experience[0]):
+            assert not hasattr(record, "__dict__")
+        with pytest.raises(dataclasses.FrozenInstanceError):
+            compact.summary = "changed"
+
+    def test_skills_share_vocabulary_ids(self):
+        """Database skills get stable sorted IDs; new skills are appended"""
+        vocabulary = SkillVocabulary(["sql", "Python", "go"])
+        assert vocabulary.names(range(3)) == ["go", "python", "sql"]
+
+        assert vocabulary.ids(["python", "graphql", "python"]) == (1, 3, 1)
+        assert len(vocabulary) == 4 and "graphql" in vocabulary
+
+    def test_new_skills_resolve_across_threads(self):
+        """An ID is only visible once its name is stored, and names are interned"""
+        import sys
+        from concurrent.futures import ThreadPoolExecutor
+
+        vocabulary = SkillVocabulary(["python"])
+        interned = [sys.intern("".join(["skill-", str(n)])) for n in range(2000)]
+        # Equal strings that are not the interned objects
+        skills = ["".join(["skill-", str(n)]) for n in range(2000)]
+
+        def round_trip(skill):
+            return vocabulary.names([vocabulary.intern(skill)])[0]
+
+        with ThreadPoolExecutor(max_workers=8) as pool:
+            names = list(pool.map(round_trip, skills))
+
+        assert names == skills
+        assert all(name is canonical for name, canonical in zip(names, interned))
+
+    def test_raw_text_can_be_dropped_or_externalized(self, sample_resume_text):
+        """Features survive without the text; the store holds one copy"""
+        resume = self.parser.parse_text(sample_resume_text)
+
+        dropped = CompactResume.from_resume(resume, self.vocabulary, raw_text="drop")
+        assert dropped.raw_text is None and dropped.raw_text_key is None
+        with pytest.raises(ValueError):
+            dropped.to_resume(self.vocabulary)
+        expanded = dropped.to_resume(self.vocabulary, allow_missing_text=True)
+        assert expanded.raw_text == "" and expanded.skills == resume.skills
+
+        store = {}
+        first = CompactResume.from_resume(
+            resume, self.vocabulary, raw_text="external", raw_text_store=store
+        )
+        second = CompactResume.from_resume(
+            resume, self.vocabulary, raw_text="external", raw_text_store=store
+        )
+        assert first.raw_text is None and len(store) == 1
+        assert second.raw_text_key == first.raw_text_key
+        assert first.to_resume(self.vocabulary, store) == resume
+        with pytest.raises(ValueError):
+            first.to_resume(self.vocabulary, {})
+
+        with pytest.raises(ValueError):
+            CompactResume.from_resume(resume, self.vocabulary, raw_text="external")
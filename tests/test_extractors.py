@@ -0,0 +1,286 @@
+# tests/test_extractors.py
+"""
+Test cases for format sniffing and the extractor registry
+"""
+
+import codecs
+import io
+import zipfile
+
+import pytest
+
+from ats_resume_scorer.parsers import extractors
+from ats_resume_scorer.parsers.extractors import (
+    UNLIMITED,
+    ExtractionLimits,
+    Extractor,
+    register_extractor,
+    resolve_extractor,
+    sniff_format,
+)
+
+
+def make_pdf(text):
+    import fitz
+
+    doc = fitz.open()
+    doc.new_page().insert_text((72, 72), text)
+    return doc.tobytes()
+
+
+def make_multipage_pdf(pages):
+    import fitz
+
+    doc = fitz.open()
+    for text in pages:
+        doc.new_page().insert_text((72, 72), text)
+    return doc.tobytes()
+
+
+def make_styled_pdf(lines):
+    """PDF from (text, font size, bold) lines"""
+    import fitz
+
+    doc = fitz.open()
+    page = doc.new_page()
+    y = 72
+    for text, size, bold in lines:
+        page.insert_text((72, y), text, fontsize=size, fontname="hebo" if bold else "helv")
+        y += size + 6
+    return doc.tobytes()
+
+
+def make_docx(text):
+    from docx import Document
+
+    buffer = io.BytesIO()
+    doc = Document()
+    doc.add_paragraph(text)
+    doc.save(buffer)
+    return buffer.getvalue()
+
+
+def make_odt(paragraphs):
+    ns = 'xmlns:text="urn:oasis:names:tc:opendocument:xmlns:text:1.0"'
+    body = "".join(f"<text:p>{p}</text:p>" for p in paragraphs)
+    buffer = io.BytesIO()
+    with zipfile.ZipFile(buffer, "w") as archive:
+        archive.writestr(
+            zipfile.ZipInfo("mimetype"), extractors.ODT_MIME, zipfile.ZIP_STORED
+        )
+        archive.writestr("content.xml", f"<doc {ns}><body>{body}</body></doc>")
+    return buffer.getvalue()
+
+
+class TestExtractors:
+
+    def test_sniffing_ignores_misleading_names(self):
+        """Binary signatures win over the declared file name"""
+        assert resolve_extractor(make_pdf("Jane"), "resume.txt").name == "pdf"
+        assert resolve_extractor(make_docx("Jane"), "resume.pdf").name == "docx"
+        assert resolve_extractor(make_odt(["Jane"]), "resume.docx").name == "odt"
+        assert resolve_extractor(b"{\\rtf1 Jane}", "resume.doc").name == "rtf"
+        assert resolve_extractor(b"<!DOCTYPE html><p>Jane", "cv").name == "html"
+        assert resolve_extractor(b"Jane Roe", "resume.pdf").name == "text"
+        assert sniff_format(b"Jane Roe") is None
+
+    def test_unknown_format_is_rejected(self):
+        """Content nothing recognizes keeps raising the historical error"""
+        with pytest.raises(ValueError, match="Unsupported file format: .xyz"):
+            resolve_extractor(b"\x89PNG\r\n\x1a\n\x00\x00\x00\rIHDR", "resume.xyz")
+
+    def test_plain_text_resolves_whatever_its_name(self):
+        """Text uploads with no, unknown or generic names are parsed as text"""
+        text = b"John Doe\nSkills: Python, SQL\n"
+
+        assert resolve_extractor(text, "resume").name == "text"
+        assert resolve_extractor(text, "application/octet-stream").name == "text"
+        for name in ("resume.bin", "resume.md", "resume.doc"):
+            assert resolve_extractor(text, name).name == "text"
+
+    def test_rtf_html_and_odt_text(self):
+        """Lightweight extractors keep the document text and drop markup"""
+        rtf = (
+            rb"{\rtf1\ansi{\fonttbl{\f0 Arial;}}{\*\generator Word;}"
+            rb"Jane Roe\par Python\'2c SQL \u8226? AWS}"
+        )
+        html = (
+            b"<html><head><style>p{}</style></head>"
+            b"<body><h1>Jane</h1><ul><li>Python</li></ul></body></html>"
+        )
+
+        assert extractors.extract_rtf(rtf) == "Jane Roe\nPython, SQL • AWS"
+        assert extractors.extract_html(html) == "Jane\n\n• Python"
+        assert extractors.extract_odt(make_odt(["Jane", "Python"])) == "Jane\nPython"
+
+    def test_custom_extractor_plugs_in(self):
+        """New formats register without changes to the parser"""
+        custom = Extractor(
+            name="upper",
+            extract=lambda data: data.decode().lower(),
+            extensions=(".upper",),
+            sniff=lambda data: data.startswith(b"UPPER:"),
+        )
+        register_extractor(custom)
+        try:
+            assert resolve_extractor(b"UPPER:JANE", "resume.txt") is custom
+            assert extractors.declared_format("x.upper") == "upper"
+        finally:
+            extractors._registry.pop("upper")
+
+        with pytest.raises(ValueError):
+            Extractor(name="bad", extract=str, cost="free")
+
+    def test_pdf_extraction_stops_at_page_and_char_limits(self):
+        """Paged extraction reads only the pages its budget allows"""
+        data = make_multipage_pdf([f"Page {n} text" for n in range(1, 6)])
+
+        full = extractors.extract_pdf(data, UNLIMITED)
+        assert not full.truncated and full.pages == 5
+        assert "Page 5" in full.text
+
+        paged = extractors.extract_pdf(data, ExtractionLimits(max_pages=2))
+        assert paged.truncated and paged.pages == 2
+        assert "Page 2" in paged.text and "Page 3" not in paged.text
+
+        capped = resolve_extractor(data, "cv.pdf").run(
+            data, ExtractionLimits(max_chars=8)
+        )
+        assert capped.truncated and capped.pages == 1
+        assert capped.text == "Page 1 t"
+
+        text = resolve_extractor(b"Jane Roe", "cv.txt").run(
+            b"Jane Roe", ExtractionLimits(max_chars=4)
+        )
+        assert text.truncated and text.text == "Jane"
+
+    def test_parallel_pdf_extraction_keeps_page_order(self):
+        """Splitting pages across processes reassembles the serial text"""
+        data = make_multipage_pdf([f"Page {n} text" for n in range(1, 8)])
+        parallel = ExtractionLimits(parallel_pages=4, page_workers=2)
+        try:
+            result = extractors.extract_pdf(data, parallel)
+            assert result.text == extractors.extract_pdf(data, UNLIMITED).text
+            assert not result.truncated and result.pages == 7
+
+            capped = extractors.extract_pdf(
+                data, ExtractionLimits(max_pages=5, parallel_pages=4, page_workers=2)
+            )
+            assert capped.truncated and capped.pages == 5
+            assert "Page 5" in capped.text and "Page 6" not in capped.text
+
+            # More workers than pages, and no pages at all
+            few = ExtractionLimits(max_pages=2, parallel_pages=1, page_workers=8)
+            assert extractors.extract_pdf(data, few).pages == 2
+            none = ExtractionLimits(max_pages=0, parallel_pages=1, page_workers=2)
+            assert extractors.extract_pdf(data, none).text == ""
+        finally:
+            extractors.shutdown_page_pools()
+
+    def test_page_budget_applies_before_extraction(self):
+        """max_pages=0 and 1 give the same result serially and in parallel"""
+        data = make_multipage_pdf([f"Page {n} text" for n in range(1, 4)])
+        try:
+            for max_pages, expected in ((0, ""), (1, "Page 1")):
+                for parallel_pages in (None, 1):
+                    limits = ExtractionLimits(
+                        max_pages=max_pages, parallel_pages=parallel_pages, page_workers=2
+                    )
+                    result = extractors.extract_pdf(data, limits)
+                    assert result.pages == max_pages and result.truncated
+                    assert result.text.strip().startswith(expected)
+                    assert "Page 2" not in result.text
+        finally:
+            extractors.shutdown_page_pools()
+
+        pulled = []
+        pages = (pulled.append(text) or text for text in ["p1", "p2"])
+        result = extractors.join_pages(pages, 2, ExtractionLimits(max_pages=0))
+        assert (result.text, result.pages, pulled) == ("", 0, [])
+
+    def test_layout_mode_maps_styled_headings(self):
+        """Bold or enlarged headings become sections; look-alike body lines don't"""
+        data = make_styled_pdf([
+            ("Jane Roe", 18, True),
+            ("Skills", 13, True),
+            ("Python, Django, AWS", 10, False),
+            ("Experience", 10, False),
+            ("EDUCATION", 10, False),
+            ("Bachelor of Science, State University 2018", 10, False),
+        ])
+
+        blocks = extractors.extract_pdf_blocks(data)
+        assert [b.heading for b in blocks if b.heading] == ["skills", "education"]
+        assert blocks[0].bold and blocks[0].size == 18
+
+        result = extractors.extract_pdf(data, ExtractionLimits(layout=True))
+        sections = result.sections
+        assert list(sections.spans()) == ["skills", "education"]
+        assert sections.text(result.text, "skills", body=True) == (
+            "Python, Django, AWS\nExperience\n"
+        )
+        assert sections.text(result.text, "education").startswith("EDUCATION\n")
+
+        clipped = resolve_extractor(data, "cv.pdf").run(
+            data, ExtractionLimits(layout=True, max_chars=sections.get("education").start)
+        )
+        assert list(clipped.sections.spans()) == ["skills"]
+
+    def test_docx_streams_tables_headers_and_text_boxes(self):
+        """Content python-docx's paragraph list misses is extracted in order"""
+        from docx import Document
+
+        doc = Document()
+        doc.sections[0].header.paragraphs[0].text = "Jane Roe | jane@example.com"
+        doc.add_paragraph("Summary")
+        paragraph = doc.add_paragraph("Backend engineer ")
+        paragraph.add_run("with Python").bold = True
+        table = doc.add_table(rows=1, cols=2)
+        table.rows[0].cells[0].text = "Skills"
+        table.rows[0].cells[1].text = "Go, Rust"
+        table.rows[0].cells[1].add_paragraph("SQL")
+        buffer = io.BytesIO()
+        doc.save(buffer)
+
+        assert extractors.extract_docx(buffer.getvalue()) == (
+            "Jane Roe | jane@example.com\n"
+            "Summary\n"
+            "Backend engineer with Python\n"
+            "Skills\tGo, Rust SQL"
+        )
+
+        w = 'xmlns:w="http://schemas.openxmlformats.org/wordprocessingml/2006/main"'
+        mc = 'xmlns:mc="http://schemas.openxmlformats.org/markup-compatibility/2006"'
+        text_box = "<w:txbxContent><w:p><w:r><w:t>Certified Kubernetes</w:t></w:r></w:p></w:txbxContent>"
+        body = (
+            f"<w:document {w} {mc}><w:body><w:p><w:r><w:t>Before</w:t></w:r>"
+            f"<w:r><mc:AlternateContent><mc:Choice>{text_box}</mc:Choice>"
+            f"<mc:Fallback>{text_box}</mc:Fallback></mc:AlternateContent></w:r>"
+            "<w:r><w:tab/><w:t>after</w:t></w:r></w:p></w:body></w:document>"
+        )
+        raw = io.BytesIO()
+        with zipfile.ZipFile(raw, "w") as archive:
+            archive.writestr("word/document.xml", body)
+
+        assert extractors.extract_docx(raw.getvalue()) == "Certified Kubernetes\nBefore\tafter"
+
+    def test_text_encoding_is_detected_once(self):
+        """BOMs, UTF-16 without a BOM, UTF-8, cp1252 and latin-1 are told apart"""
+        resume = "Jos\u00e9 \u2013 \u201cSenior\u201d Engineer\r\nPython"
+        cases = [
+            (codecs.BOM_UTF8 + resume.encode("utf-8"), "utf-8-sig"),
+            (resume.encode("utf-16"), "utf-16"),
+            (resume.encode("utf-16-le"), "utf-16-le"),
+            (resume.encode("utf-8"), "utf-8"),
+            (resume.encode("cp1252"), "cp1252"),
+            ("Jos\u00e9 Garc\u00eda".encode("latin-1"), "latin-1"),
+        ]
+        for data, encoding in cases:
+            result = resolve_extractor(data, "resume.txt").run(data, UNLIMITED)
+            assert result.encoding == encoding
+            assert result.text.startswith("Jos\u00e9")
+            assert "\r" not in result.text
+
+        # A multi-byte character split by the sample boundary is still UTF-8
+        data = b"a" * (extractors.ENCODING_SAMPLE_BYTES - 1) + "\u00e9".encode("utf-8")
+        assert extractors.detect_encoding(data) == "utf-8"
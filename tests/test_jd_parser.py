@@ -0,0 +1,96 @@
+# tests/test_jd_parser.py
+"""
+Test cases for the job description parser
+"""
+
+import json
+
+import pytest
+
+from ats_resume_scorer.parsers.jd_parser import JobDescription, JobDescriptionParser
+from ats_resume_scorer.parsers.sections import segment_job_description
+
+JD_TEXT = """Backend Engineer
+About Us
+We build payment infrastructure.
+
+What you’ll do
+- Design APIs
+- Review code
+
+Requirements: 5+ years of experience with Python
+- Knowledge of PostgreSQL
+
+Nice to have:
+- Kubernetes
+
+BENEFITS
+- Remote work
+"""
+
+
+class TestJobDescriptionParser:
+
+    def setup_method(self):
+        """Setup test fixtures"""
+        self.parser = JobDescriptionParser()
+
+    def test_segmenter_types_sections_in_one_pass(self):
+        """Headings, inline headings and unknown headings split the text"""
+        sections = segment_job_description(JD_TEXT)
+
+        assert [s.name for s in sections] == [
+            "about", "responsibilities", "requirements", "preferred", "benefits",
+        ]
+        assert sections.text(JD_TEXT, "requirements", body=True).startswith(
+            "5+ years of experience with Python\n"
+        )
+        assert sections.text(JD_TEXT, "preferred", body=True) == "- Kubernetes\n\n"
+
+    def test_extractors_read_their_sections(self):
+        """Skills, responsibilities and years come from the typed sections"""
+        jd = self.parser.parse_job_description(JD_TEXT)
+
+        assert jd.responsibilities == ["Design APIs", "Review code"]
+        assert "postgresql" in jd.required_skills and "python" in jd.required_skills
+        assert jd.preferred_skills == ["kubernetes"]
+        assert jd.experience_requirements == "5+ years of experience"
+        assert jd.required_years == 5
+        assert list(jd.sections) == [
+            "about", "responsibilities", "requirements", "preferred", "benefits",
+        ]
+
+    def test_required_years_follow_the_requirement_wording(self):
+        """Years are parsed once, or derived for hand-built descriptions"""
+        jd = self.parser.parse_job_description("Engineer\nAt least 3 years with Go")
+        assert jd.experience_requirements == "At least 3 years"
+        assert jd.required_years == 3
+
+        jd = self.parser.parse_job_description("Engineer\nNo experience needed")
+        assert jd.required_years == 0
+
+        built = JobDescription(
+            title="Engineer", required_skills=[], preferred_skills=[],
+            education_requirements=[], experience_requirements="minimum of 4 years",
+            responsibilities=[], raw_text="",
+        )
+        assert built.required_years == 4
+
+    def test_skill_indicators_are_configurable_and_reloadable(self, tmp_path):
+        """One compiled scan covers every indicator, including overlapping ones"""
+        section = "Experience with knowledge of Rust; Exposure to Go"
+        assert sorted(self.parser._extract_skills_from_section(section)) == [
+            "Rust", "knowledge of Rust",
+        ]
+
+        path = tmp_path / "indicators.json"
+        path.write_text(json.dumps(["exposure to"]))
+        assert self.parser.load_skill_indicators(path) == ("exposure to",)
+        assert self.parser._extract_skills_from_section(section) == []  # "Go" is too short
+
+        custom = JobDescriptionParser(skill_indicators=["at home with"])
+        assert custom._extract_skills_from_section("At home with Terraform") == ["Terraform"]
+
+        path.write_text(json.dumps({"indicators": []}))
+        with pytest.raises(ValueError):
+            self.parser.load_skill_indicators(path)
@@ -0,0 +1,173 @@
+# tests/test_job_index.py
+"""
+Test cases for bulk job description ingestion
+"""
+
+import csv
+import json
+import os
+import time
+
+from ats_resume_scorer.parsers.jd_parser import JobDescriptionParser
+from ats_resume_scorer.utils.job_index import JobIndex, read_postings
+
+POSTING = """Senior Data Engineer
+Company: Northwind Analytics
+
+Requirements
+- 5+ years of experience with Python and SQL
+- Knowledge of Airflow and Spark
+"""
+
+
+def backdate(*paths):
+    """Age files past the window in which an unchanged mtime isn't trusted"""
+    old = time.time() - 60
+    for path in paths:
+        os.utime(path, (old, old))
+
+
+class TestJobIndex:
+
+    def setup_method(self):
+        """Setup test fixtures"""
+        self.parser = JobDescriptionParser()
+
+    def write_corpus(self, corpus):
+        corpus.mkdir()
+        (corpus / "senior.txt").write_text(POSTING)
+        (corpus / "nested").mkdir()
+        (corpus / "nested" / "copy.txt").write_text(POSTING + "\n\n")
+        with open(corpus / "feed.jsonl", "w") as f:
+            f.write(json.dumps({"id": 7, "title": "Data Analyst", "description": "SQL required"}) + "\n")
+            f.write(json.dumps({"title": "No description"}) + "\n")
+        with open(corpus / "board.csv", "w", newline="") as f:
+            writer = csv.DictWriter(f, ["id", "title", "description"])
+            writer.writeheader()
+            writer.writerow({"id": "", "title": "Data Analyst", "description": "SQL required"})
+        return corpus
+
+    def test_ingest_dedupes_postings_by_content(self, tmp_path):
+        """Identical postings share one compiled job; every ID resolves to it"""
+        corpus = self.write_corpus(tmp_path / "corpus")
+        index = JobIndex(tmp_path / "index")
+
+        stats = index.ingest(corpus, max_workers=1)
+
+        assert sorted(index.posting_ids()) == [
+            "7", "board.csv:2", "nested/copy.txt", "senior.txt"
+        ]
+        assert (stats.postings, stats.unique, stats.compiled) == (4, 2, 2)
+        assert index.content_hash("senior.txt") == index.content_hash("nested/copy.txt")
+        assert index.get("senior.txt").job_description == self.parser.parse_job_description(
+            POSTING.strip()
+        )
+        assert index.get("7").job_description.raw_text == "Data Analyst\nSQL required"
+
+    def test_reingest_only_reads_changed_files(self, tmp_path):
+        """An unchanged corpus is only stat'ed; an edit recompiles one posting"""
+        corpus = self.write_corpus(tmp_path / "corpus")
+        backdate(*(path for path in corpus.rglob("*") if path.is_file()))
+        JobIndex(tmp_path / "index").ingest(corpus, max_workers=1)
+
+        unchanged = JobIndex(tmp_path / "index").ingest(corpus, max_workers=1)
+        assert (unchanged.files_read, unchanged.compiled, unchanged.reused) == (0, 0, 2)
+
+        (corpus / "feed.jsonl").write_text(
+            json.dumps({"id": 7, "description": "Go and Kubernetes"}) + "\n"
+        )
+        edited = JobIndex(tmp_path / "index").ingest(corpus, max_workers=1)
+        assert (edited.files_read, edited.compiled, edited.removed) == (1, 1, 0)
+
+        (corpus / "board.csv").unlink()
+        removed = JobIndex(tmp_path / "index").ingest(corpus, max_workers=1)
+        assert removed.removed == 1 and "board.csv:2" not in JobIndex(tmp_path / "index")
+
+    def test_settings_change_recompiles_everything(self, tmp_path):
+        """Jobs compiled for another TF-IDF mode are rebuilt, not reused"""
+        corpus = self.write_corpus(tmp_path / "corpus")
+        backdate(*(path for path in corpus.rglob("*") if path.is_file()))
+        JobIndex(tmp_path / "index").ingest(corpus, max_workers=1)
+
+        stats = JobIndex(tmp_path / "index").ingest(
+            corpus, {"tfidf_mode": "jd"}, max_workers=1
+        )
+
+        assert stats.compiled == stats.unique == 2
+        assert JobIndex(tmp_path / "index").get("senior.txt").tfidf is not None
+
+    def test_read_postings_uses_configured_fields(self, tmp_path):
+        """JSONL records name their text, title and ID fields"""
+        path = tmp_path / "feed.jsonl"
+        path.write_text(json.dumps({"ref": "a1", "body": "Python developer"}) + "\n")
+
+        postings = list(read_postings(path, text_field="body", id_field="ref"))
+
+        assert [(p.posting_id, p.text) for p in postings] == [("a1", "Python developer")]
+
+    def test_failed_postings_are_reported_not_fatal(self, tmp_path, monkeypatch):
+        """A malformed record or a posting that fails to compile doesn't stop the ingest"""
+        from ats_resume_scorer.utils.job_index import JobCompiler
+
+        compile_job = JobCompiler.compile
+
+        def compile_or_fail(compiler, text):
+            if "COBOL" in text:
+                raise ValueError("parser exploded")
+            return compile_job(compiler, text)
+
+        monkeypatch.setattr(JobCompiler, "compile", compile_or_fail)
+        corpus = tmp_path / "feed.jsonl"
+        corpus.write_text(
+            json.dumps({"id": "ok", "description": POSTING}) + "\n"
+            + "{not json\n"
+            + json.dumps({"id": "bad", "description": "COBOL developer"}) + "\n"
+        )
+
+        stats = JobIndex(tmp_path / "index").ingest(corpus, max_workers=1)
+
+        assert (stats.postings, stats.compiled) == (2, 1)
+        assert set(stats.failures) == {"feed.jsonl:2", "bad"}
+        assert "parser exploded" in stats.failures["bad"]
+        index = JobIndex(tmp_path / "index")
+        assert index.posting_ids() == ["ok"]
+
+        monkeypatch.setattr(JobCompiler, "compile", compile_job)
+        retried = JobIndex(tmp_path / "index").ingest(corpus, max_workers=1)
+        assert (retried.compiled, retried.reused) == (1, 1)
+        assert set(retried.failures) == {"feed.jsonl:2"}
+        assert sorted(JobIndex(tmp_path / "index").posting_ids()) == ["bad", "ok"]
+
+    def test_reader_options_change_rereads_corpus(self, tmp_path):
+        """Recorded files are only reused for the fields they were read with"""
+        corpus = tmp_path / "feed.jsonl"
+        corpus.write_text(
+            json.dumps({"id": 1, "ref": "a1", "description": "SQL", "body": "Python"}) + "\n"
+        )
+        backdate(corpus)
+        JobIndex(tmp_path / "index").ingest(corpus, max_workers=1)
+
+        stats = JobIndex(tmp_path / "index").ingest(
+            corpus, max_workers=1, text_field="body", id_field="ref"
+        )
+
+        assert stats.files_read == 1
+        index = JobIndex(tmp_path / "index")
+        assert index.posting_ids() == ["a1"]
+        assert index.get("a1").job_description.raw_text == "Python"
+
+    def test_conflicting_posting_ids_are_reported(self, tmp_path):
+        """An ID shared by postings with different content isn't resolved to either"""
+        corpus = tmp_path / "feed.jsonl"
+        corpus.write_text(
+            json.dumps({"id": "a", "description": "Python developer"}) + "\n"
+            + json.dumps({"id": "a", "description": "Go developer"}) + "\n"
+            + json.dumps({"id": "b", "description": "SQL analyst"}) + "\n"
+            + json.dumps({"id": "b", "description": "SQL analyst"}) + "\n"
+        )
+
+        stats = JobIndex(tmp_path / "index").ingest(corpus, max_workers=1)
+
+        assert (stats.postings, stats.unique) == (4, 3)
+        assert set(stats.failures) == {"a"}
+        assert JobIndex(tmp_path / "index").posting_ids() == ["b"]
@@ -3,12 +3,13 @@
 Test cases for main ATS Resume Scorer functionality
 """
 
+import asyncio
 import pytest
 import tempfile
 import os
 from pathlib import Path
 
-from ats_resume_scorer.main import ATSResumeScorer
+from ats_resume_scorer.main import ATSResumeScorer, AsyncATSResumeScorer
 from ats_resume_scorer.scoring.scoring_engine import ScoringWeights
 
 
@@ -210,7 +211,8 @@ class TestATSResumeScorer:
     def test_error_handling_unsupported_format(self):
         """Test error handling for unsupported file formats"""
         with tempfile.NamedTemporaryFile(suffix=".xyz", delete=False) as temp_file:
-            temp_file.write(b"some content")
+            # Binary content; text under an unknown name is parsed as text
+            temp_file.write(b"\x89PNG\r\n\x1a\n\x00\x00\x00\rIHDR")
             temp_path = temp_file.name
 
         try:
@@ -311,3 +313,131 @@ class TestATSResumeScorer:
         finally:
             if os.path.exists(resume_path):
                 os.unlink(resume_path)
+
+    def test_initialization_does_not_load_nlp_model(self):
+        """Constructing scorers must not load spaCy until NLP is needed"""
+        from ats_resume_scorer.parsers import nlp
+
+        nlp.clear_nlp_cache()
+        ATSResumeScorer()
+        ATSResumeScorer()
+
+        assert not nlp.is_nlp_loaded()
+
+        # Both parsers share the same lazily loaded model
+        assert self.scorer.resume_parser.nlp is self.scorer.jd_parser.nlp
+        assert nlp.is_nlp_loaded()
+
+    def test_batch_parses_job_description_once(
+        self, temp_resume_file, sample_job_description
+    ):
+        """Batch scoring reuses one parsed job description"""
+        calls = []
+        parse = self.scorer.jd_parser.parse_job_description
+
+        def counting_parse(text):
+            calls.append(text)
+            return parse(text)
+
+        self.scorer.jd_parser.parse_job_description = counting_parse
+
+        results = self.scorer.batch_score_resumes(
+            [temp_resume_file] * 3, sample_job_description
+        )
+        self.scorer.score_resume(temp_resume_file, sample_job_description)
+
+        assert all(r["success"] for r in results)
+        assert len(calls) == 1
+        assert self.scorer.jd_cache.stats()["hits"] >= 1
+
+    def test_process_executor_matches_thread_executor(
+        self, temp_resume_file, sample_job_description
+    ):
+        """Process-pool batch scoring returns the same scores as the thread pool"""
+        paths = [temp_resume_file, temp_resume_file, "missing_resume.pdf"]
+
+        threaded = self.scorer.batch_score_resumes(paths, sample_job_description)
+        processed = self.scorer.batch_score_resumes(
+            paths, sample_job_description, max_workers=2, executor="process"
+        )
+
+        assert [r["success"] for r in processed] == [True, True, False]
+        assert [r["result"]["overall_score"] for r in processed[:2]] == [
+            r["result"]["overall_score"] for r in threaded[:2]
+        ]
+
+        # Workers send compact results; the caller expands the ones it needs
+        assert processed[0]["result"]["compact"]
+        assert set(processed[0]["result"]) == {
+            "overall_score", "grade", "detailed_breakdown", "compact"
+        }
+        assert processed[0]["result"]["grade"] == threaded[0]["result"]["grade"]
+        expanded = self.scorer.expand_result(processed[0], sample_job_description)
+        assert expanded["result"]["recommendations"] == threaded[0]["result"]["recommendations"]
+        assert self.scorer.expand_result(processed[2], sample_job_description) is processed[2]
+        with pytest.raises(ValueError):
+            self.scorer.batch_score_resumes(paths, sample_job_description, executor="fiber")
+
+    def test_iter_score_resumes_bounds_in_flight_work(
+        self, temp_resume_file, sample_job_description
+    ):
+        """Paths are pulled lazily, only as results are consumed"""
+        pulled = []
+
+        def paths():
+            for _ in range(6):
+                pulled.append(temp_resume_file)
+                yield temp_resume_file
+
+        results = self.scorer.iter_score_resumes(
+            paths(), sample_job_description, max_workers=1, max_in_flight=2
+        )
+        first = next(results)
+
+        assert first["success"]
+        assert len(pulled) <= 3
+        assert len(list(results)) == 5
+
+    def test_top_k_score_resumes(self, temp_resume_file, sample_job_description):
+        """Only the best K successful results are returned, best first"""
+        paths = [temp_resume_file] * 4 + ["missing_resume.pdf"]
+
+        top = self.scorer.top_k_score_resumes(paths, sample_job_description, k=2)
+
+        assert len(top) == 2
+        assert all(r["success"] for r in top)
+        assert top[0]["result"]["overall_score"] >= top[1]["result"]["overall_score"]
+
+    def test_async_scoring_keeps_event_loop_free(
+        self, temp_resume_file, sample_job_description
+    ):
+        """Async scoring matches sync scoring while other coroutines keep running"""
+        expected = self.scorer.score_resume(temp_resume_file, sample_job_description)
+
+        async def run():
+            ticks = 0
+            scoring_done = False
+
+            async def ticker():
+                nonlocal ticks
+                while not scoring_done:
+                    ticks += 1
+                    await asyncio.sleep(0)
+
+            ticker_task = asyncio.ensure_future(ticker())
+            async with AsyncATSResumeScorer(self.scorer, max_workers=2) as scorer:
+                result = await scorer.ascore_resume(
+                    temp_resume_file, sample_job_description
+                )
+                batch = await scorer.abatch_score_resumes(
+                    [temp_resume_file, "missing_resume.pdf"], sample_job_description
+                )
+            scoring_done = True
+            await ticker_task
+            return result, batch, ticks
+
+        result, batch, ticks = asyncio.run(run())
+
+        assert result["overall_score"] == expected["overall_score"]
+        assert [r["success"] for r in batch] == [True, False]
+        assert ticks > 1
@@ -0,0 +1,56 @@
+# tests/test_matching.py
+"""
+Test cases for the hardened resume matching helpers
+"""
+
+import random
+import re
+import time
+
+from ats_resume_scorer.parsers import matching, patterns
+from ats_resume_scorer.parsers.resume_parser import ResumeParser
+
+# The backtracking patterns the helpers replace
+LEGACY_JOB_ENTRY = re.compile(
+    r"([^\n]+)\s*\|\s*([^\n]+)\s*\|\s*([^\n]+)(?:\n(.*?))?(?=\n[A-Z]|\n\s*\n|$)",
+    re.DOTALL,
+)
+LEGACY_COMMA_ITEM = re.compile(r"([^,\n]+)(?:,|$)")
+
+LINES = [
+    "Engineer | Acme | 2019-2021", "A | B | C | D", "Title || 2019", "- built x",
+    "Next line", "lower line", "", "  ", "x,y", "a, b,", "me@example.com, q@x.io",
+]
+
+
+class TestMatching:
+
+    def test_helpers_match_legacy_patterns(self):
+        """Line scans find what the legacy patterns found on one-line headers"""
+        rng = random.Random(0)
+        for _ in range(2000):
+            text = "\n".join(rng.choice(LINES) for _ in range(rng.randint(0, 8)))
+            text += "\n" if rng.random() < 0.3 else ""
+
+            legacy_jobs = [tuple(g.strip() for g in job) for job in LEGACY_JOB_ENTRY.findall(text)]
+            jobs = [tuple(g.strip() for g in job) for job in matching.job_entries(text)]
+            assert jobs == legacy_jobs, text
+            assert matching.comma_items(text) == LEGACY_COMMA_ITEM.findall(text), text
+            assert matching.find_emails(text) == patterns.EMAIL.findall(text), text
+
+    def test_hostile_text_parses_quickly(self):
+        """Inputs that made the legacy patterns backtrack stay linear"""
+        parser = ResumeParser(match_budget=None)
+        for text in ["a" * 20000 + "\nb", "a." * 10000, "Experience\n" + "a | b " * 4000]:
+            start = time.perf_counter()
+            parser.parse_text(text)
+            assert time.perf_counter() - start < 2.0
+
+    def test_spent_budget_marks_resume_truncated(self):
+        """Matching stops once the budget is spent"""
+        text = "Experience\nEngineer | Acme | 2019\n- Built APIs\n"
+        assert matching.job_entries(text, matching.MatchBudget(0)) == []
+
+        resume = ResumeParser(match_budget=0).parse_text(text)
+        assert resume.truncated
+        assert not ResumeParser().parse_text(text).truncated
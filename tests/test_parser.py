@@ -6,7 +6,7 @@ Test cases for resume parser module
 import pytest
 import tempfile
 import os
-from ats_resume_scorer.main import ResumeParser, ContactInfo
+from ats_resume_scorer.parsers.resume_parser import ResumeParser, ContactInfo
 
 
 class TestResumeParser:
@@ -87,6 +87,75 @@ class TestResumeParser:
         skills = self.parser.extract_skills("")
         assert len(skills) == 0
 
+    def test_segmenter_finds_headings_in_one_pass(self):
+        """Standalone, decorated and inline headings; prose mentions are ignored"""
+        from ats_resume_scorer.parsers.sections import segment_text
+
+        text = (
+            "Jane Roe\n## Skills & Technologies\n- Go\n"
+            "Experience with Python\nWORK EXPERIENCE\nAcme\n"
+            "Education: BSc Physics"
+        )
+        sections = segment_text(text)
+
+        assert [s.name for s in sections] == ["skills", "experience", "education"]
+        assert sections.text(text, "skills", body=True) == "- Go\nExperience with Python\n"
+        assert sections.text(text, "experience", body=True) == "Acme\n"
+        assert sections.text(text, "education", body=True) == " BSc Physics"
+
+    def test_section_map_replaces_heading_search(self):
+        """Extractors read mapped sections by offset instead of searching"""
+        from ats_resume_scorer.parsers.sections import SectionMap
+
+        text = (
+            "Jane Roe\nSkills\n- Terraform\nLearning\n"
+            "Bachelor of Science, State University 2018\n"
+        )
+        education_start = text.index("Learning")
+        sections = SectionMap.from_headings(
+            [
+                ("skills", text.index("Skills"), text.index("- Terraform")),
+                ("education", education_start, text.index("Bachelor")),
+            ],
+            len(text),
+        )
+
+        resume = self.parser.parse_text(text, sections=sections)
+
+        assert "terraform" in resume.skills
+        assert resume.education[0].degree.startswith("Bachelor of Science")
+        assert resume.sections["education"] == (education_start, len(text))
+        assert resume.summary is None
+
+    def test_parse_resume_bytes_matches_file_parsing(self):
+        """In-memory parsing gives the same result as parsing the file"""
+        import fitz
+
+        sample_content = "John Doe\r\njohn@example.com\r\nSkills: Python, SQL"
+        pdf = fitz.open()
+        pdf.new_page().insert_text((72, 72), "Jane Roe jane@example.com Python")
+        pdf_bytes = pdf.tobytes()
+
+        with tempfile.NamedTemporaryFile(mode="wb", suffix=".txt", delete=False) as f:
+            f.write(sample_content.encode("utf-8"))
+            temp_file = f.name
+
+        try:
+            from_file = self.parser.parse_resume(temp_file)
+        finally:
+            os.unlink(temp_file)
+
+        from_bytes = self.parser.parse_resume_bytes(
+            sample_content.encode("utf-8"), "text/plain; charset=utf-8"
+        )
+        from_pdf = self.parser.parse_resume_bytes(memoryview(pdf_bytes), "cv.PDF")
+
+        assert from_bytes == from_file
+        assert "\r" not in from_bytes.raw_text
+        assert "jane@example.com" in from_pdf.contact_info.emails
+        with pytest.raises(ValueError, match="Unsupported file format"):
+            self.parser.parse_resume_bytes(b"\x89PNG\r\n\x1a\n\x00\x00\x00\rIHDR", "image/png")
+
 
 # config/default_weights.json
 {
@@ -4,15 +4,14 @@ Test cases for scoring engine module
 """
 
 import pytest
-from ats_resume_scorer.main import (
-    ATSScoringEngine,
-    ScoringWeights,
+from ats_resume_scorer.scoring.scoring_engine import ATSScoringEngine, ScoringWeights
+from ats_resume_scorer.parsers.resume_parser import (
     ResumeData,
-    JobDescription,
     ContactInfo,
     Experience,
     Education,
 )
+from ats_resume_scorer.parsers.jd_parser import JobDescription
 
 
 class TestATSScoringEngine:
@@ -70,6 +69,22 @@ class TestATSScoringEngine:
         assert score >= 70  # At least 70% match
         assert score <= 100
 
+    def test_keyword_match_uses_canonical_skills(self):
+        """JD bullet fragments match the resume skills they name"""
+        self.sample_jd.required_skills = [
+            "5+ years of python",
+            "strong sql skills",
+            "amazon web services",
+        ]
+        self.sample_jd.preferred_skills = []
+        scorer = ATSScoringEngine(tfidf_mode="jd")
+
+        score = scorer.calculate_keyword_match_score(self.sample_resume, self.sample_jd)
+        batch = scorer.keyword_match_scores([self.sample_resume], self.sample_jd)
+
+        assert score >= 70
+        assert batch[0] == pytest.approx(score)
+
     def test_title_match_scoring(self):
         """Test title matching score calculation"""
         score = self.scorer.calculate_title_match_score(
@@ -138,3 +153,112 @@ class TestATSScoringEngine:
         )
 
         assert result["weights_used"]["keyword_match"] == 0.50
+
+    def test_action_verb_pattern_matches_per_verb_count(self):
+        """Single alternation pattern counts the same hits as one pattern per verb"""
+        import re
+
+        text = "led and developed; re-led, misled, Developed. improved improvement"
+        text = text.lower()
+        expected = sum(
+            len(re.findall(rf"\b{verb}\b", text)) for verb in self.scorer.action_verbs
+        )
+
+        assert len(self.scorer.action_verbs_pattern.findall(text)) == expected
+
+    def test_word_alternation_is_independent_of_input_order(self):
+        """Alternatives are sorted longest first, then alphabetically"""
+        from ats_resume_scorer.parsers.patterns import compile_word_alternation
+
+        words = ["led", "managed", "built", "mentored", "led"]
+        forward = compile_word_alternation(words)
+        backward = compile_word_alternation(reversed(words))
+
+        assert forward.pattern == backward.pattern == r"\b(?:mentored|managed|built|led)\b"
+        assert forward.findall("led, then led and built") == ["led", "led", "built"]
+
+    def test_jd_tfidf_mode_reuses_fitted_vectorizer(self):
+        """JD mode fits once per job description and transforms each resume"""
+        scorer = ATSScoringEngine(tfidf_mode="jd")
+        first = scorer.calculate_keyword_match_score(self.sample_resume, self.sample_jd)
+        second = scorer.calculate_keyword_match_score(self.sample_resume, self.sample_jd)
+
+        assert first == second
+        assert scorer.jd_vectors.stats()["hits"] == 1
+        assert scorer.jd_vectors.stats()["misses"] == 1
+
+    def test_corpus_vectorizer_round_trip(self, tmp_path):
+        """A saved corpus vectorizer reproduces the same similarity when loaded"""
+        scorer = ATSScoringEngine(tfidf_mode="corpus")
+        scorer.fit_corpus([self.sample_resume.raw_text, self.sample_jd.raw_text])
+        path = tmp_path / "tfidf.joblib"
+        scorer.save_vectorizer(path)
+
+        loaded = ATSScoringEngine(tfidf_mode="corpus", vectorizer_path=path)
+        expected = scorer.calculate_text_similarity(
+            self.sample_resume.raw_text, self.sample_jd.raw_text
+        )
+
+        assert expected > 0
+        assert loaded.calculate_text_similarity(
+            self.sample_resume.raw_text, self.sample_jd.raw_text
+        ) == pytest.approx(expected)
+
+    def test_invalid_tfidf_mode(self):
+        """Unknown TF-IDF modes are rejected"""
+        with pytest.raises(ValueError):
+            ATSScoringEngine(tfidf_mode="bogus")
+
+    def test_score_batch_matches_per_resume_scoring(self):
+        """Vectorized batch scores equal scoring each resume on its own"""
+        from dataclasses import replace
+
+        resumes = [
+            self.sample_resume,
+            replace(self.sample_resume, skills=["docker", "go"]),
+            replace(self.sample_resume, skills=[], raw_text="Unrelated text."),
+        ]
+        jd = replace(
+            self.sample_jd, raw_text="Python engineer: develop and lead AWS SQL projects"
+        )
+        scorer = ATSScoringEngine(tfidf_mode="jd")
+
+        batch = scorer.score_batch(resumes, jd)
+
+        assert batch == [scorer.calculate_overall_score(r, jd) for r in resumes]
+        assert scorer.score_batch([], jd) == []
+
+    def test_parsed_job_round_trip_scores_identically(self):
+        """A compiled, serialized and reloaded job scores like the original"""
+        from dataclasses import replace
+        from ats_resume_scorer.scoring.parsed_job import ParsedJob
+
+        jd = replace(
+            self.sample_jd, raw_text="Python engineer: develop and lead AWS SQL projects"
+        )
+        for mode in ("pair", "jd"):
+            scorer = ATSScoringEngine(tfidf_mode=mode)
+            loaded = ParsedJob.loads(scorer.compile_job(jd).dumps())
+
+            assert loaded.job_description == jd
+            assert scorer.calculate_overall_score(
+                self.sample_resume, loaded
+            ) == scorer.calculate_overall_score(self.sample_resume, jd)
+
+        # The batch path rebuilds the stored vector as one sparse product
+        resumes = [self.sample_resume, replace(self.sample_resume, raw_text="Unrelated text.")]
+        assert loaded.tfidf is not None
+        assert scorer.score_batch(resumes, loaded) == [
+            scorer.calculate_overall_score(r, loaded) for r in resumes
+        ]
+
+    def test_parsed_job_rejects_stale_or_unknown_payloads(self):
+        """Jobs from another parser version or format must be recompiled"""
+        from ats_resume_scorer.scoring.parsed_job import ParsedJob
+
+        data = self.scorer.compile_job(self.sample_jd).to_dict()
+        with pytest.raises(ValueError):
+            ParsedJob.from_dict(dict(data, parser_version="0"))
+        assert ParsedJob.from_dict(dict(data, parser_version="0"), allow_stale=True).stale
+        with pytest.raises(ValueError):
+            ParsedJob.from_dict(dict(data, format=999))
@@ -0,0 +1,81 @@
+# tests/test_skill_index.py
+"""
+Test cases for the canonical skill index
+"""
+
+from ats_resume_scorer.parsers.skill_index import SkillIndex
+
+
+class TestSkillIndex:
+
+    def setup_method(self):
+        """Setup test fixtures"""
+        self.index = SkillIndex(
+            {
+                "programming_languages": ["python", "go", "r"],
+                "databases": ["sql", "sql server", "postgresql"],
+                "devops_tools": ["kubernetes", "docker"],
+                "networking": ["rest", "tcp/ip"],
+                "data_science": ["scikit-learn", "neural networks"],
+            }
+        )
+
+    def names(self, phrase):
+        return [self.index.name(skill_id) for skill_id in self.index.phrase_ids(phrase)]
+
+    def test_bullet_fragments_map_to_database_skills(self):
+        """Skills are found inside JD phrasing, via aliases, stems and joined forms"""
+        assert self.names("5+ years building REST APIs") == ["rest"]
+        assert self.names("Kubernetes/K8s and Docker containers") == ["kubernetes", "docker"]
+        assert self.names("Postgres") == ["postgresql"]
+        assert self.names("Golang") == ["go"]
+        assert self.names("neural network") == ["neural networks"]
+        assert self.names("sklearn or scikitlearn") == ["scikit-learn"]
+        assert self.names("TCP/IP") == ["tcp/ip"]
+
+    def test_longest_key_wins(self):
+        """Multi-word skills aren't split into shorter ones"""
+        assert self.names("Microsoft SQL Server") == ["sql server"]
+
+    def test_short_words_only_match_whole_phrases(self):
+        """A lone "R" is a skill; the R in "R&D" isn't"""
+        assert self.names("R") == ["r"]
+        assert self.names("Experience with R&D") == [None]
+
+    def test_unknown_phrases_get_stable_fallback_ids(self):
+        """Phrases naming no database skill still match themselves"""
+        ids = self.index.phrase_ids("Strong written English")
+        assert len(ids) == 1 and ids[0] < 0
+        assert self.index.phrase_ids("strong  written english") == ids
+        assert SkillIndex({}).phrase_ids("Strong written English") == ids
+
+    def test_matching_is_integer_set_intersection(self):
+        """JD fragments and resume skills meet on canonical IDs"""
+        jd = self.index.ids(["3+ years of Python", "Postgres", "K8s"])
+        resume = self.index.ids(["python", "postgresql", "kubernetes", "docker"])
+        assert jd <= resume
+
+    def test_compact_records_share_the_id_space(self):
+        """Compact skill IDs resolve to the same canonical IDs as the skill names"""
+        from ats_resume_scorer.parsers.compact import SkillVocabulary
+
+        vocabulary = SkillVocabulary(self.index.vocabulary.names(range(len(self.index))))
+        skills = ["python", "K8s", "Postgres", "basket weaving"]
+        stored = vocabulary.ids(skills)
+
+        assert stored[0] == self.index.vocabulary.intern("python")
+        assert self.index.vocabulary_ids(vocabulary, stored) == self.index.ids(skills)
+
+    def test_default_index_uses_the_shipped_database(self, caplog):
+        """The skills database ships as package data, so installs don't fall back"""
+        import json
+        import pkgutil
+
+        from ats_resume_scorer.parsers.skill_index import default_skill_index
+
+        shipped = json.loads(
+            pkgutil.get_data("ats_resume_scorer", "config/skills_database.json")
+        )
+
+        assert default_skill_index().fingerprint == SkillIndex(shipped).fingerprint
+        assert "not found" not in caplog.text
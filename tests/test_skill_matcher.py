@@ -0,0 +1,54 @@
+# tests/test_skill_matcher.py
+"""
+Test cases for the compiled skill matcher
+"""
+
+import pytest
+from ats_resume_scorer.parsers.skill_matcher import SkillMatcher
+
+
+class TestSkillMatcher:
+
+    def setup_method(self):
+        """Setup test fixtures"""
+        self.matcher = SkillMatcher(
+            {
+                "programming_languages": ["python", "go", "r", "c++", "java"],
+                "databases": ["sql", "sql server"],
+            }
+        )
+
+    def test_word_boundaries(self):
+        """Short skills should not match inside other words"""
+        skills = self.matcher.find_skills("Worked on Google Docker images with R")
+
+        assert "go" not in skills
+        assert "r" in skills
+
+    def test_match_offsets(self):
+        """Matches report offsets into the original text"""
+        text = "Python and SQL Server"
+        matches = self.matcher.find_all(text)
+
+        found = {(m.skill, text[m.start : m.end].lower()) for m in matches}
+        assert ("python", "python") in found
+        assert ("sql server", "sql server") in found
+        assert ("sql", "sql") in found
+        assert all(m.category for m in matches)
+
+    def test_punctuated_skills(self):
+        """Skills ending in punctuation still match"""
+        skills = self.matcher.find_skills("Expert in C++17 and Java; not javascript")
+
+        assert "c++" in skills
+        assert "java" in skills
+        assert len(self.matcher.find_all("javascript")) == 0
+
+    def test_offsets_survive_length_changing_lowercase(self):
+        """Offsets point into the original text when lowercasing adds characters"""
+        text = "İzmir office: Python and SQL Server"
+        matches = self.matcher.find_all(text)
+
+        found = {(m.skill, text[m.start : m.end]) for m in matches}
+        assert ("python", "Python") in found
+        assert ("sql server", "SQL Server") in found